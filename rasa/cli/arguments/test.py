@@ -80,6 +80,7 @@ def add_test_core_argument_group(
         "All models in the provided directory are evaluated "
         "and compared against each other.",
     )
+    add_jobs_param(parser)
     add_no_plot_param(parser)
 
 
@@ -145,6 +146,7 @@ def add_test_nlu_argument_group(
         default=5,
         help="Number of cross validation folds (cross validation only).",
     )
+    add_jobs_param(parser)
     comparison_arguments = parser.add_argument_group("Comparison Mode")
     comparison_arguments.add_argument(
         "-r",
@@ -192,3 +194,18 @@ def add_no_plot_param(
         help=f"Don't render evaluation plots",
         required=required,
     )
+
+
+def add_jobs_param(
+    parser: Union[argparse.ArgumentParser, argparse._ActionsContainer]
+) -> None:
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        required=False,
+        default=1,
+        type=int,
+        help="Number of parallel processes used for the evaluation. Test "
+        "stories, cross validation folds and compared NLU models are "
+        "distributed across the processes.",
+    )
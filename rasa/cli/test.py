@@ -78,7 +78,7 @@ def test_core(args: argparse.Namespace) -> None:
         )
 
         if args.evaluate_model_directory:
-            test_core_models_in_directory(args.model, stories, output)
+            test_core_models_in_directory(args.model, stories, output, args.jobs)
         else:
             test_core(
                 model=model_path,
@@ -89,7 +89,7 @@ def test_core(args: argparse.Namespace) -> None:
             )
 
     else:
-        test_core_models(args.model, stories, output)
+        test_core_models(args.model, stories, output, args.jobs)
 
 
 def test_nlu(args: argparse.Namespace) -> None:
@@ -134,6 +134,7 @@ def test_nlu(args: argparse.Namespace) -> None:
             output=output,
             runs=args.runs,
             exclusion_percentages=args.percentages,
+            jobs=args.jobs,
         )
     elif args.cross_validation:
         logger.info("Test model using cross validation.")
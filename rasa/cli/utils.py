@@ -123,7 +123,7 @@ def create_output_path(
     """
     import time
 
-    if output_path.endswith("tar.gz"):
+    if output_path.endswith("tar.gz") or output_path.endswith(".tar"):
         return output_path
     else:
         if fixed_name:
@@ -47,5 +47,8 @@ DEFAULT_SANIC_WORKERS = 1
 ENV_SANIC_WORKERS = "SANIC_WORKERS"
 ENV_SANIC_BACKLOG = "SANIC_BACKLOG"
 
+ENV_LAZY_LOAD_NLU_MODEL = "RASA_LAZY_LOAD_NLU_MODEL"
+ENV_MODEL_CACHE_DIRECTORY = "RASA_MODEL_CACHE_DIRECTORY"
+
 DEFAULT_SESSION_EXPIRATION_TIME_IN_MINUTES = 60
 DEFAULT_CARRY_OVER_SLOTS_TO_NEW_SESSION = True
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import warnings
 import os
@@ -5,6 +6,7 @@ import shutil
 import tempfile
 import uuid
 from asyncio import CancelledError
+from functools import partial
 from typing import Any, Callable, Dict, List, Optional, Text, Tuple, Union
 
 import aiohttp
@@ -44,6 +46,8 @@ from rasa.model import (
     get_latest_model,
     unpack_model,
     get_model,
+    get_cached_model,
+    unarchive_to_cache,
 )
 from rasa.nlu.utils import is_url
 from rasa.utils.common import update_sanic_log_level
@@ -51,6 +55,12 @@ from rasa.utils.endpoints import EndpointConfig
 
 logger = logging.getLogger(__name__)
 
+# synthetic messages which are run through a freshly loaded model before it
+# starts serving requests
+WARM_UP_MESSAGES = ["hello", "what can you do?"]
+
+WARM_UP_SENDER_ID = "__warm_up__"
+
 
 async def load_from_server(agent: "Agent", model_server: EndpointConfig) -> "Agent":
     """Load a persisted model from a server."""
@@ -72,42 +82,98 @@ async def load_from_server(agent: "Agent", model_server: EndpointConfig) -> "Age
     return agent
 
 
-def _load_and_set_updated_model(
-    agent: "Agent", model_directory: Text, fingerprint: Text
-):
-    """Load the persisted model into memory and set the model on the agent."""
+def _load_model_components(
+    model_directory: Text, interpreter: Optional[NaturalLanguageInterpreter] = None,
+) -> Tuple[Optional[Domain], Optional[PolicyEnsemble], NaturalLanguageInterpreter]:
+    """Load domain, policies and interpreter of a persisted model.
 
-    logger.debug(f"Found new model with fingerprint {fingerprint}. Loading...")
+    `interpreter` is used if the model does not contain an NLU model."""
 
     core_path, nlu_path = get_model_subdirectories(model_directory)
 
     if nlu_path:
-        from rasa.core.interpreter import RasaNLUInterpreter
-
-        interpreter = RasaNLUInterpreter(model_directory=nlu_path)
-    else:
-        interpreter = (
-            agent.interpreter if agent.interpreter is not None else RegexInterpreter()
-        )
+        interpreter = NaturalLanguageInterpreter.create(nlu_path)
+    elif interpreter is None:
+        interpreter = RegexInterpreter()
 
     domain = None
+    policy_ensemble = None
     if core_path:
         domain_path = os.path.join(os.path.abspath(core_path), DEFAULT_DOMAIN_PATH)
         domain = Domain.load(domain_path)
+        policy_ensemble = PolicyEnsemble.load(core_path)
+
+    return domain, policy_ensemble, interpreter
 
+
+def _warm_up_model(
+    domain: Optional[Domain],
+    policy_ensemble: Optional[PolicyEnsemble],
+    interpreter: Optional[NaturalLanguageInterpreter],
+) -> None:
+    """Run a few synthetic requests through a freshly loaded model.
+
+    The first predictions of the tf based models are a lot slower than the
+    following ones (e.g. lazily restored sessions, memory allocation), this
+    way they don't delay the first requests of users."""
+
+    from rasa.core.interpreter import RasaNLUInterpreter
+
+    # noinspection PyBroadException
     try:
-        policy_ensemble = None
-        if core_path:
-            policy_ensemble = PolicyEnsemble.load(core_path)
-        agent.update_model(
-            domain, policy_ensemble, fingerprint, interpreter, model_directory
+        # other interpreters parse remotely, there is nothing to warm up
+        if isinstance(interpreter, RasaNLUInterpreter):
+            # this runs in an executor thread which has no event loop
+            loop = asyncio.new_event_loop()
+            try:
+                for text in WARM_UP_MESSAGES:
+                    loop.run_until_complete(interpreter.parse(text))
+            finally:
+                loop.close()
+
+        if domain is not None and policy_ensemble is not None:
+            tracker = DialogueStateTracker(WARM_UP_SENDER_ID, domain.slots)
+            policy_ensemble.probabilities_using_best_policy(tracker, domain)
+    except Exception:
+        logger.exception("Failed to warm up the model. Continuing anyways...")
+
+
+def _prepare_updated_model(
+    model_directory: Text, interpreter: Optional[NaturalLanguageInterpreter] = None
+) -> Tuple[Optional[Domain], Optional[PolicyEnsemble], NaturalLanguageInterpreter]:
+    components = _load_model_components(model_directory, interpreter)
+    _warm_up_model(*components)
+    return components
+
+
+async def _load_and_set_updated_model(
+    agent: "Agent", model_directory: Text, fingerprint: Text
+) -> None:
+    """Load the persisted model into memory and set the model on the agent.
+
+    The model is loaded and warmed up in a background thread, so that the
+    event loop continues to handle requests with the previous model. The
+    model is swapped once it is completely loaded, requests which already
+    started processing finish with the previous model."""
+
+    logger.debug(f"Found new model with fingerprint {fingerprint}. Loading...")
+
+    loop = asyncio.get_event_loop()
+    try:
+        domain, policy_ensemble, interpreter = await loop.run_in_executor(
+            None, _prepare_updated_model, model_directory, agent.interpreter
         )
-        logger.debug("Finished updating agent to new model.")
     except Exception:
         logger.exception(
             "Failed to load policy and update agent. "
             "The previous model will stay loaded instead."
         )
+        return
+
+    agent.update_model(
+        domain, policy_ensemble, fingerprint, interpreter, model_directory
+    )
+    logger.debug("Finished updating agent to new model.")
 
 
 async def _update_model_from_server(
@@ -123,7 +189,7 @@ async def _update_model_from_server(
     )
     if model_directory_and_fingerprint:
         model_directory, new_model_fingerprint = model_directory_and_fingerprint
-        _load_and_set_updated_model(agent, model_directory, new_model_fingerprint)
+        await _load_and_set_updated_model(agent, model_directory, new_model_fingerprint)
     else:
         logger.debug(f"No new model found at URL {model_server.url}")
 
@@ -176,14 +242,24 @@ async def _pull_model_and_fingerprint(
                     )
                     return None
 
-                model_directory = tempfile.mkdtemp()
-                rasa.utils.io.unarchive(await resp.read(), model_directory)
+                # get the new fingerprint
+                new_fingerprint = resp.headers.get("ETag")
+
+                if new_fingerprint:
+                    # models which were pulled before (e.g. before a restart)
+                    # are neither downloaded nor unpacked again
+                    model_directory = get_cached_model(new_fingerprint)
+                    if model_directory is None:
+                        model_directory = unarchive_to_cache(
+                            await resp.read(), new_fingerprint
+                        )
+                else:
+                    model_directory = tempfile.mkdtemp()
+                    rasa.utils.io.unarchive(await resp.read(), model_directory)
                 logger.debug(
                     "Unzipped model to '{}'".format(os.path.abspath(model_directory))
                 )
 
-                # get the new fingerprint
-                new_fingerprint = resp.headers.get("ETag")
                 # return new tmp model directory and new fingerprint
                 return model_directory, new_fingerprint
 
@@ -232,6 +308,7 @@ async def load_agent(
     tracker_store: Optional[TrackerStore] = None,
     lock_store: Optional[LockStore] = None,
     action_endpoint: Optional[EndpointConfig] = None,
+    use_model_cache: bool = False,
 ):
     try:
         if model_server is not None:
@@ -249,7 +326,8 @@ async def load_agent(
             )
 
         elif remote_storage is not None:
-            return Agent.load_from_remote_storage(
+            agent_loader = partial(
+                Agent.load_from_remote_storage,
                 remote_storage,
                 model_path,
                 interpreter=interpreter,
@@ -261,7 +339,8 @@ async def load_agent(
             )
 
         elif model_path is not None and os.path.exists(model_path):
-            return Agent.load_local_model(
+            agent_loader = partial(
+                Agent.load_local_model,
                 model_path,
                 interpreter=interpreter,
                 generator=generator,
@@ -270,17 +349,30 @@ async def load_agent(
                 action_endpoint=action_endpoint,
                 model_server=model_server,
                 remote_storage=remote_storage,
+                use_model_cache=use_model_cache,
             )
 
         else:
             warnings.warn("No valid configuration given to load agent.")
             return None
 
+        # load the model in the background, the event loop might be busy
+        # serving requests with a previously loaded model
+        return await asyncio.get_event_loop().run_in_executor(
+            None, _load_and_warm_up_agent, agent_loader
+        )
+
     except Exception as e:
         logger.error(f"Could not load model due to {e}.")
         raise
 
 
+def _load_and_warm_up_agent(agent_loader: Callable[[], "Agent"]) -> "Agent":
+    agent = agent_loader()
+    _warm_up_model(agent.domain, agent.policy_ensemble, agent.interpreter)
+    return agent
+
+
 class Agent:
     """The Agent class provides a convenient interface for the most important
      Rasa functionality.
@@ -363,19 +455,24 @@ class Agent:
         model_server: Optional[EndpointConfig] = None,
         remote_storage: Optional[Text] = None,
         path_to_model_archive: Optional[Text] = None,
+        use_model_cache: bool = False,
     ) -> "Agent":
-        """Load a persisted model from the passed path."""
+        """Load a persisted model from the passed path.
+
+        If `use_model_cache` is set, a zipped model is unpacked into the cache
+        of unpacked models. The model isn't evicted from the cache as long as
+        the agent uses it."""
         try:
             if not model_path:
                 raise ModelNotFound("No path specified.")
             elif not os.path.exists(model_path):
                 raise ModelNotFound(f"No file or directory at '{model_path}'.")
             elif os.path.isfile(model_path):
-                model_path = get_model(model_path)
+                model_path = get_model(model_path, use_cache=use_model_cache)
         except ModelNotFound:
             raise ValueError(
                 "You are trying to load a MODEL from '{}', which is not possible. \n"
-                "The model path should be a 'tar.gz' file or a directory "
+                "The model path should be a 'tar.gz' or 'tar' file or a directory "
                 "containing the various model files in the sub-directories 'core' "
                 "and 'nlu'. \n\nIf you want to load training data instead of "
                 "a model, use `agent.load_data(...)` instead.".format(model_path)
@@ -922,6 +1019,7 @@ class Agent:
         action_endpoint: Optional[EndpointConfig] = None,
         model_server: Optional[EndpointConfig] = None,
         remote_storage: Optional[Text] = None,
+        use_model_cache: bool = False,
     ) -> "Agent":
         if os.path.isfile(model_path):
             model_archive = model_path
@@ -932,8 +1030,11 @@ class Agent:
             warnings.warn(f"Could not load local model in '{model_path}'.")
             return Agent()
 
-        working_directory = tempfile.mkdtemp()
-        unpacked_model = unpack_model(model_archive, working_directory)
+        if use_model_cache:
+            unpacked_model = model_archive
+        else:
+            working_directory = tempfile.mkdtemp()
+            unpacked_model = unpack_model(model_archive, working_directory)
 
         return Agent.load(
             unpacked_model,
@@ -945,6 +1046,7 @@ class Agent:
             model_server=model_server,
             remote_storage=remote_storage,
             path_to_model_archive=model_archive,
+            use_model_cache=use_model_cache,
         )
 
     @staticmethod
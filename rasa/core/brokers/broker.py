@@ -1,12 +1,22 @@
+import atexit
 import logging
+import time
 import warnings
-from typing import Any, Dict, Text, Optional, Union
+from threading import Condition, Thread
+from typing import Any, Dict, List, Text, Optional, Union
 
 from rasa.utils import common
 from rasa.utils.endpoints import EndpointConfig
 
 logger = logging.getLogger(__name__)
 
+# number of buffered events which triggers a write
+DEFAULT_FLUSH_BATCH_SIZE = 100
+# maximum number of seconds events are buffered before they are written
+DEFAULT_FLUSH_INTERVAL_IN_SECONDS = 1.0
+# seconds to wait for buffered events to be written when exiting
+CLOSE_TIMEOUT = 10
+
 
 class EventBroker:
     """Base class for any event broker implementation."""
@@ -33,6 +43,155 @@ class EventBroker:
 
         raise NotImplementedError("Event broker must implement the `publish` method.")
 
+    def close(self) -> None:
+        """Publishes pending events and releases the resources of the broker.
+
+        Called when the server shuts down."""
+
+        pass
+
+
+class BufferedEventBroker(EventBroker):
+    """Base class for event brokers which write events in batches.
+
+    Published events are buffered and written by a background thread as soon
+    as `flush_batch_size` events were buffered or the oldest buffered event
+    waited for `flush_interval_in_seconds`."""
+
+    def __init__(
+        self,
+        flush_batch_size: int = DEFAULT_FLUSH_BATCH_SIZE,
+        flush_interval_in_seconds: float = DEFAULT_FLUSH_INTERVAL_IN_SECONDS,
+    ) -> None:
+        self.flush_batch_size = flush_batch_size
+        self.flush_interval_in_seconds = flush_interval_in_seconds
+
+        self._buffer: List[Dict[Text, Any]] = []
+        self._oldest_event_time = 0.0
+        self._condition = Condition()
+        self._writer: Optional[Thread] = None
+        self._is_writing = False
+        self._is_flush_requested = False
+        self._is_closed = False
+
+    def publish(self, event: Dict[Text, Any]) -> None:
+        """Buffers a json-formatted Rasa Core event until it is written."""
+
+        with self._condition:
+            if self._is_closed:
+                # nothing writes the buffer anymore
+                self._write_events_safely([event])
+                return
+
+            if not self._buffer:
+                self._oldest_event_time = time.monotonic()
+            self._buffer.append(event)
+
+            if self._writer is None:
+                self._start_writer()
+            if len(self._buffer) in (1, self.flush_batch_size):
+                self._condition.notify_all()
+
+    def write_events(self, events: List[Dict[Text, Any]]) -> None:
+        """Writes a batch of json-formatted Rasa Core events."""
+
+        raise NotImplementedError(
+            "Buffered event broker must implement the `write_events` method."
+        )
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Writes all buffered events.
+
+        Args:
+            timeout: Maximum number of seconds to wait for the events to be
+                written. `None` to wait until they are written.
+
+        Returns:
+            `True` if all buffered events were written.
+        """
+
+        with self._condition:
+            if self._writer is None:
+                return not self._buffer
+
+            self._is_flush_requested = True
+            self._condition.notify_all()
+            is_flushed = self._condition.wait_for(
+                lambda: not self._buffer and not self._is_writing, timeout
+            )
+            self._is_flush_requested = False
+
+        return is_flushed
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Writes all buffered events and stops the background writer."""
+
+        with self._condition:
+            self._is_closed = True
+            self._condition.notify_all()
+            writer = self._writer
+
+        if writer is not None:
+            writer.join(timeout)
+
+    def _start_writer(self) -> None:
+        self._writer = Thread(target=self._write_buffered_events, daemon=True)
+        self._writer.start()
+        # the writer is a daemon thread, write the buffered events on exit
+        atexit.register(self.close, CLOSE_TIMEOUT)
+
+    def _next_batch(self) -> List[Dict[Text, Any]]:
+        """Waits until buffered events should be written and takes them."""
+
+        with self._condition:
+            while not self._is_closed:
+                if len(self._buffer) >= self.flush_batch_size or (
+                    self._buffer and self._is_flush_requested
+                ):
+                    break
+
+                if not self._buffer:
+                    # woken up by the next published event
+                    self._condition.wait()
+                    continue
+
+                remaining = (
+                    self._oldest_event_time
+                    + self.flush_interval_in_seconds
+                    - time.monotonic()
+                )
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            batch = self._buffer
+            self._buffer = []
+            self._is_writing = True
+
+            return batch
+
+    def _write_buffered_events(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch:
+                self._write_events_safely(batch)
+
+            with self._condition:
+                self._is_writing = False
+                self._condition.notify_all()
+
+                if self._is_closed and not self._buffer:
+                    return
+
+    def _write_events_safely(self, events: List[Dict[Text, Any]]) -> None:
+        try:
+            self.write_events(events)
+        except Exception:
+            logger.exception(
+                f"Failed to write {len(events)} events with "
+                f"'{self.__class__.__name__}'. Dropping them."
+            )
+
 
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig],
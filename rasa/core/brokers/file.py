@@ -2,9 +2,14 @@ import json
 import logging
 import typing
 import warnings
-from typing import Optional, Text, Dict
+from typing import Dict, List, Optional, Text
 
-from rasa.core.brokers.broker import EventBroker
+from rasa.core.brokers.broker import (
+    BufferedEventBroker,
+    DEFAULT_FLUSH_BATCH_SIZE,
+    DEFAULT_FLUSH_INTERVAL_IN_SECONDS,
+)
+from rasa.utils.io import DEFAULT_ENCODING
 
 if typing.TYPE_CHECKING:
     from rasa.utils.endpoints import EndpointConfig
@@ -12,16 +17,26 @@ if typing.TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class FileEventBroker(EventBroker):
+class FileEventBroker(BufferedEventBroker):
     """Log events to a file in json format.
 
-    There will be one event per line and each event is stored as json."""
+    There will be one event per line and each event is stored as json. Events
+    are buffered and appended to the file in batches by a background thread."""
 
     DEFAULT_LOG_FILE_NAME = "rasa_event.log"
 
-    def __init__(self, path: Optional[Text] = None) -> None:
+    def __init__(
+        self,
+        path: Optional[Text] = None,
+        flush_batch_size: int = DEFAULT_FLUSH_BATCH_SIZE,
+        flush_interval_in_seconds: float = DEFAULT_FLUSH_INTERVAL_IN_SECONDS,
+    ) -> None:
+        super().__init__(flush_batch_size, flush_interval_in_seconds)
+
         self.path = path or self.DEFAULT_LOG_FILE_NAME
-        self.event_logger = self._event_logger()
+        self.event_file = open(self.path, "a", encoding=DEFAULT_ENCODING)
+
+        logger.info(f"Logging events to '{self.path}'.")
 
     @classmethod
     def from_endpoint_config(
@@ -33,24 +48,25 @@ class FileEventBroker(EventBroker):
         # noinspection PyArgumentList
         return cls(**broker_config.kwargs)
 
-    def _event_logger(self) -> logging.Logger:
-        """Instantiate the file logger."""
+    def write_events(self, events: List[Dict]) -> None:
+        """Append a batch of events to the file."""
+
+        lines = "".join(json.dumps(event) + "\n" for event in events)
 
-        logger_file = self.path
-        # noinspection PyTypeChecker
-        query_logger = logging.getLogger("event-logger")
-        query_logger.setLevel(logging.INFO)
-        handler = logging.FileHandler(logger_file)
-        handler.setFormatter(logging.Formatter("%(message)s"))
-        query_logger.propagate = False
-        query_logger.addHandler(handler)
+        if self.event_file.closed:
+            # events which are published after the broker was closed
+            with open(self.path, "a", encoding=DEFAULT_ENCODING) as event_file:
+                event_file.write(lines)
+            return
 
-        logger.info(f"Logging events to '{logger_file}'.")
+        self.event_file.write(lines)
+        self.event_file.flush()
 
-        return query_logger
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Writes all buffered events and closes the event file."""
 
-    def publish(self, event: Dict) -> None:
-        """Write event to file."""
+        super().close(timeout)
 
-        self.event_logger.info(json.dumps(event))
-        self.event_logger.handlers[0].flush()
+        if not self.event_file.closed:
+            self.event_file.flush()
+            self.event_file.close()
@@ -1,13 +1,16 @@
 import json
 import logging
 import warnings
-from typing import Optional
+from typing import Any, Dict, Optional, Text
 
 from rasa.core.brokers.broker import EventBroker
 from rasa.utils.io import DEFAULT_ENCODING
 
 logger = logging.getLogger(__name__)
 
+# seconds to wait for pending events to be sent when the broker is closed
+CLOSE_TIMEOUT = 10
+
 
 class KafkaEventBroker(EventBroker):
     def __init__(
@@ -22,7 +25,28 @@ class KafkaEventBroker(EventBroker):
         topic="rasa_core_events",
         security_protocol="SASL_PLAINTEXT",
         loglevel=logging.ERROR,
+        linger_ms: int = 50,
+        batch_size: int = 16384,
+        compression_type: Optional[Text] = "gzip",
+        buffer_memory: int = 33554432,
+        max_block_ms: int = 1000,
     ) -> None:
+        """Kafka event broker.
+
+        The producer is created with the first published event and kept
+        open. Events are sent in batches by the background thread of the
+        producer, publishing an event only appends it to a local buffer.
+
+        Args:
+            linger_ms: Milliseconds to wait for further events before a batch
+                is sent.
+            batch_size: Maximum size of a batch in bytes.
+            compression_type: Compression of the batches, `None` to send them
+                uncompressed.
+            buffer_memory: Maximum size of the local buffer in bytes.
+            max_block_ms: Milliseconds to wait for space in the local buffer
+                (and cluster metadata), the event is dropped afterwards.
+        """
 
         self.producer = None
         self.host = host
@@ -34,6 +58,11 @@ class KafkaEventBroker(EventBroker):
         self.ssl_certfile = ssl_certfile
         self.ssl_keyfile = ssl_keyfile
         self.ssl_check_hostname = ssl_check_hostname
+        self.linger_ms = linger_ms
+        self.batch_size = batch_size
+        self.compression_type = compression_type
+        self.buffer_memory = buffer_memory
+        self.max_block_ms = max_block_ms
 
         logging.getLogger("kafka").setLevel(loglevel)
 
@@ -45,38 +74,72 @@ class KafkaEventBroker(EventBroker):
         return cls(broker_config.url, **broker_config.kwargs)
 
     def publish(self, event) -> None:
-        self._create_producer()
+        if self.producer is None:
+            self._create_producer()
         self._publish(event)
-        self._close()
+
+    def _producer_config(self) -> Dict[Text, Any]:
+        # `host` can be a single broker address or a list of them
+        bootstrap_servers = self.host if isinstance(self.host, list) else [self.host]
+
+        return {
+            "bootstrap_servers": bootstrap_servers,
+            "value_serializer": lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
+            "linger_ms": self.linger_ms,
+            "batch_size": self.batch_size,
+            "compression_type": self.compression_type,
+            "buffer_memory": self.buffer_memory,
+            "max_block_ms": self.max_block_ms,
+        }
 
     def _create_producer(self) -> None:
         import kafka
 
         if self.security_protocol == "SASL_PLAINTEXT":
             self.producer = kafka.KafkaProducer(
-                bootstrap_servers=[self.host],
-                value_serializer=lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
                 sasl_plain_username=self.sasl_username,
                 sasl_plain_password=self.sasl_password,
                 sasl_mechanism="PLAIN",
                 security_protocol=self.security_protocol,
+                **self._producer_config(),
             )
         elif self.security_protocol == "SSL":
             self.producer = kafka.KafkaProducer(
-                bootstrap_servers=[self.host],
-                value_serializer=lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
                 ssl_cafile=self.ssl_cafile,
                 ssl_certfile=self.ssl_certfile,
                 ssl_keyfile=self.ssl_keyfile,
                 ssl_check_hostname=False,
                 security_protocol=self.security_protocol,
+                **self._producer_config(),
             )
 
     def _publish(self, event) -> None:
-        self.producer.send(self.topic, event)
+        from kafka.errors import KafkaError
+
+        try:
+            future = self.producer.send(self.topic, event)
+        except KafkaError as e:
+            # e.g. the local buffer is full since the cluster is not reachable
+            logger.error(f"Could not publish event to Kafka, dropping it. Error: {e}")
+            return
+
+        future.add_errback(self._on_delivery_error, event)
+
+    @staticmethod
+    def _on_delivery_error(event: Dict[Text, Any], error: Exception) -> None:
+        logger.error(
+            f"Failed to deliver event '{event.get('event')}' of conversation "
+            f"'{event.get('sender_id')}' to Kafka. Error: {error}"
+        )
+
+    def close(self) -> None:
+        if self.producer is not None:
+            self.producer.flush(timeout=CLOSE_TIMEOUT)
+            self.producer.close(timeout=CLOSE_TIMEOUT)
+            self.producer = None
 
     def _close(self) -> None:
-        self.producer.close()
+        self.close()
 
 
 class KafkaProducer(KafkaEventBroker):
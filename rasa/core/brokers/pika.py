@@ -3,7 +3,7 @@ import logging
 import typing
 import os
 import warnings
-from collections import deque
+from collections import Counter, OrderedDict, deque
 from threading import Thread
 from typing import Dict, Optional, Text, Union, Deque, Callable
 
@@ -20,9 +20,17 @@ if typing.TYPE_CHECKING:
     from pika.channel import Channel
     import pika
     from pika.connection import Parameters, Connection
+    import pika.frame
 
 logger = logging.getLogger(__name__)
 
+# maximum number of events which are kept while RabbitMQ isn't reachable
+DEFAULT_MAX_OUTBOX_SIZE = 10000
+# maximum number of events which are published at once
+DEFAULT_PUBLISH_BATCH_SIZE = 100
+# seconds to wait for pending events to be published when the broker is closed
+CLOSE_TIMEOUT = 10
+
 
 def initialise_pika_connection(
     host: Text,
@@ -207,9 +215,16 @@ class PikaEventBroker(EventBroker):
         loglevel: Union[Text, int] = os.environ.get(
             ENV_LOG_LEVEL_LIBRARIES, DEFAULT_LOG_LEVEL_LIBRARIES
         ),
+        max_outbox_size: Optional[int] = DEFAULT_MAX_OUTBOX_SIZE,
+        publish_batch_size: int = DEFAULT_PUBLISH_BATCH_SIZE,
+        retry_delay_in_seconds: float = 5,
     ):
         """RabbitMQ event producer.
 
+        Events are added to an outbox and published by the Pika io loop,
+        which runs in a background thread. Publishing an event hence never
+        blocks, even if RabbitMQ is not reachable.
+
         Args:
             host: Pika host.
             username: Username for authentication with Pika host.
@@ -217,6 +232,14 @@ class PikaEventBroker(EventBroker):
             port: port of the Pika host.
             queue: Pika queue to declare.
             loglevel: Logging level.
+            max_outbox_size: Maximum number of events which are kept while they
+                can't be published. The oldest events are dropped once the
+                outbox is full. `None` for an unbounded outbox.
+            publish_batch_size: Maximum number of events which are published
+                at once before the io loop handles other work (e.g. delivery
+                confirmations).
+            retry_delay_in_seconds: Delay in seconds between attempts to
+                reconnect to RabbitMQ.
 
         """
         logging.getLogger("pika").setLevel(loglevel)
@@ -226,21 +249,50 @@ class PikaEventBroker(EventBroker):
         self.username = username
         self.password = password
         self.port = port
+        self.publish_batch_size = publish_batch_size
+        self.retry_delay_in_seconds = retry_delay_in_seconds
         self.channel: Optional["Channel"] = None
+        self._pika_connection: Optional["SelectConnection"] = None
+        self._pika_thread: Optional[Thread] = None
+        self._closing = False
+
+        # Events which will be published as soon as possible
+        self._unpublished_messages: Deque[Text] = deque(maxlen=max_outbox_size)
+        # Published events which RabbitMQ did not confirm yet by delivery tag
+        self._unconfirmed_messages: Dict[int, Text] = OrderedDict()
+        self._delivery_tag = 0
+        self._flush_scheduled = False
+        self._counts = Counter()
 
-        # List to store unpublished messages which hopefully will be published later
-        self._unpublished_messages: Deque[Text] = deque()
         self._run_pika()
 
     def __del__(self) -> None:
-        if self.channel:
-            close_pika_channel(self.channel)
-            close_pika_connection(self.channel.connection)
+        self.close(timeout=0)
 
     @property
     def rasa_environment(self) -> Optional[Text]:
         return os.environ.get("RASA_ENVIRONMENT")
 
+    @property
+    def metrics(self) -> Dict[Text, int]:
+        """Counts which show whether events are piling up.
+
+        Returns:
+            The current number of events in the outbox (`outbox_size`) and of
+            events waiting for a confirmation (`unconfirmed`), as well as
+            the total number of `published`, `confirmed`, `rejected` (which
+            are published again) and `dropped` events.
+        """
+
+        return {
+            "outbox_size": len(self._unpublished_messages),
+            "unconfirmed": len(self._unconfirmed_messages),
+            "published": self._counts["published"],
+            "confirmed": self._counts["confirmed"],
+            "rejected": self._counts["rejected"],
+            "dropped": self._counts["dropped"],
+        }
+
     @classmethod
     def from_endpoint_config(
         cls, broker_config: Optional["EndpointConfig"]
@@ -251,14 +303,17 @@ class PikaEventBroker(EventBroker):
         return cls(broker_config.url, **broker_config.kwargs)
 
     def _run_pika(self) -> None:
+        # Run Pika io loop in extra thread so it's not blocking
+        self._run_pika_io_loop_in_thread()
+
+    def _connect(self) -> None:
         parameters = _get_pika_parameters(
             self.host, self.username, self.password, self.port
         )
         self._pika_connection = initialise_pika_select_connection(
             parameters, self._on_open_connection, self._on_open_connection_error
         )
-        # Run Pika io loop in extra thread so it's not blocking
-        self._run_pika_io_loop_in_thread()
+        self._pika_connection.add_on_close_callback(self._on_connection_closed)
 
     def _on_open_connection(self, connection: "SelectConnection") -> None:
         logger.debug(f"RabbitMQ connection to '{self.host}' was established.")
@@ -268,57 +323,161 @@ class PikaEventBroker(EventBroker):
         logger.warning(
             f"Connecting to '{self.host}' failed with error '{error}'. Trying again."
         )
+        # the io loop thread reconnects after stopping the io loop
+        self._pika_connection.ioloop.stop()
+
+    def _on_connection_closed(self, connection: "SelectConnection", reason) -> None:
+        self.channel = None
+        self._requeue_unconfirmed_messages()
+
+        if not self._closing:
+            logger.warning(
+                f"RabbitMQ connection to '{self.host}' was closed: {reason}. "
+                f"Trying to reconnect."
+            )
+        connection.ioloop.stop()
 
     def _on_channel_open(self, channel: "Channel") -> None:
         logger.debug("RabbitMQ channel was opened.")
         channel.queue_declare(self.queue, durable=True)
+        channel.confirm_delivery(ack_nack_callback=self._on_delivery_confirmation)
+        channel.add_on_close_callback(self._on_channel_closed)
 
+        self._delivery_tag = 0
         self.channel = channel
 
-        while self._unpublished_messages:
-            # Send unpublished messages
-            message = self._unpublished_messages.popleft()
-            self._publish(message)
+        if self._unpublished_messages:
             logger.debug(
-                f"Published message from queue of unpublished messages. "
-                f"Remaining unpublished messages: {len(self._unpublished_messages)}."
+                f"Publishing {len(self._unpublished_messages)} messages from the "
+                f"queue of unpublished messages."
             )
+        self._flush()
+
+    def _on_channel_closed(self, channel: "Channel", reason) -> None:
+        self.channel = None
+        self._requeue_unconfirmed_messages()
+
+        connection = self._pika_connection
+        if connection and connection.is_open and not self._closing:
+            logger.warning(f"RabbitMQ channel was closed: {reason}. Reopening it.")
+            connection.channel(on_open_callback=self._on_channel_open)
+
+    def _requeue_unconfirmed_messages(self) -> None:
+        """Publish messages again which were not confirmed before the channel
+        was closed."""
+
+        self._unpublished_messages.extendleft(
+            reversed(list(self._unconfirmed_messages.values()))
+        )
+        self._unconfirmed_messages.clear()
 
     def _run_pika_io_loop_in_thread(self) -> None:
-        thread = Thread(target=self._run_pika_io_loop, daemon=True)
-        thread.start()
+        self._pika_thread = Thread(target=self._run_pika_io_loop, daemon=True)
+        self._pika_thread.start()
 
     def _run_pika_io_loop(self) -> None:
-        self._pika_connection.ioloop.start()
+        while not self._closing:
+            self._connect()
+            # returns once the connection is closed or couldn't be established
+            self._pika_connection.ioloop.start()
+
+            if not self._closing:
+                time.sleep(self.retry_delay_in_seconds)
 
     def publish(
         self, event: Dict, retries: int = 60, retry_delay_in_seconds: int = 5
     ) -> None:
         """Publish `event` into Pika queue.
 
-        Perform `retries` publish attempts with `retry_delay_in_seconds` between them.
+        The event is added to the outbox, it is published in the background.
+        `retries` and `retry_delay_in_seconds` are not used anymore, the
+        broker keeps reconnecting to RabbitMQ on its own.
         """
 
         body = json.dumps(event)
 
-        while retries:
+        outbox = self._unpublished_messages
+        if outbox.maxlen is not None and len(outbox) >= outbox.maxlen:
+            self._counts["dropped"] += 1
+            logger.warning(
+                f"Queue of unpublished messages is full. Dropping the oldest "
+                f"message. Number of dropped messages: {self._counts['dropped']}."
+            )
+
+        outbox.append(body)
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Let the Pika io loop publish the messages of the outbox."""
+
+        if self._flush_scheduled or not self.channel:
+            # messages are published as soon as the channel is open
+            return
+
+        self._flush_scheduled = True
+        try:
+            self._pika_connection.ioloop.add_callback_threadsafe(self._flush)
+        except Exception as e:
+            self._flush_scheduled = False
+            logger.debug(f"Could not schedule publishing of messages. Error: {e}")
+
+    def _flush(self) -> None:
+        """Publish a batch of messages from the outbox.
+
+        Runs in the thread of the Pika io loop."""
+
+        self._flush_scheduled = False
+
+        number_of_messages = min(
+            self.publish_batch_size, len(self._unpublished_messages)
+        )
+        for _ in range(number_of_messages):
+            if not self.channel or not self.channel.is_open:
+                return
+
+            body = self._unpublished_messages.popleft()
             try:
                 self._publish(body)
-                return
             except Exception as e:
                 logger.error(
-                    "Could not open Pika channel at host '{}'. Failed with error: "
-                    "{}".format(self.host, e)
+                    f"Could not publish message to RabbitMQ host '{self.host}'. "
+                    f"Failed with error: {e}"
                 )
-                self.channel = None
+                self._unpublished_messages.appendleft(body)
+                return
 
-            retries -= 1
-            time.sleep(retry_delay_in_seconds)
+        if self._unpublished_messages:
+            self._schedule_flush()
 
-        logger.error(
-            "Failed to publish Pika event to queue '{}' on host "
-            "'{}':\n{}".format(self.queue, self.host, body)
-        )
+    def _on_delivery_confirmation(self, frame: "pika.frame.Method") -> None:
+        from pika.spec import Basic
+
+        method = frame.method
+        if method.multiple:
+            delivery_tags = [
+                tag for tag in self._unconfirmed_messages if tag <= method.delivery_tag
+            ]
+        else:
+            delivery_tags = [method.delivery_tag]
+
+        rejected = isinstance(method, Basic.Nack)
+        for delivery_tag in delivery_tags:
+            body = self._unconfirmed_messages.pop(delivery_tag, None)
+            if body is None:
+                continue
+
+            if rejected:
+                self._counts["rejected"] += 1
+                self._unpublished_messages.append(body)
+            else:
+                self._counts["confirmed"] += 1
+
+        if rejected:
+            logger.warning(
+                f"RabbitMQ rejected {len(delivery_tags)} message(s). Publishing "
+                f"them again."
+            )
+            self._schedule_flush()
 
     @property
     def _message_properties(self) -> "BasicProperties":
@@ -337,29 +496,63 @@ class PikaEventBroker(EventBroker):
         return BasicProperties(**kwargs)
 
     def _publish(self, body: Text) -> None:
-        if self._pika_connection.is_closed:
-            # Try to reset connection
-            self._run_pika()
-        elif not self.channel:
+        self.channel.basic_publish(
+            "",
+            self.queue,
+            body.encode(DEFAULT_ENCODING),
+            properties=self._message_properties,
+        )
+
+        self._delivery_tag += 1
+        self._unconfirmed_messages[self._delivery_tag] = body
+        self._counts["published"] += 1
+
+        logger.debug(
+            f"Published Pika events to queue '{self.queue}' on host "
+            f"'{self.host}':\n{body}"
+        )
+
+    def close(self, timeout: float = CLOSE_TIMEOUT) -> None:
+        """Publish the messages of the outbox and close the connection.
+
+        Args:
+            timeout: Seconds to wait for the io loop to finish.
+        """
+
+        self._closing = True
+
+        connection = self._pika_connection
+        if connection is None or connection.is_closed:
+            return
+
+        try:
+            connection.ioloop.add_callback_threadsafe(self._close_connection)
+        except Exception as e:
+            logger.debug(f"Could not close RabbitMQ connection. Error: {e}")
+            return
+
+        if self._pika_thread and timeout:
+            self._pika_thread.join(timeout)
+
+    def _close_connection(self) -> None:
+        while self._unpublished_messages and self.channel and self.channel.is_open:
+            body = self._unpublished_messages.popleft()
+            try:
+                self._publish(body)
+            except Exception:
+                logger.exception("Failed to publish message before closing.")
+                break
+
+        if self._unpublished_messages:
             logger.warning(
-                f"RabbitMQ channel has not been assigned. Adding message to "
-                f"list of unpublished messages and trying to publish them "
-                f"later. Current number of unpublished messages is "
-                f"{len(self._unpublished_messages)}."
-            )
-            self._unpublished_messages.append(body)
-        else:
-            self.channel.basic_publish(
-                "",
-                self.queue,
-                body.encode(DEFAULT_ENCODING),
-                properties=self._message_properties,
+                f"Closing RabbitMQ connection with {len(self._unpublished_messages)} "
+                f"unpublished messages."
             )
 
-            logger.debug(
-                f"Published Pika events to queue '{self.queue}' on host "
-                f"'{self.host}':\n{body}"
-            )
+        if self.channel and self.channel.is_open:
+            close_pika_channel(self.channel)
+        if self._pika_connection.is_open:
+            close_pika_connection(self._pika_connection)
 
 
 def create_rabbitmq_ssl_options(
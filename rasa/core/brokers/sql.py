@@ -1,19 +1,24 @@
 import json
 import logging
 import warnings
-from typing import Any, Dict, Optional, Text
+from typing import Any, Dict, List, Optional, Text
 
-from rasa.core.brokers.broker import EventBroker
+from rasa.core.brokers.broker import (
+    BufferedEventBroker,
+    DEFAULT_FLUSH_BATCH_SIZE,
+    DEFAULT_FLUSH_INTERVAL_IN_SECONDS,
+)
 from rasa.utils.endpoints import EndpointConfig
 import contextlib
 
 logger = logging.getLogger(__name__)
 
 
-class SQLEventBroker(EventBroker):
+class SQLEventBroker(BufferedEventBroker):
     """Save events into an SQL database.
 
-    All events will be stored in a table called `events`.
+    All events will be stored in a table called `events`. Events are buffered
+    and inserted in batches by a background thread.
 
     """
 
@@ -37,9 +42,14 @@ class SQLEventBroker(EventBroker):
         db: Text = "events.db",
         username: Optional[Text] = None,
         password: Optional[Text] = None,
+        flush_batch_size: int = DEFAULT_FLUSH_BATCH_SIZE,
+        flush_interval_in_seconds: float = DEFAULT_FLUSH_INTERVAL_IN_SECONDS,
     ):
         from rasa.core.tracker_store import SQLTrackerStore
         import sqlalchemy.orm
+        from sqlalchemy.pool import StaticPool
+
+        super().__init__(flush_batch_size, flush_interval_in_seconds)
 
         engine_url = SQLTrackerStore.get_db_url(
             dialect, host, port, db, username, password
@@ -47,7 +57,16 @@ class SQLEventBroker(EventBroker):
 
         logger.debug(f"SQLEventBroker: Connecting to database: '{engine_url}'.")
 
-        self.engine = sqlalchemy.create_engine(engine_url)
+        if dialect == "sqlite" and db == ":memory:":
+            # events are written by another thread, hence they have to share
+            # the connection to the in-memory database
+            self.engine = sqlalchemy.create_engine(
+                engine_url,
+                connect_args={"check_same_thread": False},
+                poolclass=StaticPool,
+            )
+        else:
+            self.engine = sqlalchemy.create_engine(engine_url)
         self.Base.metadata.create_all(self.engine)
         self.sessionmaker = sqlalchemy.orm.sessionmaker(bind=self.engine)
 
@@ -64,14 +83,15 @@ class SQLEventBroker(EventBroker):
         finally:
             session.close()
 
-    def publish(self, event: Dict[Text, Any]) -> None:
-        """Publishes a json-formatted Rasa Core event into an event queue."""
+    def write_events(self, events: List[Dict[Text, Any]]) -> None:
+        """Inserts a batch of json-formatted Rasa Core events with one commit."""
+
+        rows = [
+            {"sender_id": event.get("sender_id"), "data": json.dumps(event)}
+            for event in events
+        ]
         with self.session_scope() as session:
-            session.add(
-                self.SQLBrokerEvent(
-                    sender_id=event.get("sender_id"), data=json.dumps(event)
-                )
-            )
+            session.execute(self.SQLBrokerEvent.__table__.insert(), rows)
             session.commit()
 
 
@@ -8,7 +8,8 @@ import typing
 import uuid
 from dateutil import parser
 from datetime import datetime
-from typing import List, Dict, Text, Any, Type, Optional
+from functools import lru_cache
+from typing import List, Dict, Text, Any, Tuple, Type, Optional
 
 from rasa.core import utils
 from typing import Union
@@ -18,6 +19,9 @@ if typing.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# event classes by their `type_name`, filled by `Event.resolve_by_type`
+_event_classes_by_type_name: Dict[Text, Type["Event"]] = {}
+
 
 def deserialise_events(serialized_events: List[Dict[Text, Any]]) -> List["Event"]:
     """Convert a list of dictionaries to a list of corresponding events.
@@ -63,6 +67,24 @@ def md_format_message(text, intent, entities) -> Text:
     )
 
 
+@lru_cache(maxsize=None)
+def _slot_names(event_class: Type["Event"]) -> Tuple[Text, ...]:
+    """Names of the slots of an event class and all its base classes."""
+
+    names = []
+    for cls in event_class.__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        names.extend([slots] if isinstance(slots, str) else slots)
+    return tuple(names)
+
+
+def _update_event_classes_by_type_name() -> None:
+    # the first subclass with a type name wins, e.g. `UserUttered` for "user"
+    # and not the subclasses of `UserUttered` which don't change the type name
+    for cls in utils.all_subclasses(Event):
+        _event_classes_by_type_name.setdefault(cls.type_name, cls)
+
+
 def first_key(d: Dict[Text, Any], default_key: Any) -> Any:
     if len(d) > 1:
         for k, v in d.items():
@@ -83,6 +105,8 @@ class Event:
 
     type_name = "event"
 
+    __slots__ = ("timestamp", "_metadata")
+
     def __init__(
         self,
         timestamp: Optional[float] = None,
@@ -103,6 +127,25 @@ class Event:
         # CHANGELOG.rst.
         return getattr(self, "_metadata", {})
 
+    def __getstate__(self) -> Dict[Text, Any]:
+        state = dict(getattr(self, "__dict__", {}))
+        for slot in _slot_names(type(self)):
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state: Dict[Text, Any]) -> None:
+        # Also restores events which were pickled before events used
+        # `__slots__`. Attributes which events don't have anymore are skipped.
+        for name, value in state.items():
+            try:
+                setattr(self, name, value)
+            except AttributeError:
+                logger.debug(
+                    f"Skipping unknown attribute '{name}' of pickled "
+                    f"'{type(self).__name__}' event."
+                )
+
     def __ne__(self, other: Any) -> bool:
         # Not strictly necessary, but to avoid having both x==y and x!=y
         # True at the same time
@@ -176,11 +219,15 @@ class Event:
         type_name: Text, default: Optional[Type["Event"]] = None
     ) -> Optional[Type["Event"]]:
         """Returns a slots class by its type name."""
-        from rasa.core import utils
 
-        for cls in utils.all_subclasses(Event):
-            if cls.type_name == type_name:
-                return cls
+        cls = _event_classes_by_type_name.get(type_name)
+        if cls is None:
+            # event classes might have been defined since the last lookup
+            _update_event_classes_by_type_name()
+            cls = _event_classes_by_type_name.get(type_name)
+
+        if cls is not None:
+            return cls
         if type_name == "topic":
             return None  # backwards compatibility to support old TopicSet evts
         elif default is not None:
@@ -200,6 +247,15 @@ class UserUttered(Event):
 
     type_name = "user"
 
+    __slots__ = (
+        "text",
+        "intent",
+        "entities",
+        "input_channel",
+        "message_id",
+        "parse_data",
+    )
+
     def __init__(
         self,
         text: Optional[Text] = None,
@@ -293,17 +349,19 @@ class UserUttered(Event):
 
     @classmethod
     def _from_story_string(cls, parameters: Dict[Text, Any]) -> Optional[List[Event]]:
+        return [cls._from_parameters(parameters)]
+
+    @classmethod
+    def _from_parameters(cls, parameters: Dict[Text, Any]) -> "UserUttered":
         try:
-            return [
-                cls._from_parse_data(
-                    parameters.get("text"),
-                    parameters.get("parse_data"),
-                    parameters.get("timestamp"),
-                    parameters.get("input_channel"),
-                    parameters.get("message_id"),
-                    parameters.get("metadata"),
-                )
-            ]
+            return cls._from_parse_data(
+                parameters.get("text"),
+                parameters.get("parse_data"),
+                parameters.get("timestamp"),
+                parameters.get("input_channel"),
+                parameters.get("message_id"),
+                parameters.get("metadata"),
+            )
         except KeyError as e:
             raise ValueError(f"Failed to parse bot uttered event. {e}")
 
@@ -343,6 +401,8 @@ class BotUttered(Event):
 
     type_name = "bot"
 
+    __slots__ = ("text", "data")
+
     def __init__(self, text=None, data=None, metadata=None, timestamp=None) -> None:
         self.text = text
         self.data = data or {}
@@ -434,6 +494,8 @@ class SlotSet(Event):
 
     type_name = "slot"
 
+    __slots__ = ("key", "value")
+
     def __init__(
         self,
         key: Text,
@@ -504,6 +566,8 @@ class Restarted(Event):
 
     type_name = "restart"
 
+    __slots__ = ()
+
     def __hash__(self) -> int:
         return hash(32143124312)
 
@@ -535,6 +599,8 @@ class UserUtteranceReverted(Event):
 
     type_name = "rewind"
 
+    __slots__ = ()
+
     def __hash__(self) -> int:
         return hash(32143124315)
 
@@ -562,6 +628,8 @@ class AllSlotsReset(Event):
 
     type_name = "reset_slots"
 
+    __slots__ = ()
+
     def __hash__(self) -> int:
         return hash(32143124316)
 
@@ -587,6 +655,8 @@ class ReminderScheduled(Event):
 
     type_name = "reminder"
 
+    __slots__ = ("action_name", "trigger_date_time", "kill_on_user_message", "name")
+
     def __init__(
         self,
         action_name: Text,
@@ -678,6 +748,8 @@ class ReminderCancelled(Event):
 
     type_name = "cancel_reminder"
 
+    __slots__ = ("action_name",)
+
     def __init__(
         self,
         action_name: Text,
@@ -729,6 +801,8 @@ class ActionReverted(Event):
 
     type_name = "undo"
 
+    __slots__ = ()
+
     def __hash__(self) -> int:
         return hash(32143124318)
 
@@ -752,6 +826,8 @@ class StoryExported(Event):
 
     type_name = "export"
 
+    __slots__ = ("path",)
+
     def __init__(
         self,
         path: Optional[Text] = None,
@@ -794,6 +870,8 @@ class FollowupAction(Event):
 
     type_name = "followup"
 
+    __slots__ = ("action_name",)
+
     def __init__(
         self,
         name: Text,
@@ -848,6 +926,8 @@ class ConversationPaused(Event):
 
     type_name = "pause"
 
+    __slots__ = ()
+
     def __hash__(self) -> int:
         return hash(32143124313)
 
@@ -873,6 +953,8 @@ class ConversationResumed(Event):
 
     type_name = "resume"
 
+    __slots__ = ()
+
     def __hash__(self) -> int:
         return hash(32143124314)
 
@@ -898,6 +980,8 @@ class ActionExecuted(Event):
 
     type_name = "action"
 
+    __slots__ = ("action_name", "policy", "confidence", "unpredictable")
+
     def __init__(
         self,
         action_name: Text,
@@ -932,15 +1016,17 @@ class ActionExecuted(Event):
     @classmethod
     def _from_story_string(cls, parameters: Dict[Text, Any]) -> Optional[List[Event]]:
 
-        return [
-            ActionExecuted(
-                parameters.get("name"),
-                parameters.get("policy"),
-                parameters.get("confidence"),
-                parameters.get("timestamp"),
-                parameters.get("metadata"),
-            )
-        ]
+        return [cls._from_parameters(parameters)]
+
+    @classmethod
+    def _from_parameters(cls, parameters: Dict[Text, Any]) -> "ActionExecuted":
+        return ActionExecuted(
+            parameters.get("name"),
+            parameters.get("policy"),
+            parameters.get("confidence"),
+            parameters.get("timestamp"),
+            parameters.get("metadata"),
+        )
 
     def as_dict(self) -> Dict[Text, Any]:
         d = super().as_dict()
@@ -968,6 +1054,8 @@ class AgentUttered(Event):
 
     type_name = "agent"
 
+    __slots__ = ("text", "data")
+
     def __init__(
         self,
         text: Optional[Text] = None,
@@ -1032,6 +1120,8 @@ class Form(Event):
 
     type_name = "form"
 
+    __slots__ = ("name",)
+
     def __init__(
         self,
         name: Optional[Text],
@@ -1083,6 +1173,8 @@ class FormValidation(Event):
 
     type_name = "form_validation"
 
+    __slots__ = ("validate",)
+
     def __init__(
         self,
         validate: bool,
@@ -1126,6 +1218,8 @@ class ActionExecutionRejected(Event):
 
     type_name = "action_execution_rejected"
 
+    __slots__ = ("action_name", "policy", "confidence")
+
     def __init__(
         self,
         action_name: Text,
@@ -1188,6 +1282,8 @@ class SessionStarted(Event):
 
     type_name = "session_started"
 
+    __slots__ = ()
+
     def __hash__(self) -> int:
         return hash(32143124320)
 
@@ -4,8 +4,10 @@ import warnings
 import json
 import logging
 import re
+import threading
 
 import os
+import typing
 from typing import Text, List, Dict, Any, Union, Optional, Tuple
 
 from rasa.core import constants
@@ -13,8 +15,16 @@ from rasa.core.trackers import DialogueStateTracker
 from rasa.core.constants import INTENT_MESSAGE_PREFIX
 from rasa.utils.endpoints import EndpointConfig
 
+if typing.TYPE_CHECKING:
+    from rasa.nlu.components import ComponentBuilder
+
 logger = logging.getLogger(__name__)
 
+# component builder shared by all nlu interpreters of this process, models
+# which are (re)loaded later reuse the components of models loaded before
+_component_builder = None
+_component_builder_lock = threading.Lock()
+
 
 class NaturalLanguageInterpreter:
     async def parse(
@@ -263,10 +273,14 @@ class RasaNLUInterpreter(NaturalLanguageInterpreter):
         model_directory: Text,
         config_file: Optional[Text] = None,
         lazy_init: bool = False,
+        lazy_load: Optional[bool] = None,
     ):
         self.model_directory = model_directory
         self.lazy_init = lazy_init
         self.config_file = config_file
+        # if not set, the environment decides whether the components of the
+        # NLU model restore their artefacts lazily
+        self.lazy_load = lazy_load
 
         if not lazy_init:
             self._load_interpreter()
@@ -290,9 +304,28 @@ class RasaNLUInterpreter(NaturalLanguageInterpreter):
         return result
 
     def _load_interpreter(self) -> None:
+        from rasa.constants import ENV_LAZY_LOAD_NLU_MODEL
         from rasa.nlu.model import Interpreter
 
-        self.interpreter = Interpreter.load(self.model_directory)
+        lazy_load = self.lazy_load
+        if lazy_load is None:
+            lazy_load = os.environ.get(ENV_LAZY_LOAD_NLU_MODEL, "").lower() == "true"
+        self.interpreter = Interpreter.load(
+            self.model_directory,
+            component_builder=_shared_component_builder(),
+            lazy_load=lazy_load,
+        )
+
+
+def _shared_component_builder() -> "ComponentBuilder":
+    from rasa.nlu.components import ComponentBuilder
+
+    global _component_builder
+
+    with _component_builder_lock:
+        if _component_builder is None:
+            _component_builder = ComponentBuilder()
+    return _component_builder
 
 
 def _create_from_endpoint_config(
@@ -4,7 +4,7 @@ import os
 import shutil
 import warnings
 from functools import partial
-from typing import Any, List, Optional, Text, Union
+from typing import Any, List, Optional, Text, Tuple, Union
 
 import rasa.core.utils
 import rasa.utils
@@ -17,9 +17,9 @@ from rasa.core.agent import Agent
 from rasa.core.brokers.broker import EventBroker
 from rasa.core.channels import console
 from rasa.core.channels.channel import InputChannel
-from rasa.core.interpreter import NaturalLanguageInterpreter
+from rasa.core.interpreter import NaturalLanguageInterpreter, RasaNLUInterpreter
 from rasa.core.lock_store import LockStore
-from rasa.core.tracker_store import TrackerStore
+from rasa.core.tracker_store import TrackerStore, schedule_session_archival
 from rasa.core.utils import AvailableEndpoints
 from sanic import Sanic
 
@@ -183,30 +183,120 @@ def serve_application(
         "{}".format(constants.DEFAULT_SERVER_FORMAT.format(protocol, port))
     )
 
+    number_of_workers = rasa.core.utils.number_of_sanic_workers(
+        endpoints.lock_store if endpoints else None
+    )
+
+    preloaded_model_directory = None
+    preloaded_interpreter = None
+    if number_of_workers > 1 and not remote_storage:
+        preloaded_model_directory, preloaded_interpreter = _preload_interpreter(
+            model_path, endpoints
+        )
+
     app.register_listener(
-        partial(load_agent_on_start, model_path, endpoints, remote_storage),
+        partial(
+            load_agent_on_start,
+            model_path,
+            endpoints,
+            remote_storage,
+            interpreter=preloaded_interpreter,
+        ),
         "before_server_start",
     )
 
     # noinspection PyUnresolvedReferences
     async def clear_model_files(_app: Sanic, _loop: Text) -> None:
-        if app.agent.model_directory:
-            shutil.rmtree(_app.agent.model_directory)
+        # cached models are reused when the server is started again
+        model_directory = _app.agent.model_directory
+        if model_directory and not model.is_cached_model(model_directory):
+            shutil.rmtree(model_directory)
 
     app.register_listener(clear_model_files, "after_server_stop")
 
+    # noinspection PyUnresolvedReferences
+    async def close_event_broker(_app: Sanic, _loop: Text) -> None:
+        # publishes the events which the broker still buffers
+        event_broker = _app.agent.tracker_store.event_broker if _app.agent else None
+        if event_broker:
+            event_broker.close()
+
+    app.register_listener(close_event_broker, "after_server_stop")
+
     rasa.utils.common.update_sanic_log_level(log_file)
 
-    app.run(
-        host="0.0.0.0",
-        port=port,
-        ssl=ssl_context,
-        backlog=int(os.environ.get(ENV_SANIC_BACKLOG, "100")),
-        workers=rasa.core.utils.number_of_sanic_workers(
-            endpoints.lock_store if endpoints else None
-        ),
+    try:
+        app.run(
+            host="0.0.0.0",
+            port=port,
+            ssl=ssl_context,
+            backlog=int(os.environ.get(ENV_SANIC_BACKLOG, "100")),
+            workers=number_of_workers,
+        )
+    finally:
+        if preloaded_model_directory:
+            shutil.rmtree(preloaded_model_directory, ignore_errors=True)
+
+
+def _preload_interpreter(
+    model_path: Optional[Text], endpoints: Optional[AvailableEndpoints]
+) -> Tuple[Optional[Text], Optional[NaturalLanguageInterpreter]]:
+    """Load the NLU model once before the Sanic workers are forked.
+
+    The forked workers share the memory of the loaded components (e.g. spaCy
+    and MITIE models and the vocabularies of the `CountVectorsFeaturizer`)
+    copy-on-write instead of loading their own copy. TensorFlow sessions
+    can't be shared with a forked process. Hence the model is loaded lazily
+    and the components which use TensorFlow (`EmbeddingIntentClassifier`,
+    `ResponseSelector` and `ConveRTFeaturizer`) create their sessions on
+    first use, which happens in the workers.
+
+    Returns the directory of the unpacked model, which has to be removed when
+    the server stops, and the interpreter."""
+
+    if endpoints and (endpoints.nlu or endpoints.model):
+        # the NLU model is not loaded from the local model
+        return None, None
+
+    # noinspection PyBroadException
+    try:
+        unpacked_model = model.get_model(model_path)
+    except Exception:
+        logger.debug(f"Could not unpack model '{model_path}' to preload it.")
+        return None, None
+
+    _, nlu_model = model.get_model_subdirectories(unpacked_model)
+    if not nlu_model:
+        shutil.rmtree(unpacked_model, ignore_errors=True)
+        return None, None
+
+    # noinspection PyBroadException
+    try:
+        interpreter = RasaNLUInterpreter(nlu_model, lazy_load=True)
+        _load_deferred_vocabularies(interpreter)
+    except Exception:
+        logger.debug(f"Could not preload interpreter from '{model_path}'.")
+        shutil.rmtree(unpacked_model, ignore_errors=True)
+        return None, None
+
+    logger.info("Loaded NLU model once to share it between the Sanic workers.")
+    return unpacked_model, interpreter
+
+
+def _load_deferred_vocabularies(interpreter: RasaNLUInterpreter) -> None:
+    """Read the vocabularies which the lazily loaded model deferred.
+
+    They don't depend on TensorFlow and can hence be shared with the forked
+    workers."""
+
+    from rasa.nlu.featurizers.sparse_featurizer.count_vectors_featurizer import (
+        CountVectorsFeaturizer,
     )
 
+    for component in interpreter.interpreter.pipeline:
+        if isinstance(component, CountVectorsFeaturizer):
+            component.load_deferred_vocabulary()
+
 
 # noinspection PyUnusedLocal
 async def load_agent_on_start(
@@ -215,23 +305,24 @@ async def load_agent_on_start(
     remote_storage: Optional[Text],
     app: Sanic,
     loop: Text,
+    interpreter: Optional[NaturalLanguageInterpreter] = None,
 ):
     """Load an agent.
 
     Used to be scheduled on server start
-    (hence the `app` and `loop` arguments)."""
+    (hence the `app` and `loop` arguments).
 
-    # noinspection PyBroadException
-    try:
-        with model.get_model(model_path) as unpacked_model:
-            _, nlu_model = model.get_model_subdirectories(unpacked_model)
-            _interpreter = NaturalLanguageInterpreter.create(endpoints.nlu or nlu_model)
-    except Exception:
-        logger.debug(f"Could not load interpreter from '{model_path}'.")
-        _interpreter = None
+    If an `interpreter` is passed, e.g. one which was loaded before the
+    Sanic workers were forked, it is used instead of loading one."""
+
+    if interpreter is not None:
+        _interpreter = interpreter
+    else:
+        _interpreter = _load_interpreter(model_path, endpoints)
 
     _broker = EventBroker.create(endpoints.event_broker)
     _tracker_store = TrackerStore.create(endpoints.tracker_store, event_broker=_broker)
+    await schedule_session_archival(_tracker_store)
     _lock_store = LockStore.create(endpoints.lock_store)
 
     model_server = endpoints.model if endpoints and endpoints.model else None
@@ -245,6 +336,7 @@ async def load_agent_on_start(
         tracker_store=_tracker_store,
         lock_store=_lock_store,
         action_endpoint=endpoints.action,
+        use_model_cache=True,
     )
 
     if not app.agent:
@@ -264,6 +356,23 @@ async def load_agent_on_start(
     return app.agent
 
 
+def _load_interpreter(
+    model_path: Text, endpoints: AvailableEndpoints
+) -> Optional[NaturalLanguageInterpreter]:
+    # noinspection PyBroadException
+    try:
+        with model.get_model(model_path) as unpacked_model:
+            _, nlu_model = model.get_model_subdirectories(unpacked_model)
+            if nlu_model and not endpoints.nlu:
+                # the unpacked model is removed afterwards, hence the
+                # components can't restore anything lazily
+                return RasaNLUInterpreter(nlu_model, lazy_load=False)
+            return NaturalLanguageInterpreter.create(endpoints.nlu or nlu_model)
+    except Exception:
+        logger.debug(f"Could not load interpreter from '{model_path}'.")
+        return None
+
+
 if __name__ == "__main__":
     raise RuntimeError(
         "Calling `rasa.core.run` directly is no longer supported. "
@@ -1,14 +1,17 @@
+import copy
 import logging
+import math
 import os
 import warnings
 import typing
 from collections import defaultdict, namedtuple
-from typing import Any, Dict, List, Optional, Text, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Text, Tuple
 
 import rasa.utils.io
 from rasa.constants import RESULTS_FILE, PERCENTAGE_KEY
 from rasa.core.utils import pad_lists_to_size
 from rasa.core.events import ActionExecuted, UserUttered
+from rasa.core.interpreter import NaturalLanguageInterpreter, RegexInterpreter
 from rasa.nlu.training_data.formats.markdown import MarkdownWriter
 from rasa.core.trackers import DialogueStateTracker
 from rasa.utils.io import DEFAULT_ENCODING
@@ -191,13 +194,40 @@ class WronglyClassifiedUserUtterance(UserUttered):
         )
 
 
+class _CachingInterpreter(NaturalLanguageInterpreter):
+    """Wraps an interpreter and parses every distinct text only once.
+
+    End-to-end test stories often repeat the same user utterances, hence
+    caching the parse results avoids running the NLU pipeline over and over."""
+
+    def __init__(self, interpreter: NaturalLanguageInterpreter) -> None:
+        self.interpreter = interpreter
+        self._cache: Dict[Text, Dict[Text, Any]] = {}
+
+    async def parse(
+        self,
+        text: Text,
+        message_id: Optional[Text] = None,
+        tracker: Optional[DialogueStateTracker] = None,
+    ) -> Dict[Text, Any]:
+        if text not in self._cache:
+            self._cache[text] = await self.interpreter.parse(text)
+
+        # callers modify the parse data, so they need to get their own copy
+        return copy.deepcopy(self._cache[text])
+
+
 async def _generate_trackers(resource_name, agent, max_stories=None, use_e2e=False):
     from rasa.core.training.generator import TrainingDataGenerator
 
     from rasa.core import training
 
+    interpreter = agent.interpreter
+    if use_e2e and interpreter is not None:
+        interpreter = _CachingInterpreter(interpreter)
+
     story_graph = await training.extract_story_graph(
-        resource_name, agent.domain, agent.interpreter, use_e2e
+        resource_name, agent.domain, interpreter, use_e2e
     )
     g = TrainingDataGenerator(
         story_graph,
@@ -398,13 +428,80 @@ def _in_training_data_fraction(action_list):
     return len(in_training_data) / len(action_list)
 
 
+# agent of a story evaluation worker process, loaded once per worker
+_worker_agent: Optional["Agent"] = None
+
+
+def _load_worker_agent(model_directory: Text) -> None:
+    """Loads the agent which is used by a story evaluation worker process."""
+    from rasa.core.agent import Agent
+
+    global _worker_agent
+
+    # the test stories have already been parsed, hence no NLU model is needed
+    _worker_agent = Agent.load(model_directory, interpreter=RegexInterpreter())
+
+
+def _predict_tracker_shard(
+    trackers: List[DialogueStateTracker],
+    fail_on_prediction_errors: bool,
+    use_e2e: bool,
+) -> List[Tuple[EvaluationStore, DialogueStateTracker, List[Dict[Text, Any]]]]:
+    """Runs a shard of the test stories through the agent of the worker."""
+
+    return [
+        _predict_tracker_actions(
+            tracker, _worker_agent, fail_on_prediction_errors, use_e2e
+        )
+        for tracker in trackers
+    ]
+
+
+def _predict_trackers_in_parallel(
+    completed_trackers: List[DialogueStateTracker],
+    agent: "Agent",
+    fail_on_prediction_errors: bool,
+    use_e2e: bool,
+    jobs: int,
+) -> Iterator[Tuple[EvaluationStore, DialogueStateTracker, List[Dict[Text, Any]]]]:
+    """Shards the test stories across `jobs` worker processes.
+
+    Every worker loads the model of `agent` once. Results are yielded in the
+    order of `completed_trackers`."""
+    from multiprocessing import get_context
+
+    # several shards per worker keep the workers busy if stories differ in length
+    shard_size = max(1, math.ceil(len(completed_trackers) / (jobs * 4)))
+    shards = [
+        completed_trackers[i : i + shard_size]
+        for i in range(0, len(completed_trackers), shard_size)
+    ]
+
+    # TensorFlow is not fork-safe, hence every worker starts a fresh interpreter
+    with get_context("spawn").Pool(
+        jobs, initializer=_load_worker_agent, initargs=(agent.model_directory,)
+    ) as pool:
+        pending = [
+            pool.apply_async(
+                _predict_tracker_shard, (shard, fail_on_prediction_errors, use_e2e)
+            )
+            for shard in shards
+        ]
+        for shard_results in pending:
+            yield from shard_results.get()
+
+
 def collect_story_predictions(
     completed_trackers: List["DialogueStateTracker"],
     agent: "Agent",
     fail_on_prediction_errors: bool = False,
     use_e2e: bool = False,
+    jobs: int = 1,
 ) -> Tuple[StoryEvalution, int]:
-    """Test the stories from a file, running them through the stored model."""
+    """Test the stories from a file, running them through the stored model.
+
+    If `jobs` is larger than 1, the stories are evaluated in parallel worker
+    processes which load the model the agent was loaded from."""
     from rasa.nlu.test import get_evaluation_metrics
     from tqdm import tqdm
 
@@ -417,10 +514,26 @@ def collect_story_predictions(
 
     action_list = []
 
-    for tracker in tqdm(completed_trackers):
-        tracker_results, predicted_tracker, tracker_actions = _predict_tracker_actions(
-            tracker, agent, fail_on_prediction_errors, use_e2e
+    if jobs > 1 and not agent.model_directory:
+        logger.warning(
+            "The agent was not loaded from a model directory. Stories will "
+            "be evaluated in a single process."
         )
+        jobs = 1
+
+    if jobs > 1:
+        predictions = _predict_trackers_in_parallel(
+            completed_trackers, agent, fail_on_prediction_errors, use_e2e, jobs
+        )
+    else:
+        predictions = (
+            _predict_tracker_actions(tracker, agent, fail_on_prediction_errors, use_e2e)
+            for tracker in completed_trackers
+        )
+
+    for tracker_results, predicted_tracker, tracker_actions in tqdm(
+        predictions, total=number_of_stories
+    ):
 
         story_eval_store.merge_store(tracker_results)
 
@@ -489,6 +602,7 @@ async def test(
     fail_on_prediction_errors: bool = False,
     e2e: bool = False,
     disable_plotting: bool = False,
+    jobs: int = 1,
 ):
     """Run the evaluation of the stories, optionally plot the results."""
     from rasa.nlu.test import get_evaluation_metrics
@@ -496,7 +610,7 @@ async def test(
     completed_trackers = await _generate_trackers(stories, agent, max_stories, e2e)
 
     story_evaluation, _ = collect_story_predictions(
-        completed_trackers, agent, fail_on_prediction_errors, e2e
+        completed_trackers, agent, fail_on_prediction_errors, e2e, jobs
     )
 
     evaluation_store = story_evaluation.evaluation_store
@@ -604,7 +718,7 @@ def plot_story_evaluation(
 
 
 async def compare_models_in_dir(
-    model_dir: Text, stories_file: Text, output: Text
+    model_dir: Text, stories_file: Text, output: Text, jobs: int = 1
 ) -> None:
     """Evaluates multiple trained models in a directory on a test set."""
     import rasa.utils.io as io_utils
@@ -621,7 +735,9 @@ async def compare_models_in_dir(
             # The model files are named like <config-name>PERCENTAGE_KEY<number>.tar.gz
             # Remove the percentage key and number from the name to get the config name
             config_name = os.path.basename(model).split(PERCENTAGE_KEY)[0]
-            number_of_correct_stories = await _evaluate_core_model(model, stories_file)
+            number_of_correct_stories = await _evaluate_core_model(
+                model, stories_file, jobs
+            )
             number_correct_in_run[config_name].append(number_of_correct_stories)
 
         for k, v in number_correct_in_run.items():
@@ -632,13 +748,17 @@ async def compare_models_in_dir(
     )
 
 
-async def compare_models(models: List[Text], stories_file: Text, output: Text) -> None:
+async def compare_models(
+    models: List[Text], stories_file: Text, output: Text, jobs: int = 1
+) -> None:
     """Evaluates provided trained models on a test set."""
 
     number_correct = defaultdict(list)
 
     for model in models:
-        number_of_correct_stories = await _evaluate_core_model(model, stories_file)
+        number_of_correct_stories = await _evaluate_core_model(
+            model, stories_file, jobs
+        )
         number_correct[os.path.basename(model)].append(number_of_correct_stories)
 
     rasa.utils.io.dump_obj_as_json_to_file(
@@ -646,7 +766,7 @@ async def compare_models(models: List[Text], stories_file: Text, output: Text) -
     )
 
 
-async def _evaluate_core_model(model: Text, stories_file: Text) -> int:
+async def _evaluate_core_model(model: Text, stories_file: Text, jobs: int = 1) -> int:
     from rasa.core.agent import Agent
 
     logger.info(f"Evaluating model '{model}'")
@@ -654,7 +774,7 @@ async def _evaluate_core_model(model: Text, stories_file: Text) -> int:
     agent = Agent.load(model)
     completed_trackers = await _generate_trackers(stories_file, agent)
     story_eval_store, number_of_stories = collect_story_predictions(
-        completed_trackers, agent
+        completed_trackers, agent, jobs=jobs
     )
     failed_stories = story_eval_store.failed_stories
     return number_of_stories - len(failed_stories)
@@ -0,0 +1,203 @@
+import json
+import logging
+import struct
+import zlib
+from typing import Any, Dict, List, Optional, Text, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# trackers are serialised as json of their dialogue
+SERIALISATION_FORMAT_JSON = "json"
+# trackers are serialised with the versioned binary format of this module
+SERIALISATION_FORMAT_BINARY = "binary"
+SERIALISATION_FORMATS = (SERIALISATION_FORMAT_JSON, SERIALISATION_FORMAT_BINARY)
+
+# The binary format starts with this prefix which can't be the start of json
+# or pickled trackers. It's followed by a header with the format version, the
+# codec of the payload, and whether the payload is compressed.
+BINARY_FORMAT_PREFIX = b"\x00RTS"
+BINARY_FORMAT_VERSION = 1
+_HEADER = struct.Struct("!BBB")
+
+CODEC_JSON = 0
+CODEC_MSGPACK = 1
+
+# fast compression, serialising trackers is part of handling every message
+DEFAULT_COMPRESSION_LEVEL = 1
+
+_ACTION_EVENT = "action"
+_USER_EVENT = "user"
+
+
+class TrackerSerialisationError(ValueError):
+    """Raised if a serialised tracker can't be decoded."""
+
+
+def _msgpack() -> Optional[Any]:
+    try:
+        import msgpack
+
+        return msgpack
+    except ImportError:
+        return None
+
+
+def is_binary_dialogue(serialised: Union[Text, bytes, None]) -> bool:
+    """Check whether a serialised tracker uses the binary format."""
+
+    return isinstance(serialised, bytes) and serialised.startswith(BINARY_FORMAT_PREFIX)
+
+
+def _intern_events(
+    events: List[Dict[Text, Any]]
+) -> Tuple[List[Text], List[Dict[Text, Any]]]:
+    """Replace recurring names of events with indices into a table of names.
+
+    The names are event types, the names of executed actions, and the intent
+    names of user messages. The serialised events of the tracker are copied
+    before they are changed.
+    """
+
+    names: List[Text] = []
+    indices: Dict[Text, int] = {}
+
+    def intern(name: Text) -> int:
+        index = indices.get(name)
+        if index is None:
+            index = indices[name] = len(names)
+            names.append(name)
+        return index
+
+    interned = []
+    for event in events:
+        event = dict(event)
+        event_type = event.get("event")
+        event["event"] = intern(event_type)
+
+        if event_type == _ACTION_EVENT and isinstance(event.get("name"), str):
+            event["name"] = intern(event["name"])
+        elif event_type == _USER_EVENT:
+            parse_data = event.get("parse_data")
+            intent = parse_data.get("intent") if parse_data else None
+            if isinstance(intent, dict) and isinstance(intent.get("name"), str):
+                intent = dict(intent, name=intern(intent["name"]))
+                event["parse_data"] = dict(parse_data, intent=intent)
+
+        interned.append(event)
+
+    return names, interned
+
+
+def _restore_interned_events(
+    names: List[Text], events: List[Dict[Text, Any]]
+) -> List[Dict[Text, Any]]:
+    """Replace the name indices of `_intern_events` with the names."""
+
+    for event in events:
+        event_type = names[event["event"]]
+        event["event"] = event_type
+
+        if event_type == _ACTION_EVENT and isinstance(event.get("name"), int):
+            event["name"] = names[event["name"]]
+        elif event_type == _USER_EVENT:
+            parse_data = event.get("parse_data")
+            intent = parse_data.get("intent") if parse_data else None
+            if isinstance(intent, dict) and isinstance(intent.get("name"), int):
+                intent["name"] = names[intent["name"]]
+
+    return events
+
+
+def encode_dialogue(
+    dialogue: Dict[Text, Any],
+    compression_level: Optional[int] = DEFAULT_COMPRESSION_LEVEL,
+) -> bytes:
+    """Encode a serialised dialogue with the binary format.
+
+    The payload is packed with `msgpack` if it's installed and with json
+    otherwise.
+
+    Args:
+        dialogue: Dialogue as returned by `Dialogue.as_dict`.
+        compression_level: zlib compression level of the payload. `None` to
+            not compress the payload.
+
+    Returns:
+        The encoded dialogue.
+    """
+
+    names, events = _intern_events(dialogue.get("events", []))
+    payload = {"name": dialogue.get("name"), "names": names, "events": events}
+
+    msgpack = _msgpack()
+    if msgpack is not None:
+        codec = CODEC_MSGPACK
+        encoded = msgpack.packb(payload, use_bin_type=True)
+    else:
+        codec = CODEC_JSON
+        encoded = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+    is_compressed = compression_level is not None
+    if is_compressed:
+        encoded = zlib.compress(encoded, compression_level)
+
+    header = _HEADER.pack(BINARY_FORMAT_VERSION, codec, int(is_compressed))
+
+    return BINARY_FORMAT_PREFIX + header + encoded
+
+
+def decode_dialogue(serialised: bytes) -> Dict[Text, Any]:
+    """Decode a dialogue which was encoded with `encode_dialogue`.
+
+    Args:
+        serialised: The encoded dialogue.
+
+    Returns:
+        Dialogue in the format of `Dialogue.as_dict`.
+
+    Raises:
+        `TrackerSerialisationError` if the dialogue can't be decoded.
+    """
+
+    if not is_binary_dialogue(serialised):
+        raise TrackerSerialisationError(
+            "Serialised tracker doesn't use the binary format."
+        )
+
+    header_start = len(BINARY_FORMAT_PREFIX)
+    payload_start = header_start + _HEADER.size
+    version, codec, is_compressed = _HEADER.unpack(
+        serialised[header_start:payload_start]
+    )
+    if version > BINARY_FORMAT_VERSION:
+        raise TrackerSerialisationError(
+            f"Serialised tracker uses version {version} of the binary format, "
+            f"but only versions up to {BINARY_FORMAT_VERSION} are supported. "
+            f"Please update Rasa."
+        )
+
+    encoded = serialised[payload_start:]
+    if is_compressed:
+        encoded = zlib.decompress(encoded)
+
+    if codec == CODEC_MSGPACK:
+        msgpack = _msgpack()
+        if msgpack is None:
+            raise TrackerSerialisationError(
+                "Serialised tracker was packed with 'msgpack', which is not "
+                "installed. Please install it with `pip install msgpack`."
+            )
+        payload = msgpack.unpackb(encoded, raw=False)
+    elif codec == CODEC_JSON:
+        payload = json.loads(encoded.decode("utf-8"))
+    else:
+        raise TrackerSerialisationError(
+            f"Serialised tracker uses the unknown codec '{codec}'."
+        )
+
+    return {
+        "name": payload.get("name"),
+        "events": _restore_interned_events(
+            payload.get("names", []), payload.get("events", [])
+        ),
+    }
@@ -1,13 +1,29 @@
+import asyncio
 import contextlib
+import copy
+import hashlib
 import json
 import logging
 import os
 import pickle
+import threading
+import time
 import typing
 import warnings
+from collections import OrderedDict
 from datetime import datetime, timezone
 
-from typing import Iterator, Optional, Text, Iterable, Union, Dict, Callable, List
+from typing import (
+    Iterator,
+    Optional,
+    Text,
+    Iterable,
+    Union,
+    Dict,
+    Callable,
+    List,
+    Tuple,
+)
 
 import itertools
 from boto3.dynamodb.conditions import Key
@@ -15,11 +31,11 @@ from boto3.dynamodb.conditions import Key
 # noinspection PyPep8Naming
 from time import sleep
 
-from rasa.core import utils
+from rasa.core import jobs, utils
 from rasa.utils import common
 from rasa.core.actions.action import ACTION_LISTEN_NAME
 
-from rasa.core.events import SessionStarted
+from rasa.core.events import Event, SessionStarted
 
 
 from rasa.core.brokers.broker import EventBroker
@@ -27,8 +43,17 @@ from rasa.core.brokers.broker import EventBroker
 from rasa.core.conversation import Dialogue
 from rasa.core.domain import Domain
 from rasa.core.trackers import ActionExecuted, DialogueStateTracker, EventVerbosity
+from rasa.core.tracker_serialisation import (
+    SERIALISATION_FORMAT_BINARY,
+    SERIALISATION_FORMAT_JSON,
+    SERIALISATION_FORMATS,
+    decode_dialogue,
+    encode_dialogue,
+    is_binary_dialogue,
+)
 from rasa.utils.common import class_from_module_path
 from rasa.utils.endpoints import EndpointConfig
+from rasa.utils.io import DEFAULT_ENCODING
 
 if typing.TYPE_CHECKING:
     from sqlalchemy.engine.url import URL
@@ -38,10 +63,29 @@ if typing.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# maximum number of events in a DynamoDB item, items are limited to 400KB
+DEFAULT_DYNAMO_EVENTS_PER_ITEM = 100
+
+# stores without archive tables append completed sessions to this file
+DEFAULT_SESSION_ARCHIVE_DIRECTORY = "archived_sessions"
+SESSION_ARCHIVE_FILE_NAME = "archived_sessions.jsonl"
+# options of the session archival which can be set for every tracker store type
+SESSION_ARCHIVAL_OPTIONS = ("session_archival_interval", "session_archive_directory")
+
+# maximum number of SQL events which are archived in a single transaction
+SQL_ARCHIVAL_BATCH_SIZE = 1000
+
 
 class TrackerStore:
     """Class to hold all of the TrackerStore classes"""
 
+    # format which `encode_tracker` uses if the store doesn't configure one
+    serialisation_format = SERIALISATION_FORMAT_JSON
+    # seconds between runs of the session archival job, `None` to not archive
+    session_archival_interval: Optional[float] = None
+    # directory of the archive file for stores without archive tables
+    session_archive_directory: Text = DEFAULT_SESSION_ARCHIVE_DIRECTORY
+
     def __init__(
         self, domain: Optional[Domain], event_broker: Optional[EventBroker] = None
     ) -> None:
@@ -49,6 +93,22 @@ class TrackerStore:
         self.event_broker = event_broker
         self.max_event_history = None
 
+    def _set_serialisation_format(self, serialisation_format: Optional[Text]) -> None:
+        """Configure the format which is used to store trackers.
+
+        Args:
+            serialisation_format: Either `json` or `binary`. `None` to keep the
+                default format of the store.
+        """
+
+        serialisation_format = serialisation_format or self.serialisation_format
+        if serialisation_format not in SERIALISATION_FORMATS:
+            raise ValueError(
+                f"Unknown tracker serialisation format '{serialisation_format}'. "
+                f"Please use one of {list(SERIALISATION_FORMATS)}."
+            )
+        self.serialisation_format = serialisation_format
+
     @staticmethod
     def create(
         obj: Union["TrackerStore", EndpointConfig, None],
@@ -99,6 +159,8 @@ class TrackerStore:
             tracker = self.create_tracker(
                 sender_id, append_action_listen=append_action_listen
             )
+        else:
+            tracker.number_of_stored_events = len(tracker.events)
         return tracker
 
     def init_tracker(self, sender_id: Text) -> "DialogueStateTracker":
@@ -145,22 +207,185 @@ class TrackerStore:
 
     def stream_events(self, tracker: DialogueStateTracker) -> None:
         """Streams events to a message broker"""
-        offset = self.number_of_existing_events(tracker.sender_id)
+        offset = tracker.number_of_stored_events
+        if offset is None:
+            # the tracker wasn't retrieved from this tracker store
+            offset = self.number_of_existing_events(tracker.sender_id)
+
         events = tracker.events
         for event in list(itertools.islice(events, offset, len(events))):
             body = {"sender_id": tracker.sender_id}
             body.update(event.as_dict())
             self.event_broker.publish(body)
 
+        tracker.number_of_stored_events = len(events)
+
     def number_of_existing_events(self, sender_id: Text) -> int:
         """Return number of stored events for a given sender id."""
         old_tracker = self.retrieve(sender_id)
         return len(old_tracker.events) if old_tracker else 0
 
+    def _number_of_serialised_events(
+        self, sender_id: Text, serialised_tracker: Union[Text, bytes, None]
+    ) -> int:
+        """Count the events of a serialised tracker without recreating it."""
+
+        if serialised_tracker is None:
+            return 0
+
+        try:
+            if is_binary_dialogue(serialised_tracker):
+                events = decode_dialogue(serialised_tracker).get("events", [])
+            else:
+                events = json.loads(serialised_tracker).get("events", [])
+        except UnicodeDecodeError:
+            # pickled trackers have to be deserialised
+            tracker = self.deserialise_tracker(sender_id, serialised_tracker)
+            return len(tracker.events) if tracker else 0
+
+        if self.max_event_history is not None:
+            return min(len(events), self.max_event_history)
+        return len(events)
+
     def keys(self) -> Iterable[Text]:
         """Returns the set of values for the tracker store's primary key"""
         raise NotImplementedError()
 
+    def archive_completed_sessions(self) -> int:
+        """Move the events of completed sessions to cold storage.
+
+        A session is completed once a later session was started. Afterwards
+        the store only holds the latest session of every conversation.
+
+        Returns:
+            Number of archived events.
+        """
+        raise NotImplementedError()
+
+    @staticmethod
+    def _split_completed_sessions(events: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """Split serialised events at the latest `SessionStarted` event.
+
+        Returns:
+            The events of the completed sessions and the events since and
+            including the latest `SessionStarted` event.
+        """
+
+        for index in range(len(events) - 1, 0, -1):
+            if events[index].get("event") == SessionStarted.type_name:
+                return events[:index], events[index:]
+        return [], events
+
+    @staticmethod
+    def _decode_serialised_dialogue(
+        serialised_tracker: Union[Text, bytes]
+    ) -> Optional[Dict]:
+        """Decode a tracker which was serialised as json or binary dialogue.
+
+        Returns:
+            The serialised dialogue, `None` if the tracker was pickled.
+        """
+
+        try:
+            if is_binary_dialogue(serialised_tracker):
+                return decode_dialogue(serialised_tracker)
+            return json.loads(serialised_tracker)
+        except ValueError:
+            return None
+
+    def _encode_dialogue(self, dialogue: Dict) -> Union[Text, bytes]:
+        """Serialise a dialogue with the store's `serialisation_format`."""
+
+        if self.serialisation_format == SERIALISATION_FORMAT_BINARY:
+            return encode_dialogue(dialogue)
+        return json.dumps(dialogue)
+
+    def _split_serialised_tracker(
+        self, serialised_tracker: Union[Text, bytes, None]
+    ) -> Optional[Tuple[List[Dict], Union[Text, bytes]]]:
+        """Remove the completed sessions from a serialised tracker.
+
+        Returns:
+            The serialised events of the completed sessions and the tracker
+            without them, serialised with the store's `serialisation_format`.
+            `None` if the tracker doesn't have completed sessions.
+        """
+
+        if serialised_tracker is None:
+            return None
+
+        dialogue = self._decode_serialised_dialogue(serialised_tracker)
+        if dialogue is None:
+            # pickled trackers are archived once they were saved as json
+            return None
+
+        completed, events = self._split_completed_sessions(dialogue.get("events", []))
+        if not completed:
+            return None
+
+        return completed, self._encode_dialogue(dict(dialogue, events=events))
+
+    @staticmethod
+    def _has_completed_sessions(tracker: DialogueStateTracker) -> bool:
+        return any(
+            isinstance(event, SessionStarted)
+            for event in itertools.islice(tracker.events, 1, None)
+        )
+
+    def _encode_unarchived_tracker(
+        self, tracker: DialogueStateTracker, stored_tracker: Union[Text, bytes, None]
+    ) -> Union[Text, bytes]:
+        """Serialise a tracker without the sessions which were archived after
+        the tracker was retrieved.
+
+        Archived sessions must not be stored again, otherwise they are
+        archived twice.
+
+        Args:
+            tracker: The tracker which is saved.
+            stored_tracker: The serialised tracker which is currently stored.
+
+        Returns:
+            The tracker serialised with the store's `serialisation_format`.
+        """
+
+        if stored_tracker is None or not self._has_completed_sessions(tracker):
+            return self.encode_tracker(tracker)
+
+        stored_dialogue = self._decode_serialised_dialogue(stored_tracker) or {}
+        first_stored_event = (stored_dialogue.get("events") or [{}])[0]
+
+        dialogue = tracker.as_dialogue().as_dict()
+        if first_stored_event.get("event") == SessionStarted.type_name:
+            # the stored tracker starts with the session which was the latest
+            # one when the completed sessions were archived
+            session_start = first_stored_event.get("timestamp")
+            for index, event in enumerate(dialogue["events"]):
+                if (
+                    event.get("event") == SessionStarted.type_name
+                    and event.get("timestamp") == session_start
+                ):
+                    dialogue["events"] = dialogue["events"][index:]
+                    break
+
+        return self._encode_dialogue(dialogue)
+
+    def _open_session_archive(self) -> typing.TextIO:
+        """Open the file which completed sessions are appended to."""
+
+        os.makedirs(self.session_archive_directory, exist_ok=True)
+        return open(
+            os.path.join(self.session_archive_directory, SESSION_ARCHIVE_FILE_NAME),
+            "a",
+            encoding=DEFAULT_ENCODING,
+        )
+
+    @staticmethod
+    def _write_to_session_archive(
+        archive: typing.TextIO, sender_id: Text, events: List[Dict]
+    ) -> None:
+        archive.write(json.dumps({"sender_id": sender_id, "events": events}) + "\n")
+
     @staticmethod
     def serialise_tracker(tracker: DialogueStateTracker) -> Text:
         """Serializes the tracker, returns representation of the tracker."""
@@ -168,6 +393,14 @@ class TrackerStore:
 
         return json.dumps(dialogue.as_dict())
 
+    def encode_tracker(self, tracker: DialogueStateTracker) -> Union[Text, bytes]:
+        """Serialise the tracker with the store's `serialisation_format`."""
+
+        if self.serialisation_format == SERIALISATION_FORMAT_BINARY:
+            return encode_dialogue(tracker.as_dialogue().as_dict())
+
+        return self.serialise_tracker(tracker)
+
     @staticmethod
     def _deserialise_dialogue_from_pickle(
         sender_id: Text, serialised_tracker: bytes
@@ -191,7 +424,11 @@ class TrackerStore:
             return None
 
         try:
-            dialogue = Dialogue.from_parameters(json.loads(serialised_tracker))
+            if is_binary_dialogue(serialised_tracker):
+                parameters = decode_dialogue(serialised_tracker)
+            else:
+                parameters = json.loads(serialised_tracker)
+            dialogue = Dialogue.from_parameters(parameters)
         except UnicodeDecodeError:
             dialogue = self._deserialise_dialogue_from_pickle(
                 sender_id, serialised_tracker
@@ -205,18 +442,62 @@ class TrackerStore:
 class InMemoryTrackerStore(TrackerStore):
     """Stores conversation history in memory"""
 
+    # trackers in memory are only read by this store, hence they are compressed
+    serialisation_format = SERIALISATION_FORMAT_BINARY
+
     def __init__(
-        self, domain: Domain, event_broker: Optional[EventBroker] = None
+        self,
+        domain: Domain,
+        event_broker: Optional[EventBroker] = None,
+        serialisation_format: Optional[Text] = None,
+        max_conversations: Optional[int] = None,
+        conversation_ttl: Optional[float] = None,
+        spill_directory: Optional[Text] = None,
     ) -> None:
-        self.store = {}
+        """Create an in-memory tracker store.
+
+        Args:
+            domain: Domain of the assistant.
+            event_broker: Broker to stream the events of saved trackers to.
+            serialisation_format: Format of the stored trackers (`binary` or
+                `json`).
+            max_conversations: Maximum number of conversations which are kept.
+                The least recently used conversations are evicted first.
+                `None` for no limit.
+            conversation_ttl: Number of seconds after which a conversation
+                which wasn't used is evicted. `None` to keep conversations.
+            spill_directory: If set, conversations which are evicted because
+                of `max_conversations` are written to this directory instead
+                of being dropped. They are loaded from there when they are
+                used again.
+        """
+
+        # serialised trackers, least recently used first
+        self.store: "OrderedDict[Text, Union[Text, bytes]]" = OrderedDict()
+        self.max_conversations = max_conversations
+        self.conversation_ttl = conversation_ttl
+        self.spill_directory = spill_directory
+        self._last_used: Dict[Text, float] = {}
+        # completed sessions are archived in a thread
+        self._lock = threading.RLock()
+
+        if spill_directory:
+            os.makedirs(spill_directory, exist_ok=True)
+
+        self._set_serialisation_format(serialisation_format)
         super().__init__(domain, event_broker)
 
     def save(self, tracker: DialogueStateTracker) -> None:
         """Updates and saves the current conversation state"""
         if self.event_broker:
             self.stream_events(tracker)
-        serialised = InMemoryTrackerStore.serialise_tracker(tracker)
-        self.store[tracker.sender_id] = serialised
+
+        with self._lock:
+            serialised = self._encode_unarchived_tracker(
+                tracker, self.store.get(tracker.sender_id)
+            )
+            self._remove_spilled_tracker(tracker.sender_id)
+            self._store(tracker.sender_id, serialised)
 
     def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """
@@ -226,16 +507,160 @@ class InMemoryTrackerStore(TrackerStore):
         Returns:
             DialogueStateTracker
         """
-        if sender_id in self.store:
+        with self._lock:
+            serialised = self._serialised_tracker(sender_id)
+        if serialised is not None:
             logger.debug(f"Recreating tracker for id '{sender_id}'")
-            return self.deserialise_tracker(sender_id, self.store[sender_id])
+            return self.deserialise_tracker(sender_id, serialised)
         else:
             logger.debug(f"Creating a new tracker for id '{sender_id}'.")
             return None
 
+    def number_of_existing_events(self, sender_id: Text) -> int:
+        """Return number of stored events for a given sender id."""
+        with self._lock:
+            serialised = self._serialised_tracker(sender_id)
+        return self._number_of_serialised_events(sender_id, serialised)
+
     def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the Tracker Store in memory"""
-        return self.store.keys()
+        with self._lock:
+            self._evict_expired_conversations()
+            sender_ids = list(self.store.keys())
+
+        if not self.spill_directory:
+            return sender_ids
+
+        return sender_ids + [
+            sender_id
+            for sender_id in self._spilled_sender_ids()
+            if sender_id not in sender_ids
+        ]
+
+    def archive_completed_sessions(self) -> int:
+        """Append the events of completed sessions to a file in the
+        `session_archive_directory`.
+
+        The store is only locked while a conversation is replaced, hence the
+        archival can run in a thread while conversations are handled.
+        Conversations which were saved in the meantime are archived by the
+        next run. Conversations which were spilled to the `spill_directory`
+        are archived once they were loaded again.
+        """
+
+        with self._lock:
+            stored = list(self.store.items())
+
+        number_of_archived_events = 0
+        with self._open_session_archive() as archive:
+            for sender_id, serialised in stored:
+                split = self._split_serialised_tracker(serialised)
+                if split is None:
+                    continue
+
+                events, without_completed_sessions = split
+                with self._lock:
+                    if self.store.get(sender_id) is not serialised:
+                        continue
+                    # replacing the tracker doesn't mark it as recently used
+                    self.store[sender_id] = without_completed_sessions
+
+                self._write_to_session_archive(archive, sender_id, events)
+                number_of_archived_events += len(events)
+
+        return number_of_archived_events
+
+    def _serialised_tracker(self, sender_id: Text) -> Union[Text, bytes, None]:
+        """Get the stored tracker and mark it as recently used."""
+
+        self._evict_expired_conversations()
+
+        serialised = self.store.get(sender_id)
+        if serialised is None:
+            serialised = self._load_spilled_tracker(sender_id)
+            if serialised is None:
+                return None
+
+        self._store(sender_id, serialised)
+        return serialised
+
+    def _store(self, sender_id: Text, serialised: Union[Text, bytes]) -> None:
+        self.store[sender_id] = serialised
+        self.store.move_to_end(sender_id)
+        self._last_used[sender_id] = time.time()
+
+        if self.max_conversations is not None:
+            while len(self.store) > self.max_conversations:
+                evicted_id, evicted = self.store.popitem(last=False)
+                del self._last_used[evicted_id]
+                self._spill_tracker(evicted_id, evicted)
+
+    def _evict_expired_conversations(self) -> None:
+        if self.conversation_ttl is None:
+            return
+
+        expired_before = time.time() - self.conversation_ttl
+        # the least recently used conversations expire first
+        while self.store:
+            sender_id = next(iter(self.store))
+            if self._last_used[sender_id] > expired_before:
+                break
+            logger.debug(f"Evicting expired conversation '{sender_id}'.")
+            del self.store[sender_id]
+            del self._last_used[sender_id]
+
+    def _spill_path(self, sender_id: Text) -> Text:
+        file_name = hashlib.sha256(sender_id.encode(DEFAULT_ENCODING)).hexdigest()
+        return os.path.join(self.spill_directory, file_name)
+
+    def _spill_tracker(self, sender_id: Text, serialised: Union[Text, bytes]) -> None:
+        if not self.spill_directory:
+            logger.debug(
+                f"Evicting conversation '{sender_id}' since the maximum number of "
+                f"{self.max_conversations} conversations is reached."
+            )
+            return
+
+        if isinstance(serialised, str):
+            serialised = serialised.encode(DEFAULT_ENCODING)
+
+        # the first line holds the sender id, the serialised tracker follows
+        header = json.dumps(sender_id).encode(DEFAULT_ENCODING) + b"\n"
+        with open(self._spill_path(sender_id), "wb") as f:
+            f.write(header + serialised)
+
+    def _load_spilled_tracker(self, sender_id: Text) -> Optional[bytes]:
+        if not self.spill_directory:
+            return None
+
+        path = self._spill_path(sender_id)
+        if not os.path.exists(path):
+            return None
+
+        is_expired = (
+            self.conversation_ttl is not None
+            and os.path.getmtime(path) < time.time() - self.conversation_ttl
+        )
+        if not is_expired:
+            with open(path, "rb") as f:
+                f.readline()
+                serialised = f.read()
+
+        os.remove(path)
+
+        return None if is_expired else serialised
+
+    def _remove_spilled_tracker(self, sender_id: Text) -> None:
+        if self.spill_directory and sender_id not in self.store:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self._spill_path(sender_id))
+
+    def _spilled_sender_ids(self) -> List[Text]:
+        sender_ids = []
+        for file_name in os.listdir(self.spill_directory):
+            with open(os.path.join(self.spill_directory, file_name), "rb") as f:
+                sender_ids.append(json.loads(f.readline().decode(DEFAULT_ENCODING)))
+        return sender_ids
 
 
 class RedisTrackerStore(TrackerStore):
@@ -251,6 +676,7 @@ class RedisTrackerStore(TrackerStore):
         event_broker: Optional[EventBroker] = None,
         record_exp: Optional[float] = None,
         use_ssl: bool = False,
+        serialisation_format: Optional[Text] = None,
     ):
         import redis
 
@@ -258,6 +684,7 @@ class RedisTrackerStore(TrackerStore):
             host=host, port=port, db=db, password=password, ssl=use_ssl
         )
         self.record_exp = record_exp
+        self._set_serialisation_format(serialisation_format)
         super().__init__(domain, event_broker)
 
     def save(self, tracker, timeout=None):
@@ -268,8 +695,35 @@ class RedisTrackerStore(TrackerStore):
         if not timeout and self.record_exp:
             timeout = self.record_exp
 
-        serialised_tracker = self.serialise_tracker(tracker)
-        self.red.set(tracker.sender_id, serialised_tracker, ex=timeout)
+        if not self._has_completed_sessions(tracker):
+            serialised_tracker = self.encode_tracker(tracker)
+            self.red.set(tracker.sender_id, serialised_tracker, ex=timeout)
+            return
+
+        # the completed sessions might be archived while the tracker is saved
+        self._save_unarchived_tracker(tracker, timeout)
+
+    def _save_unarchived_tracker(
+        self, tracker: DialogueStateTracker, timeout: Optional[float]
+    ) -> None:
+        import redis
+
+        with self.red.pipeline() as pipeline:
+            while True:
+                try:
+                    pipeline.watch(tracker.sender_id)
+                    serialised_tracker = self._encode_unarchived_tracker(
+                        tracker, pipeline.get(tracker.sender_id)
+                    )
+                    pipeline.multi()
+                    pipeline.set(tracker.sender_id, serialised_tracker, ex=timeout)
+                    pipeline.execute()
+                    return
+                except redis.WatchError:
+                    logger.debug(
+                        f"Completed sessions of conversation '{tracker.sender_id}' "
+                        f"were archived while it was saved. Saving it again."
+                    )
 
     def retrieve(self, sender_id):
         """
@@ -285,13 +739,66 @@ class RedisTrackerStore(TrackerStore):
         else:
             return None
 
+    def number_of_existing_events(self, sender_id: Text) -> int:
+        """Return number of stored events for a given sender id."""
+        return self._number_of_serialised_events(sender_id, self.red.get(sender_id))
+
     def keys(self) -> Iterable[Text]:
         """Returns keys of the Redis Tracker Store"""
         return self.red.keys()
 
+    def archive_completed_sessions(self) -> int:
+        """Append the events of completed sessions to a file in the
+        `session_archive_directory`.
+
+        Every conversation is rewritten in a transaction which fails if the
+        conversation was saved in the meantime. Its completed sessions are
+        archived by the next run then. The events are only appended to the
+        archive once the transaction succeeded.
+        """
+        import redis
+
+        number_of_archived_events = 0
+        with self._open_session_archive() as archive:
+            for key in self.red.scan_iter():
+                sender_id = key.decode(DEFAULT_ENCODING)
+                with self.red.pipeline() as pipeline:
+                    try:
+                        pipeline.watch(key)
+                        split = self._split_serialised_tracker(pipeline.get(key))
+                        if split is None:
+                            continue
+
+                        events, serialised = split
+                        expires_in = pipeline.pttl(key)
+
+                        pipeline.multi()
+                        pipeline.set(
+                            key, serialised, px=expires_in if expires_in > 0 else None
+                        )
+                        pipeline.execute()
+                    except redis.WatchError:
+                        logger.debug(
+                            f"Conversation '{sender_id}' changed while its completed "
+                            f"sessions were archived. Trying again next time."
+                        )
+                        continue
+
+                self._write_to_session_archive(archive, sender_id, events)
+                number_of_archived_events += len(events)
+
+        return number_of_archived_events
+
 
 class DynamoTrackerStore(TrackerStore):
-    """Stores conversation history in DynamoDB"""
+    """Stores conversation history in DynamoDB
+
+    Every save adds items with only the new events of the conversation. The
+    items of a conversation are sorted by the time they were written
+    (`session_date`). Items which contain a `SessionStarted` event are
+    marked, so that retrieving a tracker only queries the items of the
+    latest session.
+    """
 
     def __init__(
         self,
@@ -299,6 +806,8 @@ class DynamoTrackerStore(TrackerStore):
         table_name: Text = "states",
         region: Text = "us-east-1",
         event_broker: Optional[EndpointConfig] = None,
+        serialisation_format: Optional[Text] = None,
+        max_events_per_item: int = DEFAULT_DYNAMO_EVENTS_PER_ITEM,
     ):
         """
         Args:
@@ -306,13 +815,20 @@ class DynamoTrackerStore(TrackerStore):
             table_name: The name of the DynamoDb table, does not
                 need to be present a priori.
             event_broker:
+            serialisation_format: `json` to store the events as attribute of
+                the item, `binary` to store the encoded events as binary
+                attribute.
+            max_events_per_item: Maximum number of events which are stored in
+                a single item. DynamoDB limits the size of items to 400KB.
         """
         import boto3
 
         self.client = boto3.client("dynamodb", region_name=region)
         self.region = region
         self.table_name = table_name
+        self.max_events_per_item = max_events_per_item
         self.db = self.get_or_create_table(table_name)
+        self._set_serialisation_format(serialisation_format)
         super().__init__(domain, event_broker)
 
     def get_or_create_table(
@@ -322,9 +838,9 @@ class DynamoTrackerStore(TrackerStore):
         import boto3
 
         dynamo = boto3.resource("dynamodb", region_name=self.region)
-        if self.table_name not in self.client.list_tables()["TableNames"]:
+        if table_name not in self.client.list_tables()["TableNames"]:
             table = dynamo.create_table(
-                TableName=self.table_name,
+                TableName=table_name,
                 KeySchema=[
                     {"AttributeName": "sender_id", "KeyType": "HASH"},
                     {"AttributeName": "session_date", "KeyType": "RANGE"},
@@ -341,45 +857,225 @@ class DynamoTrackerStore(TrackerStore):
         return dynamo.Table(table_name)
 
     def save(self, tracker):
-        """Saves the current conversation state"""
+        """Saves the new events of the conversation"""
         if self.event_broker:
             self.stream_events(tracker)
-        self.db.put_item(Item=self.serialise_tracker(tracker))
+
+        latest_item = self._latest_item(tracker.sender_id)
+        number_of_stored_events = self._number_of_session_events(latest_item)
+        new_events = list(
+            itertools.islice(tracker.events, number_of_stored_events, None)
+        )
+        if not new_events:
+            return
+
+        sort_key = int(time.time() * 1000)
+        if latest_item is not None:
+            # keep the order if items are written within the same millisecond
+            sort_key = max(sort_key, int(latest_item["session_date"]) + 1)
+
+        # `batch_writer` sends the items with `BatchWriteItem` requests
+        with self.db.batch_writer() as batch:
+            for offset in range(0, len(new_events), self.max_events_per_item):
+                chunk = new_events[offset : offset + self.max_events_per_item]
+                item = self._item_for_events(
+                    tracker.sender_id, sort_key, chunk, number_of_stored_events
+                )
+                batch.put_item(Item=item)
+
+                number_of_stored_events = item["number_of_session_events"]
+                sort_key += 1
+
+    def _item_for_events(
+        self,
+        sender_id: Text,
+        sort_key: int,
+        events: List[Event],
+        number_of_stored_events: int,
+    ) -> Dict:
+        """Create the item which stores `events` of a conversation."""
+
+        item = {"sender_id": sender_id, "session_date": sort_key}
+
+        session_start_index = None
+        for index, event in enumerate(events):
+            if isinstance(event, SessionStarted):
+                session_start_index = index
+
+        if session_start_index is None:
+            item["number_of_session_events"] = number_of_stored_events + len(events)
+        else:
+            item["session_start_index"] = session_start_index
+            item["number_of_session_events"] = len(events) - session_start_index
+
+        serialised_events = [e.as_dict() for e in events]
+        if self.serialisation_format == SERIALISATION_FORMAT_BINARY:
+            item["dialogue"] = encode_dialogue(
+                {"name": sender_id, "events": serialised_events}
+            )
+        else:
+            item["events"] = utils.replace_floats_with_decimals(serialised_events)
+
+        return item
 
     def serialise_tracker(self, tracker: "DialogueStateTracker") -> Dict:
         """Serializes the tracker, returns object with decimal types"""
+        item = {
+            "sender_id": tracker.sender_id,
+            "session_date": int(datetime.now(tz=timezone.utc).timestamp()),
+        }
+        if self.serialisation_format == SERIALISATION_FORMAT_BINARY:
+            item["dialogue"] = encode_dialogue(tracker.as_dialogue().as_dict())
+            return item
+
         d = tracker.as_dialogue().as_dict()
-        d.update(
-            {
-                "sender_id": tracker.sender_id,
-                "session_date": int(datetime.now(tz=timezone.utc).timestamp()),
-            }
-        )
+        d.update(item)
         return utils.replace_floats_with_decimals(d)
 
-    def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
-        """Create a tracker from all previously stored events."""
+    @staticmethod
+    def _is_session_start(item: Dict) -> bool:
+        # items without event counts hold the whole tracker (stored by
+        # previous versions)
+        return "session_start_index" in item or "number_of_session_events" not in item
+
+    @staticmethod
+    def _events_of_item(item: Dict) -> List[Dict]:
+        encoded_dialogue = item.get("dialogue")
+        if encoded_dialogue is not None:
+            # binary attributes are returned as `boto3.dynamodb.types.Binary`
+            return decode_dialogue(encoded_dialogue.value).get("events", [])
 
-        # Retrieve dialogues for a sender_id in reverse chronological order based on
-        # the session_date sort key
-        dialogues = self.db.query(
+        return item.get("events", [])
+
+    def _number_of_session_events(self, item: Optional[Dict]) -> int:
+        if item is None:
+            return 0
+
+        if "number_of_session_events" in item:
+            return int(item["number_of_session_events"])
+
+        return len(self._events_since_last_session_start(self._events_of_item(item)))
+
+    @staticmethod
+    def _events_since_last_session_start(events: List[Dict]) -> List[Dict]:
+        for index in range(len(events) - 1, -1, -1):
+            if events[index].get("event") == SessionStarted.type_name:
+                return events[index:]
+        return events
+
+    def _latest_item(self, sender_id: Text) -> Optional[Dict]:
+        items = self.db.query(
             KeyConditionExpression=Key("sender_id").eq(sender_id),
             Limit=1,
             ScanIndexForward=False,
         )["Items"]
-        if dialogues:
-            return DialogueStateTracker.from_dict(
-                sender_id, dialogues[0].get("events"), self.domain.slots
-            )
-        else:
+
+        return items[0] if items else None
+
+    def _items_of_latest_session(self, sender_id: Text) -> List[Dict]:
+        """Query the items of the latest session in chronological order."""
+
+        items = []
+        query = {
+            "KeyConditionExpression": Key("sender_id").eq(sender_id),
+            "ScanIndexForward": False,
+        }
+        while True:
+            response = self.db.query(**query)
+            for item in response["Items"]:
+                items.append(item)
+                if self._is_session_start(item):
+                    return list(reversed(items))
+
+            if "LastEvaluatedKey" not in response:
+                return list(reversed(items))
+            query["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def _items_before(self, sender_id: Text, session_date: int) -> List[Dict]:
+        """Query the items of a conversation which were written before
+        `session_date`."""
+
+        items = []
+        query = {
+            "KeyConditionExpression": Key("sender_id").eq(sender_id)
+            & Key("session_date").lt(session_date)
+        }
+        while True:
+            response = self.db.query(**query)
+            items.extend(response["Items"])
+
+            if "LastEvaluatedKey" not in response:
+                return items
+            query["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        """Create a tracker from the events of the latest session."""
+
+        items = self._items_of_latest_session(sender_id)
+        if not items:
             return None
 
+        first_item = items[0]
+        events = self._events_of_item(first_item)
+        if "session_start_index" in first_item:
+            events = events[int(first_item["session_start_index"]) :]
+        elif "number_of_session_events" not in first_item:
+            events = self._events_since_last_session_start(events)
+
+        for item in items[1:]:
+            events.extend(self._events_of_item(item))
+
+        return DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
+
+    def number_of_existing_events(self, sender_id: Text) -> int:
+        """Return number of stored events for a given sender id."""
+        return self._number_of_session_events(self._latest_item(sender_id))
+
     def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the DynamoTrackerStore"""
-        return [
+        # conversations are stored in multiple items
+        sender_ids = (
             i["sender_id"]
             for i in self.db.scan(ProjectionExpression="sender_id")["Items"]
-        ]
+        )
+        return list(OrderedDict.fromkeys(sender_ids))
+
+    def archive_completed_sessions(self) -> int:
+        """Move the items of completed sessions to the `<table_name>_archive`
+        table.
+
+        Items are never changed once they were written, hence they are copied
+        to the archive table before they are deleted.
+        """
+
+        archive = self.get_or_create_table(f"{self.table_name}_archive")
+
+        number_of_archived_events = 0
+        for sender_id in self.keys():
+            items_of_latest_session = self._items_of_latest_session(sender_id)
+            if not items_of_latest_session:
+                continue
+
+            items = self._items_before(
+                sender_id, items_of_latest_session[0]["session_date"]
+            )
+            if not items:
+                continue
+
+            with archive.batch_writer() as batch:
+                for item in items:
+                    batch.put_item(Item=item)
+
+            with self.db.batch_writer() as batch:
+                for item in items:
+                    key = {"sender_id": sender_id, "session_date": item["session_date"]}
+                    batch.delete_item(Key=key)
+
+            number_of_archived_events += sum(
+                len(self._events_of_item(item)) for item in items
+            )
+
+        return number_of_archived_events
 
 
 class MongoTrackerStore(TrackerStore):
@@ -442,19 +1138,85 @@ class MongoTrackerStore(TrackerStore):
         if self.event_broker:
             self.stream_events(tracker)
 
-        additional_events = self._additional_events(tracker)
+        # the counts change if completed sessions are archived in the meantime
+        while not self._save_additional_events(tracker):
+            logger.debug(
+                f"Completed sessions of conversation '{tracker.sender_id}' were "
+                f"archived while it was saved. Saving it again."
+            )
+
+    def _save_additional_events(self, tracker: DialogueStateTracker) -> bool:
+        """Push the events which aren't stored yet.
+
+        Returns:
+            `False` if the stored event counts changed after they were read.
+        """
+
+        number_of_events, session_start_index = self._event_counts(tracker.sender_id)
+        additional_events = list(
+            itertools.islice(
+                tracker.events, number_of_events - session_start_index, None
+            )
+        )
+
+        for offset, event in enumerate(additional_events):
+            if isinstance(event, SessionStarted):
+                session_start_index = number_of_events + offset
+
+        state = self._current_tracker_state_without_events(tracker)
+        state.update(
+            {
+                "number_of_events": number_of_events + len(additional_events),
+                "session_start_index": session_start_index,
+            }
+        )
+
+        conversation = {"sender_id": tracker.sender_id}
+        if number_of_events:
+            # conversations stored by previous versions don't have counts
+            conversation["number_of_events"] = {"$in": [number_of_events, None]}
 
-        self.conversations.update_one(
-            {"sender_id": tracker.sender_id},
+        result = self.conversations.update_one(
+            conversation,
             {
-                "$set": self._current_tracker_state_without_events(tracker),
+                "$set": state,
                 "$push": {
                     "events": {"$each": [e.as_dict() for e in additional_events]}
                 },
             },
-            upsert=True,
+            upsert=not number_of_events,
+        )
+
+        return result.matched_count > 0 or not number_of_events
+
+    def _event_counts(self, sender_id: Text) -> Tuple[int, int]:
+        """Return the number of stored events and the index of the latest
+        `SessionStarted` event (`0` if there is none).
+
+        Both are stored next to the events, so the events don't have to be
+        read. Conversations which were stored before are counted once.
+        """
+
+        stored = self.conversations.find_one(
+            {"sender_id": sender_id},
+            projection={"number_of_events": True, "session_start_index": True},
+        )
+        if stored is None:
+            return 0, 0
+
+        if "number_of_events" in stored:
+            return stored["number_of_events"], stored.get("session_start_index", 0)
+
+        stored = self.conversations.find_one(
+            {"sender_id": sender_id}, projection={"events": True}
+        )
+        number_of_events = len(stored.get("events", []))
+        session_start_index = number_of_events - len(
+            self._events_since_last_session_start(stored)
         )
 
+        return number_of_events, session_start_index
+
     def _additional_events(self, tracker: DialogueStateTracker) -> Iterator:
         """Return events from the tracker which aren't currently stored.
 
@@ -466,10 +1228,8 @@ class MongoTrackerStore(TrackerStore):
 
         """
 
-        stored = self.conversations.find_one({"sender_id": tracker.sender_id}) or {}
-        number_events_since_last_session = len(
-            self._events_since_last_session_start(stored)
-        )
+        number_of_events, session_start_index = self._event_counts(tracker.sender_id)
+        number_events_since_last_session = number_of_events - session_start_index
 
         return itertools.islice(
             tracker.events, number_events_since_last_session, len(tracker.events)
@@ -496,6 +1256,40 @@ class MongoTrackerStore(TrackerStore):
 
         return list(reversed(events))
 
+    def _retrieve_events_of_latest_session(
+        self, sender_id: Text
+    ) -> Optional[List[Dict]]:
+        """Read only the events since the latest `SessionStarted` event.
+
+        Returns:
+            The serialised events or `None` if the conversation isn't stored.
+        """
+
+        stored = self.conversations.find_one(
+            {"sender_id": sender_id},
+            projection={"number_of_events": True, "session_start_index": True},
+        )
+        if stored is None:
+            return None
+
+        if "number_of_events" not in stored:
+            # conversation was stored before the event counts were added
+            stored = self.conversations.find_one(
+                {"sender_id": sender_id}, projection={"events": True}
+            )
+            return self._events_since_last_session_start(stored)
+
+        session_start_index = stored.get("session_start_index", 0)
+        number_of_events = stored["number_of_events"] - session_start_index
+        if number_of_events <= 0:
+            return []
+
+        stored = self.conversations.find_one(
+            {"sender_id": sender_id},
+            projection={"events": {"$slice": [session_start_index, number_of_events]}},
+        )
+        return stored.get("events", []) if stored else []
+
     def retrieve(self, sender_id):
         """
         Args:
@@ -504,29 +1298,95 @@ class MongoTrackerStore(TrackerStore):
         Returns:
             `DialogueStateTracker`
         """
-        stored = self.conversations.find_one({"sender_id": sender_id})
+        events = self._retrieve_events_of_latest_session(sender_id)
 
         # look for conversations which have used an `int` sender_id in the past
         # and update them.
-        if stored is None and sender_id.isdigit():
-            from pymongo import ReturnDocument
-
-            stored = self.conversations.find_one_and_update(
-                {"sender_id": int(sender_id)},
-                {"$set": {"sender_id": str(sender_id)}},
-                return_document=ReturnDocument.AFTER,
+        if events is None and sender_id.isdigit():
+            self.conversations.update_one(
+                {"sender_id": int(sender_id)}, {"$set": {"sender_id": str(sender_id)}}
             )
+            events = self._retrieve_events_of_latest_session(sender_id)
 
-        if stored is not None:
-            events = self._events_since_last_session_start(stored)
+        if events is not None:
             return DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
         else:
             return None
 
+    def number_of_existing_events(self, sender_id: Text) -> int:
+        """Return number of stored events for a given sender id."""
+        number_of_events, session_start_index = self._event_counts(sender_id)
+        return number_of_events - session_start_index
+
     def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the Mongo Tracker Store"""
         return [c["sender_id"] for c in self.conversations.find()]
 
+    @property
+    def archived_conversations(self):
+        """Returns the collection with the completed sessions"""
+        return self.db[f"{self.collection}_archive"]
+
+    def archive_completed_sessions(self) -> int:
+        """Move the events of completed sessions to the `<collection>_archive`
+        collection.
+
+        Every run adds a document with the archived events of a conversation.
+        Conversations which were stored by previous versions are archived once
+        they were saved again.
+        """
+
+        number_of_archived_events = 0
+        conversations = self.conversations.find(
+            {"session_start_index": {"$gt": 0}},
+            projection={
+                "sender_id": True,
+                "number_of_events": True,
+                "session_start_index": True,
+            },
+        )
+        for counts in conversations:
+            sender_id = counts["sender_id"]
+            number_of_events = counts["number_of_events"]
+            session_start_index = counts["session_start_index"]
+
+            # only read the events of the completed sessions
+            stored = self.conversations.find_one(
+                {"sender_id": sender_id, "number_of_events": number_of_events},
+                projection={"events": {"$slice": [0, session_start_index]}},
+            )
+            if stored is None:
+                continue
+
+            events = stored.get("events", [])
+            archived = self.archived_conversations.insert_one(
+                {"sender_id": sender_id, "events": events}
+            )
+
+            # only keep the latest session if the conversation didn't change
+            result = self.conversations.update_one(
+                {"sender_id": sender_id, "number_of_events": number_of_events},
+                {
+                    "$push": {
+                        "events": {
+                            "$each": [],
+                            "$slice": session_start_index - number_of_events,
+                        }
+                    },
+                    "$set": {
+                        "number_of_events": number_of_events - session_start_index,
+                        "session_start_index": 0,
+                    },
+                },
+            )
+            if not result.matched_count:
+                self.archived_conversations.delete_one({"_id": archived.inserted_id})
+                continue
+
+            number_of_archived_events += len(events)
+
+        return number_of_archived_events
+
 
 class SQLTrackerStore(TrackerStore):
     """Store which can save and retrieve trackers from an SQL database."""
@@ -550,6 +1410,22 @@ class SQLTrackerStore(TrackerStore):
         action_name = Column(String(255))
         data = Column(Text)
 
+    class SQLArchivedEvent(Base):
+        """Represents an event of a completed session in the SQL Tracker Store"""
+
+        from sqlalchemy import Column, Integer, String, Float, Text
+
+        __tablename__ = "events_archive"
+
+        # the id of the event in the `events` table
+        id = Column(Integer, primary_key=True, autoincrement=False)
+        sender_id = Column(String(255), nullable=False, index=True)
+        type_name = Column(String(255), nullable=False)
+        timestamp = Column(Float)
+        intent_name = Column(String(255))
+        action_name = Column(String(255))
+        data = Column(Text)
+
     def __init__(
         self,
         domain: Optional[Domain] = None,
@@ -744,6 +1620,11 @@ class SQLTrackerStore(TrackerStore):
                 )
                 return None
 
+    def number_of_existing_events(self, sender_id: Text) -> int:
+        """Return number of stored events for a given sender id."""
+        with self.session_scope() as session:
+            return self._event_query(session, sender_id).count()
+
     def _event_query(self, session: "Session", sender_id: Text) -> "Query":
         """Provide the query to retrieve the conversation events for a specific sender.
 
@@ -780,6 +1661,77 @@ class SQLTrackerStore(TrackerStore):
             .order_by(self.SQLEvent.timestamp)
         )
 
+    def _completed_session_event_query(self, session: "Session") -> "Query":
+        """Provide the query to retrieve the ids of the events of all
+        conversations which happened before their latest `SessionStarted` event."""
+        import sqlalchemy as sa
+
+        # Subquery to find the timestamp of the latest `SessionStarted` event of
+        # every conversation
+        session_start_sub_query = (
+            session.query(
+                self.SQLEvent.sender_id,
+                sa.func.max(self.SQLEvent.timestamp).label("session_start"),
+            )
+            .filter(self.SQLEvent.type_name == SessionStarted.type_name)
+            .group_by(self.SQLEvent.sender_id)
+            .subquery()
+        )
+
+        return (
+            session.query(self.SQLEvent.id)
+            .join(
+                session_start_sub_query,
+                sa.and_(
+                    self.SQLEvent.sender_id == session_start_sub_query.c.sender_id,
+                    self.SQLEvent.timestamp < session_start_sub_query.c.session_start,
+                ),
+            )
+            .order_by(self.SQLEvent.id)
+        )
+
+    def archive_completed_sessions(self) -> int:
+        """Move the events of completed sessions to the `events_archive` table.
+
+        The events are moved with `INSERT ... SELECT` and `DELETE` statements,
+        `SQL_ARCHIVAL_BATCH_SIZE` events per transaction.
+        """
+        import sqlalchemy.exc
+
+        events = self.SQLEvent.__table__
+        archived_events = self.SQLArchivedEvent.__table__
+        columns = [column.name for column in events.columns]
+
+        number_of_archived_events = 0
+        with self.session_scope() as session:
+            while True:
+                event_ids = [
+                    event_id
+                    for (event_id,) in self._completed_session_event_query(
+                        session
+                    ).limit(SQL_ARCHIVAL_BATCH_SIZE)
+                ]
+                if not event_ids:
+                    break
+
+                try:
+                    session.execute(
+                        archived_events.insert().from_select(
+                            columns, events.select().where(events.c.id.in_(event_ids))
+                        )
+                    )
+                    session.execute(events.delete().where(events.c.id.in_(event_ids)))
+                    session.commit()
+                except sqlalchemy.exc.IntegrityError as e:
+                    # the events are archived by another process at the same time
+                    session.rollback()
+                    logger.warning(f"Stopped archiving completed sessions: {e}")
+                    break
+
+                number_of_archived_events += len(event_ids)
+
+        return number_of_archived_events
+
     def save(self, tracker: DialogueStateTracker) -> None:
         """Update database with events from the current conversation."""
 
@@ -900,6 +1852,17 @@ class FailSafeTrackerStore(TrackerStore):
             self.on_tracker_store_error(e)
             self.fallback_tracker_store.save(tracker)
 
+    @property
+    def session_archival_interval(self) -> Optional[float]:
+        return self._tracker_store.session_archival_interval
+
+    @session_archival_interval.setter
+    def session_archival_interval(self, interval: Optional[float]) -> None:
+        self._tracker_store.session_archival_interval = interval
+
+    def archive_completed_sessions(self) -> int:
+        return self._tracker_store.archive_completed_sessions()
+
 
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig] = None,
@@ -910,9 +1873,24 @@ def _create_from_endpoint_config(
 
     domain = domain or Domain.empty()
 
+    session_archival_options = {}
+    if endpoint_config is not None:
+        # the session archival is configured the same way for every store type
+        kwargs = dict(endpoint_config.kwargs)
+        for option in SESSION_ARCHIVAL_OPTIONS:
+            if option in kwargs:
+                session_archival_options[option] = kwargs.pop(option)
+
+        endpoint_config = copy.copy(endpoint_config)
+        endpoint_config.kwargs = kwargs
+
     if endpoint_config is None or endpoint_config.type is None:
         # default tracker store if no type is set
         tracker_store = InMemoryTrackerStore(domain, event_broker)
+    elif endpoint_config.type.lower() == "in_memory":
+        tracker_store = InMemoryTrackerStore(
+            domain=domain, event_broker=event_broker, **endpoint_config.kwargs
+        )
     elif endpoint_config.type.lower() == "redis":
         tracker_store = RedisTrackerStore(
             domain=domain,
@@ -941,6 +1919,9 @@ def _create_from_endpoint_config(
     else:
         tracker_store = _load_from_module_string(domain, endpoint_config, event_broker)
 
+    for option, value in session_archival_options.items():
+        setattr(tracker_store, option, value)
+
     logger.debug(f"Connected to {tracker_store.__class__.__name__}.")
 
     return tracker_store
@@ -984,3 +1965,51 @@ def _load_from_module_string(
             f"Using `InMemoryTrackerStore` instead."
         )
         return InMemoryTrackerStore(domain)
+
+
+async def _run_session_archival_worker(tracker_store: TrackerStore) -> None:
+    # noinspection PyBroadException
+    try:
+        number_of_events = await asyncio.get_event_loop().run_in_executor(
+            None, tracker_store.archive_completed_sessions
+        )
+        logger.debug(f"Archived {number_of_events} events of completed sessions.")
+    except asyncio.CancelledError:
+        logger.warning("Stopping session archival (cancelled).")
+    except Exception:
+        logger.exception(
+            "An exception was raised while archiving completed sessions. "
+            "Continuing anyways..."
+        )
+
+
+async def schedule_session_archival(tracker_store: TrackerStore) -> None:
+    """Regularly archive the completed sessions of `tracker_store`.
+
+    The archival runs every `session_archival_interval` seconds of the store.
+    Nothing is scheduled if the interval isn't set.
+    """
+
+    if not tracker_store.session_archival_interval:
+        return
+
+    store_type = type(tracker_store)
+    if isinstance(tracker_store, FailSafeTrackerStore):
+        # the wrapper forwards the archival to the wrapped tracker store
+        store_type = type(tracker_store._tracker_store)
+
+    if store_type.archive_completed_sessions is TrackerStore.archive_completed_sessions:
+        logger.warning(
+            f"'{store_type.__name__}' doesn't support archiving completed "
+            f"sessions. Completed sessions will stay in the tracker store."
+        )
+        return
+
+    (await jobs.scheduler()).add_job(
+        _run_session_archival_worker,
+        "interval",
+        seconds=tracker_store.session_archival_interval,
+        args=[tracker_store],
+        id="archive-completed-sessions",
+        replace_existing=True,
+    )
@@ -122,6 +122,9 @@ class DialogueStateTracker:
         self.events = self._create_events([])
         # id of the source of the messages
         self.sender_id = sender_id
+        # number of events which the tracker store already knows about (and
+        # streamed to the event broker), `None` if that is unknown
+        self.number_of_stored_events = None
         # slots that can be filled in this domain
         if slots is not None:
             self.slots = {slot.name: copy.deepcopy(slot) for slot in slots}
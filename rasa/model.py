@@ -1,11 +1,13 @@
 import glob
+import hashlib
 import logging
 import os
 import shutil
 import tempfile
 import typing
+from functools import partial
 from pathlib import Path
-from typing import Text, Tuple, Union, Optional, List, Dict, NamedTuple
+from typing import Callable, Text, Tuple, Union, Optional, List, Dict, NamedTuple
 
 import rasa.utils.io
 from rasa.cli.utils import print_success, create_output_path
@@ -16,12 +18,19 @@ from rasa.constants import (
     CONFIG_MANDATORY_KEYS,
     DEFAULT_DOMAIN_PATH,
     DEFAULT_CORE_SUBDIRECTORY_NAME,
+    ENV_MODEL_CACHE_DIRECTORY,
 )
 
 from rasa.core.utils import get_dict_hash
 from rasa.exceptions import ModelNotFound
 from rasa.utils.common import TempDirectoryPath
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # e.g. on Windows, cached models are never evicted there
+    fcntl = None
+
 if typing.TYPE_CHECKING:
     from rasa.importers.importer import TrainingDataImporter
 
@@ -44,6 +53,16 @@ FINGERPRINT_STORIES_KEY = "stories"
 FINGERPRINT_NLU_DATA_KEY = "messages"
 FINGERPRINT_TRAINED_AT_KEY = "trained_at"
 
+# models are packaged as gzip compressed tar files by default, uncompressed tar
+# files are faster to unpack
+MODEL_ARCHIVE_EXTENSIONS = (".tar.gz", ".tar")
+
+# unpacked models are cached in this directory unless the environment variable
+# `RASA_MODEL_CACHE_DIRECTORY` points to another directory
+DEFAULT_MODEL_CACHE_DIRECTORY = os.path.join(tempfile.gettempdir(), "rasa-models")
+# number of unpacked models which are kept in the cache
+DEFAULT_MAX_CACHED_MODELS = 5
+
 
 class Section(NamedTuple):
     """Defines relevant fingerprint sections which are used to decide whether a model
@@ -75,6 +94,37 @@ SECTION_NLU = Section(
 SECTION_NLG = Section(name="NLG templates", relevant_keys=[FINGERPRINT_NLG_KEY])
 
 
+class CachedModelPath(TempDirectoryPath):
+    """Represents a path to a model in the cache of unpacked models.
+
+    The directory is shared by everyone who loads the same model, hence it
+    is kept when used as a context manager. The model isn't evicted from the
+    cache as long as this path is referenced, e.g. as model directory of an
+    agent.
+    """
+
+    def __exit__(self, *args) -> bool:
+        return False
+
+    def acquire(self) -> bool:
+        """Protect the model from being evicted from the cache.
+
+        Returns:
+            `False` if the model was evicted before it could be protected.
+
+        """
+
+        if fcntl is not None:
+            self._lock_file_descriptor = _lock_cached_model(self)
+        return os.path.isdir(self)
+
+    def __del__(self) -> None:
+        file_descriptor = getattr(self, "_lock_file_descriptor", None)
+        if file_descriptor is not None:
+            # closing the lock file releases the lock
+            os.close(file_descriptor)
+
+
 class FingerprintComparisonResult:
     def __init__(
         self,
@@ -117,13 +167,18 @@ class FingerprintComparisonResult:
         return self.force_training or self.nlu
 
 
-def get_model(model_path: Text = DEFAULT_MODELS_PATH) -> TempDirectoryPath:
+def get_model(
+    model_path: Text = DEFAULT_MODELS_PATH, use_cache: bool = False
+) -> TempDirectoryPath:
     """Get a model and unpack it. Raises a `ModelNotFound` exception if
     no model could be found at the provided path.
 
     Args:
         model_path: Path to the zipped model. If it's a directory, the latest
                     trained model is returned.
+        use_cache: If `True` the model is unpacked into the cache of unpacked
+                   models (or taken from it if it was unpacked before). The
+                   unpacked model must not be modified in this case.
 
     Returns:
         Path to the unpacked model.
@@ -140,9 +195,12 @@ def get_model(model_path: Text = DEFAULT_MODELS_PATH) -> TempDirectoryPath:
             raise ModelNotFound(
                 f"Could not find any Rasa model files in '{model_path}'."
             )
-    elif not model_path.endswith(".tar.gz"):
+    elif not model_path.endswith(MODEL_ARCHIVE_EXTENSIONS):
         raise ModelNotFound(f"Path '{model_path}' does not point to a Rasa model file.")
 
+    if use_cache:
+        return unpack_model_to_cache(model_path)
+
     return unpack_model(model_path)
 
 
@@ -159,7 +217,11 @@ def get_latest_model(model_path: Text = DEFAULT_MODELS_PATH) -> Optional[Text]:
     if not os.path.exists(model_path) or os.path.isfile(model_path):
         model_path = os.path.dirname(model_path)
 
-    list_of_files = glob.glob(os.path.join(model_path, "*.tar.gz"))
+    list_of_files = [
+        file_name
+        for extension in MODEL_ARCHIVE_EXTENSIONS
+        for file_name in glob.glob(os.path.join(model_path, "*" + extension))
+    ]
 
     if len(list_of_files) == 0:
         return None
@@ -181,21 +243,226 @@ def unpack_model(
         Path to unpacked Rasa model.
 
     """
-    import tarfile
 
     if working_directory is None:
         working_directory = tempfile.mkdtemp()
 
+    _extract_model(model_file, working_directory)
+
+    return TempDirectoryPath(working_directory)
+
+
+def _extract_model(model_file: Text, working_directory: Union[Path, Text]) -> None:
+    import tarfile
+
     # All files are in a subdirectory.
     try:
-        with tarfile.open(model_file, mode="r:gz") as tar:
+        # detects whether the archive is compressed
+        with tarfile.open(model_file, mode="r:*") as tar:
             tar.extractall(working_directory)
             logger.debug(f"Extracted model to '{working_directory}'.")
     except Exception as e:
         logger.error(f"Failed to extract model at {model_file}. Error: {e}")
         raise
 
-    return TempDirectoryPath(working_directory)
+
+def model_cache_directory() -> Text:
+    """Directory in which unpacked models are cached."""
+
+    return os.environ.get(ENV_MODEL_CACHE_DIRECTORY) or DEFAULT_MODEL_CACHE_DIRECTORY
+
+
+def is_cached_model(model_directory: Optional[Text]) -> bool:
+    """Check whether a directory is part of the cache of unpacked models."""
+
+    if not model_directory:
+        return False
+
+    parent_directory = os.path.dirname(os.path.abspath(model_directory))
+    return parent_directory == os.path.abspath(model_cache_directory())
+
+
+def _cached_model_path(cache_key: Text) -> Text:
+    directory_name = hashlib.md5(cache_key.encode("utf-8")).hexdigest()
+    return os.path.join(model_cache_directory(), directory_name)
+
+
+def _lock_cached_model(model_directory: Text, exclusive: bool = False) -> Optional[int]:
+    """Lock a model in the cache of unpacked models.
+
+    Everyone who uses a cached model holds a shared lock on it. Models are only
+    evicted by someone who holds the exclusive lock, hence models which are in
+    use are never evicted.
+
+    Args:
+        model_directory: Path to the cached model.
+        exclusive: If `True` the lock is acquired exclusively. Otherwise a
+                   shared lock is acquired, which waits for an exclusive lock
+                   to be released.
+
+    Returns:
+        File descriptor of the lock file, closing it releases the lock. `None`
+        if an exclusive lock could not be acquired since the model is in use.
+
+    """
+
+    # the lock file is kept when the model is evicted, otherwise a model which
+    # is cached again could be locked through a removed lock file
+    directory, name = os.path.split(model_directory)
+    lock_file = os.path.join(directory, f".{name}.lock")
+    file_descriptor = os.open(lock_file, os.O_RDWR | os.O_CREAT)
+
+    operation = fcntl.LOCK_EX | fcntl.LOCK_NB if exclusive else fcntl.LOCK_SH
+    try:
+        fcntl.flock(file_descriptor, operation)
+    except OSError:
+        os.close(file_descriptor)
+        return None
+
+    return file_descriptor
+
+
+def _model_archive_cache_key(model_file: Text) -> Text:
+    """Identify a model archive without unpacking it.
+
+    Models store their fingerprint as first file of the archive, hence only
+    the beginning of the archive has to be decompressed to read it. Models
+    which were packaged differently are identified by their location, size
+    and modification time."""
+
+    import tarfile
+
+    try:
+        with tarfile.open(model_file, mode="r|*") as tar:
+            member = tar.next()
+            if member is not None and member.name == FINGERPRINT_FILE_PATH:
+                return tar.extractfile(member).read().decode("utf-8")
+    except (tarfile.TarError, OSError, UnicodeDecodeError):
+        pass
+
+    stat = os.stat(model_file)
+    return f"{os.path.abspath(model_file)}-{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def get_cached_model(cache_key: Text) -> Optional[CachedModelPath]:
+    """Get the path to a model from the cache of unpacked models.
+
+    Args:
+        cache_key: Key the model was cached with, e.g. its fingerprint.
+
+    Returns:
+        Path to the unpacked model or `None` if it is not cached.
+
+    """
+
+    model_directory = CachedModelPath(_cached_model_path(cache_key))
+
+    if not os.path.isdir(model_directory) or not model_directory.acquire():
+        return None
+
+    # mark the model as recently used
+    os.utime(model_directory)
+    logger.debug(f"Using cached model at '{model_directory}'.")
+
+    return model_directory
+
+
+def _add_to_model_cache(
+    cache_key: Text, extract: Callable[[Text], typing.Any]
+) -> CachedModelPath:
+    cached_model = get_cached_model(cache_key)
+    if cached_model:
+        return cached_model
+
+    cache_directory = model_cache_directory()
+    os.makedirs(cache_directory, exist_ok=True)
+    model_directory = CachedModelPath(_cached_model_path(cache_key))
+    # protect the model before it's added, so that it can't be evicted by
+    # someone else right after it was added
+    model_directory.acquire()
+
+    # the model is extracted next to its final location and moved there
+    # afterwards, so that no one uses a partially extracted model
+    working_directory = tempfile.mkdtemp(prefix=".", dir=cache_directory)
+    try:
+        extract(working_directory)
+        try:
+            os.rename(working_directory, model_directory)
+        except OSError:
+            # another process cached the same model in the meantime
+            if not os.path.isdir(model_directory):
+                raise
+    finally:
+        shutil.rmtree(working_directory, ignore_errors=True)
+
+    _evict_cached_models(cache_directory)
+
+    return model_directory
+
+
+def _evict_cached_models(cache_directory: Text) -> None:
+    """Remove the least recently used models if the cache is full.
+
+    Models which are in use are never removed."""
+
+    if fcntl is None:
+        # without file locks it's unknown which models are in use
+        return
+
+    cached_models = [
+        entry
+        for entry in os.scandir(cache_directory)
+        if entry.is_dir() and not entry.name.startswith(".")
+    ]
+    cached_models.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+
+    for entry in cached_models[DEFAULT_MAX_CACHED_MODELS:]:
+        file_descriptor = _lock_cached_model(entry.path, exclusive=True)
+        if file_descriptor is None:
+            logger.debug(f"Keeping cached model at '{entry.path}' which is in use.")
+            continue
+
+        try:
+            logger.debug(f"Removing cached model at '{entry.path}'.")
+            shutil.rmtree(entry.path, ignore_errors=True)
+        finally:
+            os.close(file_descriptor)
+
+
+def unpack_model_to_cache(model_file: Text) -> CachedModelPath:
+    """Unpack a zipped Rasa model into the cache of unpacked models.
+
+    If the same model was unpacked before (e.g. by a previous run of the
+    server) the cached model is used instead of unpacking it again.
+
+    Args:
+        model_file: Path to zipped model.
+
+    Returns:
+        Path to the unpacked Rasa model. The unpacked model must not be
+        modified since it is shared with other users of the same model.
+
+    """
+
+    return _add_to_model_cache(
+        _model_archive_cache_key(model_file), partial(_extract_model, model_file)
+    )
+
+
+def unarchive_to_cache(byte_array: bytes, cache_key: Text) -> CachedModelPath:
+    """Unpack a model archive, e.g. one pulled from a model server, into the
+    cache of unpacked models.
+
+    Args:
+        byte_array: The model archive.
+        cache_key: Key which identifies the model, e.g. its fingerprint.
+
+    Returns:
+        Path to the unpacked Rasa model.
+
+    """
+
+    return _add_to_model_cache(cache_key, partial(rasa.utils.io.unarchive, byte_array))
 
 
 def get_model_subdirectories(
@@ -241,7 +508,8 @@ def create_package_rasa(
     Args:
         training_directory: Path to the directory which contains the trained
                             model files.
-        output_filename: Name of the zipped model file to be created.
+        output_filename: Name of the zipped model file to be created. If it
+                         ends with `.tar` the model is not compressed.
         fingerprint: A unique fingerprint to identify the model version.
 
     Returns:
@@ -257,8 +525,17 @@ def create_package_rasa(
     if not os.path.exists(output_directory):
         os.makedirs(output_directory)
 
-    with tarfile.open(output_filename, "w:gz") as tar:
-        for elem in os.scandir(training_directory):
+    mode = "w" if output_filename.endswith(".tar") else "w:gz"
+
+    # the fingerprint is added first, so that models can be identified without
+    # unpacking them
+    elements = sorted(
+        os.scandir(training_directory),
+        key=lambda elem: elem.name != FINGERPRINT_FILE_PATH,
+    )
+
+    with tarfile.open(output_filename, mode) as tar:
+        for elem in elements:
             tar.add(elem.path, arcname=elem.name)
 
     shutil.rmtree(training_directory)
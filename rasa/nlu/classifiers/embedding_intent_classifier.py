@@ -4,6 +4,7 @@ import numpy as np
 import os
 import pickle
 import scipy.sparse
+import threading
 import typing
 from typing import Any, Dict, List, Optional, Text, Tuple, Union
 import warnings
@@ -247,6 +248,12 @@ class EmbeddingIntentClassifier(Component):
         self._train_op = None
         self._is_training = None
 
+        # (model directory, file name) of a checkpoint which is restored on
+        # first use if the model was loaded lazily
+        self._deferred_checkpoint = None
+        # the component is shared by the interpreters of a process
+        self._session_lock = threading.Lock()
+
     # training data helpers:
     @staticmethod
     def _create_label_id_dict(
@@ -777,9 +784,9 @@ class EmbeddingIntentClassifier(Component):
     # process helpers
     # noinspection PyPep8Naming
     def _calculate_message_sim(
-        self, batch: Tuple[np.ndarray]
-    ) -> Tuple[np.ndarray, List[float]]:
-        """Calculate message similarities"""
+        self, batch: Tuple[np.ndarray], batch_size: int = 1
+    ) -> List[Tuple[np.ndarray, List[float]]]:
+        """Calculate message similarities for every message of the batch"""
 
         message_sim = self.session.run(
             self.pred_confidence,
@@ -788,21 +795,35 @@ class EmbeddingIntentClassifier(Component):
             },
         )
 
-        message_sim = message_sim.flatten()  # sim is a matrix
+        # sim is a matrix with one row of label similarities per message
+        message_sim = message_sim.reshape(batch_size, -1)
+
+        results = []
+        for sim in message_sim:
+            label_ids = sim.argsort()[::-1]
+            sim[::-1].sort()
 
-        label_ids = message_sim.argsort()[::-1]
-        message_sim[::-1].sort()
+            # transform sim to python list for JSON serializing
+            results.append((label_ids, sim.tolist()))
 
-        # transform sim to python list for JSON serializing
-        return label_ids, message_sim.tolist()
+        return results
 
     def predict_label(
         self, message: "Message"
     ) -> Tuple[Dict[Text, Any], List[Dict[Text, Any]]]:
         """Predicts the intent of the provided message."""
 
-        label = {"name": None, "confidence": 0.0}
-        label_ranking = []
+        return self.predict_labels([message])[0]
+
+    def predict_labels(
+        self, messages: List["Message"]
+    ) -> List[Tuple[Dict[Text, Any], List[Dict[Text, Any]]]]:
+        """Predicts the intents of the provided messages with a single run of
+        the tf graph."""
+
+        no_prediction = ({"name": None, "confidence": 0.0}, [])
+
+        self._restore_deferred_session()
 
         if self.session is None:
             logger.error(
@@ -810,19 +831,24 @@ class EmbeddingIntentClassifier(Component):
                 "component is either not trained or "
                 "didn't receive enough training data."
             )
-            return label, label_ranking
+            return [no_prediction] * len(messages)
 
-        # create session data from message and convert it into a batch of 1
-        session_data = self._create_session_data([message])
+        # create session data from messages and convert it into a single batch
+        session_data = self._create_session_data(messages)
         batch = train_utils.prepare_batch(
             session_data, tuple_sizes=self.batch_tuple_sizes
         )
 
         # load tf graph and session
-        label_ids, message_sim = self._calculate_message_sim(batch)
+        similarities = self._calculate_message_sim(batch, len(messages))
+
+        predictions = []
+        for label_ids, message_sim in similarities:
+            # if X contains all zeros do not predict some label
+            if label_ids.size == 0:
+                predictions.append(no_prediction)
+                continue
 
-        # if X contains all zeros do not predict some label
-        if label_ids.size > 0:
             label = {
                 "name": self.inverted_label_dict[label_ids[0]],
                 "confidence": message_sim[0],
@@ -834,23 +860,81 @@ class EmbeddingIntentClassifier(Component):
                 {"name": self.inverted_label_dict[label_idx], "confidence": score}
                 for label_idx, score in ranking
             ]
+            predictions.append((label, label_ranking))
 
-        return label, label_ranking
+        return predictions
 
     def process(self, message: "Message", **kwargs: Any) -> None:
         """Return the most likely label and its similarity to the input."""
 
         label, label_ranking = self.predict_label(message)
 
+        self._add_prediction(message, label, label_ranking)
+
+    def process_batch(self, messages: List["Message"], **kwargs: Any) -> None:
+        """Return the most likely labels for a batch of messages at once."""
+
+        predictions = self.predict_labels(messages)
+
+        for message, (label, label_ranking) in zip(messages, predictions):
+            self._add_prediction(message, label, label_ranking)
+
+    def _add_prediction(
+        self,
+        message: "Message",
+        label: Dict[Text, Any],
+        label_ranking: List[Dict[Text, Any]],
+    ) -> None:
+
         message.set("intent", label, add_to_output=True)
         message.set("intent_ranking", label_ranking, add_to_output=True)
 
+    def _restore_session(self, model_dir: Text, file_name: Text) -> None:
+        """Restore the tf graph and session from a persisted checkpoint."""
+
+        checkpoint = os.path.join(model_dir, file_name + ".ckpt")
+
+        with open(os.path.join(model_dir, file_name + ".tf_config.pkl"), "rb") as f:
+            _tf_config = pickle.load(f)
+
+        self.graph = tf.Graph()
+        with self.graph.as_default():
+            self.session = tf.compat.v1.Session(config=_tf_config)
+            saver = tf.compat.v1.train.import_meta_graph(checkpoint + ".meta")
+
+            saver.restore(self.session, checkpoint)
+
+            self.batch_in = train_utils.load_tensor("batch_placeholder")
+
+            self.sim_all = train_utils.load_tensor("similarity_all")
+            self.pred_confidence = train_utils.load_tensor("pred_confidence")
+            self.sim = train_utils.load_tensor("similarity")
+
+            self.message_embed = train_utils.load_tensor("message_embed")
+            self.label_embed = train_utils.load_tensor("label_embed")
+            self.all_labels_embed = train_utils.load_tensor("all_labels_embed")
+
+    def _restore_deferred_session(self) -> None:
+        """Restore the tf graph and session if loading was deferred."""
+
+        if self._deferred_checkpoint is None:
+            return
+
+        with self._session_lock:
+            if self._deferred_checkpoint is not None:
+                model_dir, file_name = self._deferred_checkpoint
+                self._restore_session(model_dir, file_name)
+                # cleared last, other threads use the session afterwards
+                self._deferred_checkpoint = None
+
     def persist(self, file_name: Text, model_dir: Text) -> Dict[Text, Any]:
         """Persist this model into the passed directory.
 
         Return the metadata necessary to load the model again.
         """
 
+        self._restore_deferred_session()
+
         if self.session is None:
             return {"file": None}
 
@@ -897,6 +981,20 @@ class EmbeddingIntentClassifier(Component):
 
         return {"file": file_name}
 
+    @classmethod
+    def cache_key(
+        cls, component_meta: Dict[Text, Any], model_metadata: "Metadata"
+    ) -> Optional[Text]:
+
+        file_name = component_meta.get("file")
+        if not file_name:
+            return None
+
+        # identical trained models (e.g. a reloaded model) share one session
+        return cls._fingerprint_cache_key(
+            component_meta, model_metadata, file_prefix=file_name + "."
+        )
+
     @classmethod
     def load(
         cls,
@@ -908,29 +1006,15 @@ class EmbeddingIntentClassifier(Component):
     ) -> "EmbeddingIntentClassifier":
         """Loads the trained model from the provided directory."""
 
+        if cached_component:
+            with cached_component._session_lock:
+                if cached_component._deferred_checkpoint is not None:
+                    # the directory of the model it was loaded for might be gone
+                    cached_component._deferred_checkpoint = (model_dir, meta["file"])
+            return cached_component
+
         if model_dir and meta.get("file"):
             file_name = meta.get("file")
-            checkpoint = os.path.join(model_dir, file_name + ".ckpt")
-
-            with open(os.path.join(model_dir, file_name + ".tf_config.pkl"), "rb") as f:
-                _tf_config = pickle.load(f)
-
-            graph = tf.Graph()
-            with graph.as_default():
-                session = tf.compat.v1.Session(config=_tf_config)
-                saver = tf.compat.v1.train.import_meta_graph(checkpoint + ".meta")
-
-                saver.restore(session, checkpoint)
-
-                batch_in = train_utils.load_tensor("batch_placeholder")
-
-                sim_all = train_utils.load_tensor("similarity_all")
-                pred_confidence = train_utils.load_tensor("pred_confidence")
-                sim = train_utils.load_tensor("similarity")
-
-                message_embed = train_utils.load_tensor("message_embed")
-                label_embed = train_utils.load_tensor("label_embed")
-                all_labels_embed = train_utils.load_tensor("all_labels_embed")
 
             with open(
                 os.path.join(model_dir, file_name + ".inv_label_dict.pkl"), "rb"
@@ -942,21 +1026,20 @@ class EmbeddingIntentClassifier(Component):
             ) as f:
                 batch_tuple_sizes = pickle.load(f)
 
-            return cls(
+            component = cls(
                 component_config=meta,
                 inverted_label_dict=inv_label_dict,
-                session=session,
-                graph=graph,
-                batch_placeholder=batch_in,
-                similarity_all=sim_all,
-                pred_confidence=pred_confidence,
-                similarity=sim,
-                message_embed=message_embed,
-                label_embed=label_embed,
-                all_labels_embed=all_labels_embed,
                 batch_tuple_sizes=batch_tuple_sizes,
             )
 
+            if kwargs.get("lazy_load"):
+                # the tf graph is restored when the component is used first
+                component._deferred_checkpoint = (model_dir, file_name)
+            else:
+                component._restore_session(model_dir, file_name)
+
+            return component
+
         else:
             warnings.warn(
                 f"Failed to load nlu model. "
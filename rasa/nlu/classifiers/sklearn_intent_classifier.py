@@ -1,3 +1,4 @@
+import copy
 import logging
 import warnings
 import numpy as np
@@ -206,14 +207,34 @@ class SklearnIntentClassifier(Component):
 
         classifier_file_name = file_name + "_classifier.pkl"
         encoder_file_name = file_name + "_encoder.pkl"
+        array_file_names = {}
         if self.clf and self.le:
             utils.json_pickle(
                 os.path.join(model_dir, encoder_file_name), self.le.classes_
             )
-            utils.json_pickle(
-                os.path.join(model_dir, classifier_file_name), self.clf.best_estimator_
-            )
-        return {"classifier": classifier_file_name, "encoder": encoder_file_name}
+
+            # numeric arrays of the estimator (e.g. support vectors) are stored
+            # as `.npy` files, so that they can be memory-mapped when loading
+            estimator = copy.copy(self.clf.best_estimator_)
+            for name, value in vars(estimator).items():
+                if isinstance(value, np.ndarray) and value.dtype.kind in "biufc":
+                    array_file_name = f"{file_name}_classifier.{name}.npy"
+                    np.save(
+                        os.path.join(model_dir, array_file_name),
+                        value,
+                        allow_pickle=False,
+                    )
+                    array_file_names[name] = array_file_name
+
+            for name in array_file_names:
+                setattr(estimator, name, None)
+
+            utils.json_pickle(os.path.join(model_dir, classifier_file_name), estimator)
+        return {
+            "classifier": classifier_file_name,
+            "encoder": encoder_file_name,
+            "classifier_arrays": array_file_names,
+        }
 
     @classmethod
     def load(
@@ -231,6 +252,16 @@ class SklearnIntentClassifier(Component):
 
         if os.path.exists(classifier_file):
             classifier = utils.json_unpickle(classifier_file)
+
+            # copy-on-write mappings share the pages of the arrays between
+            # all processes which load the same model
+            mmap_mode = "c" if kwargs.get("lazy_load") else None
+            for name, array_file_name in meta.get("classifier_arrays", {}).items():
+                array = np.load(
+                    os.path.join(model_dir, array_file_name), mmap_mode=mmap_mode
+                )
+                setattr(classifier, name, array)
+
             classes = utils.json_unpickle(encoder_file)
             encoder = LabelEncoder()
             encoder.classes_ = classes
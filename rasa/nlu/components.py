@@ -1,6 +1,12 @@
+import contextlib
+import hashlib
+import json
 import logging
+import os
+import threading
 import typing
-from typing import Any, Dict, Hashable, List, Optional, Set, Text, Tuple
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Set, Text, Tuple
 import warnings
 
 from rasa.nlu.config import RasaNLUModelConfig, override_defaults
@@ -12,6 +18,9 @@ if typing.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# maximum number of components a `ComponentBuilder` caches by default
+DEFAULT_COMPONENT_CACHE_SIZE = 32
+
 
 def find_unavailable_packages(package_names: List[Text]) -> Set[Text]:
     """Tries to import all the package names and returns
@@ -308,6 +317,17 @@ class Component(metaclass=ComponentMetaclass):
         of components previous to this one."""
         pass
 
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Process a batch of incoming messages.
+
+        Components which can process several messages at once more
+        efficiently than one by one (e.g. with a single TensorFlow run)
+        should override this method. By default every message is passed
+        to :meth:`rasa.nlu.components.Component.process`."""
+
+        for message in messages:
+            self.process(message, **kwargs)
+
     def persist(self, file_name: Text, model_dir: Text) -> Optional[Dict[Text, Any]]:
         """Persist this component to disk for future loading."""
 
@@ -326,6 +346,47 @@ class Component(metaclass=ComponentMetaclass):
 
         return None
 
+    @classmethod
+    def _fingerprint_cache_key(
+        cls,
+        component_meta: Dict[Text, Any],
+        model_metadata: "Metadata",
+        file_prefix: Optional[Text] = None,
+    ) -> Optional[Text]:
+        """Cache key for components which are fully defined by their
+        configuration and the files they persisted.
+
+        The persisted files are the files of the model directory whose
+        names start with `file_prefix`. They are identified by their name,
+        size and modification time. If files are expected, but the model
+        directory is unknown (e.g. during training), no key is returned."""
+
+        # file names contain the position of the component in the pipeline
+        config = {key: value for key, value in component_meta.items() if key != "file"}
+        fingerprint = hashlib.md5(
+            json.dumps(config, sort_keys=True, default=str).encode("utf-8")
+        )
+
+        if file_prefix is not None:
+            model_dir = model_metadata.model_dir if model_metadata else None
+            if not model_dir or not os.path.isdir(model_dir):
+                return None
+
+            file_names = sorted(
+                f for f in os.listdir(model_dir) if f.startswith(file_prefix)
+            )
+            for file_name in file_names:
+                # reading the content of large files (e.g. checkpoints) would
+                # slow down loading, unpacked model archives keep the
+                # modification times of their files
+                stat = os.stat(os.path.join(model_dir, file_name))
+                fingerprint.update(
+                    f"{file_name[len(file_prefix) :]}-{stat.st_size}-"
+                    f"{stat.st_mtime_ns}".encode("utf-8")
+                )
+
+        return f"{cls.name}-{fingerprint.hexdigest()}"
+
     def __getstate__(self) -> Any:
         d = self.__dict__.copy()
         # these properties should not be pickled
@@ -379,17 +440,71 @@ class Component(metaclass=ComponentMetaclass):
         return language in cls.language_list
 
 
+def _resident_memory() -> Optional[int]:
+    """Resident memory of this process in bytes, if it can be determined."""
+
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _memory_allocated_since(memory_before: Optional[int]) -> Optional[int]:
+    memory_after = _resident_memory()
+    if memory_before is None or memory_after is None:
+        return None
+    return memory_after - memory_before
+
+
 class ComponentBuilder:
     """Creates trainers and interpreters based on configurations.
 
     Caches components for reuse.
     """
 
-    def __init__(self, use_cache: bool = True) -> None:
+    def __init__(
+        self,
+        use_cache: bool = True,
+        max_cache_size: Optional[int] = DEFAULT_COMPONENT_CACHE_SIZE,
+        max_cache_memory: Optional[int] = None,
+    ) -> None:
         self.use_cache = use_cache
         # Reuse nlp and featurizers where possible to save memory,
         # every component that implements a cache-key will be cached
-        self.component_cache = {}
+        self.component_cache = OrderedDict()
+        # components which are not used by any pipeline are evicted in least
+        # recently used order once the cache holds more than `max_cache_size`
+        # components or more than `max_cache_memory` bytes
+        self.max_cache_size = max_cache_size
+        self.max_cache_memory = max_cache_memory
+        # number of pipelines which use a cached component
+        self._cache_references = Counter()
+        # memory allocated while loading a cached component
+        self._cache_memory = {}
+        # guards the cache, components are loaded from multiple threads
+        self._cache_lock = threading.Lock()
+        # components which were released while the cache was locked
+        self._pending_releases: List[Component] = []
+
+    @property
+    def cache_memory(self) -> int:
+        """Estimated number of bytes used by the cached components."""
+
+        with self._locked_cache():
+            return self._cached_memory()
+
+    def _cached_memory(self) -> int:
+        return sum(self._cache_memory.values())
+
+    @contextlib.contextmanager
+    def _locked_cache(self) -> Iterator[None]:
+        """Lock the cache and apply the releases which happened meanwhile."""
+
+        with self._cache_lock:
+            yield
+            self._apply_pending_releases()
 
     def __get_cached_component(
         self, component_meta: Dict[Text, Any], model_metadata: "Metadata"
@@ -410,20 +525,102 @@ class ComponentBuilder:
             and self.use_cache
             and cache_key in self.component_cache
         ):
+            self.component_cache.move_to_end(cache_key)
+            self._cache_references[cache_key] += 1
             return self.component_cache[cache_key], cache_key
         else:
             return None, cache_key
 
-    def __add_to_cache(self, component: Component, cache_key: Optional[Text]) -> None:
-        """Add a component to the cache."""
+    def __add_to_cache(
+        self,
+        component: Component,
+        cache_key: Optional[Text],
+        memory: Optional[int] = None,
+    ) -> Component:
+        """Add a component to the cache.
+
+        Returns:
+            The cached component, which is the component cached by another
+            thread if it loaded the same component in the meantime.
+        """
+
+        if cache_key is None or not self.use_cache:
+            return component
+
+        if cache_key in self.component_cache:
+            self.component_cache.move_to_end(cache_key)
+            self._cache_references[cache_key] += 1
+            return self.component_cache[cache_key]
+
+        self.component_cache[cache_key] = component
+        self._cache_references[cache_key] += 1
+        self._cache_memory[cache_key] = max(memory or 0, 0)
+        logger.info(
+            "Added '{}' to component cache. Key '{}'."
+            "".format(component.name, cache_key)
+        )
+        self._evict_unused_components()
+        return component
+
+    def _is_cache_full(self) -> bool:
+        return (
+            self.max_cache_size is not None
+            and len(self.component_cache) > self.max_cache_size
+        ) or (
+            self.max_cache_memory is not None
+            and self._cached_memory() > self.max_cache_memory
+        )
 
-        if cache_key is not None and self.use_cache:
-            self.component_cache[cache_key] = component
-            logger.info(
-                "Added '{}' to component cache. Key '{}'."
-                "".format(component.name, cache_key)
+    def _evict_unused_components(self) -> None:
+        """Evict least recently used components which no pipeline uses."""
+
+        unused = [
+            cache_key
+            for cache_key in self.component_cache
+            if self._cache_references[cache_key] <= 0
+        ]
+        for cache_key in unused:
+            if not self._is_cache_full():
+                break
+
+            component = self.component_cache.pop(cache_key)
+            del self._cache_references[cache_key]
+            self._cache_memory.pop(cache_key, None)
+            logger.debug(
+                f"Evicted '{component.name}' from component cache. Key '{cache_key}'."
             )
 
+    def release_components(self, components: List[Component]) -> None:
+        """Mark cached components as no longer used by a pipeline.
+
+        Released components stay cached until they are evicted, so that
+        models which are loaded later can still reuse them.
+
+        This is called by finalizers, which can run in any thread, also while
+        the current thread holds the cache lock. Hence the release is applied
+        with the next cache operation if the cache is locked."""
+
+        self._pending_releases.extend(components)
+
+        if self._cache_lock.acquire(blocking=False):
+            try:
+                self._apply_pending_releases()
+            finally:
+                self._cache_lock.release()
+
+    def _apply_pending_releases(self) -> None:
+        if not self._pending_releases:
+            return
+
+        while self._pending_releases:
+            component = self._pending_releases.pop()
+            for cache_key, cached_component in self.component_cache.items():
+                if cached_component is component:
+                    self._cache_references[cache_key] -= 1
+                    break
+
+        self._evict_unused_components()
+
     def load_component(
         self,
         component_meta: Dict[Text, Any],
@@ -449,16 +646,22 @@ class ComponentBuilder:
         from rasa.nlu import registry
 
         try:
-            cached_component, cache_key = self.__get_cached_component(
-                component_meta, model_metadata
-            )
+            # the cache is only locked for the lookup and the insertion, so
+            # that models can be loaded by several threads at the same time
+            with self._locked_cache():
+                cached_component, cache_key = self.__get_cached_component(
+                    component_meta, model_metadata
+                )
+            memory_before = _resident_memory()
             component = registry.load_component_by_meta(
                 component_meta, model_dir, model_metadata, cached_component, **context
             )
             if not cached_component:
                 # If the component wasn't in the cache,
                 # let us add it if possible
-                self.__add_to_cache(component, cache_key)
+                memory = _memory_allocated_since(memory_before)
+                with self._locked_cache():
+                    component = self.__add_to_cache(component, cache_key, memory)
             return component
         except MissingArgumentError as e:  # pragma: no cover
             raise Exception(
@@ -475,12 +678,16 @@ class ComponentBuilder:
         from rasa.nlu.model import Metadata
 
         try:
-            component, cache_key = self.__get_cached_component(
-                component_config, Metadata(cfg.as_dict(), None)
-            )
+            with self._locked_cache():
+                component, cache_key = self.__get_cached_component(
+                    component_config, Metadata(cfg.as_dict(), None)
+                )
             if component is None:
+                memory_before = _resident_memory()
                 component = registry.create_component_by_config(component_config, cfg)
-                self.__add_to_cache(component, cache_key)
+                memory = _memory_allocated_since(memory_before)
+                with self._locked_cache():
+                    component = self.__add_to_cache(component, cache_key, memory)
             return component
         except MissingArgumentError as e:  # pragma: no cover
             raise Exception(
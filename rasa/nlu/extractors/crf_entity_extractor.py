@@ -1,9 +1,24 @@
+import itertools
 import logging
 import warnings
 import os
+import sys
 import typing
 import numpy as np
-from typing import Any, Dict, List, Optional, Text, Tuple, Union, NamedTuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Text,
+    Tuple,
+    Type,
+    Union,
+    NamedTuple,
+)
 
 from rasa.nlu.config import InvalidConfigError, RasaNLUModelConfig
 from rasa.nlu.extractors import EntityExtractor
@@ -39,6 +54,121 @@ class CRFToken(NamedTuple):
     dense_features: np.ndarray
 
 
+class CRFFeatureTemplate:
+    """Compiled version of the configured crf `features`.
+
+    The feature names (e.g. `-1:low`) are built and interned once instead of
+    for every token. The value of every feature is computed once per token
+    and shared between all windows the token is part of."""
+
+    def __init__(
+        self,
+        configured_features: List[List[Text]],
+        function_dict: Dict[Text, Callable[[CRFToken], Any]],
+    ) -> None:
+
+        half_span = len(configured_features) // 2
+
+        # every distinct feature is computed only once per token
+        self.feature_names = list(
+            dict.fromkeys(itertools.chain.from_iterable(configured_features))
+        )
+        self.functions = [function_dict[name] for name in self.feature_names]
+
+        # word before(-1), current word(0), next word(+1)
+        self.window = []
+        for position, features in enumerate(configured_features):
+            offset = position - half_span
+            compiled = [
+                (
+                    self.feature_names.index(feature),
+                    sys.intern(f"{offset}:{feature}"),
+                    feature == "pattern",
+                )
+                for feature in features
+            ]
+            self.window.append((offset, compiled))
+
+        self._pattern_keys = {}
+
+    def _pattern_key(self, key: Text, pattern_name: Text) -> Text:
+        cache_key = (key, pattern_name)
+        if cache_key not in self._pattern_keys:
+            self._pattern_keys[cache_key] = sys.intern(f"{key}:{pattern_name}")
+        return self._pattern_keys[cache_key]
+
+    def sentence_to_features(self, sentence: List[CRFToken]) -> List[Dict[Text, Any]]:
+        """Convert the words of a sentence into discrete features,
+        including the features of the surrounding words."""
+
+        values = [[function(word) for word in sentence] for function in self.functions]
+        sentence_length = len(sentence)
+        sentence_features = []
+
+        for word_idx in range(sentence_length):
+            word_features = {}
+            for offset, features in self.window:
+                idx = word_idx + offset
+                if idx >= sentence_length:
+                    # End Of Sentence
+                    word_features["EOS"] = True
+                elif idx < 0:
+                    # Beginning Of Sentence
+                    word_features["BOS"] = True
+                else:
+                    for feature_idx, key, is_pattern in features:
+                        value = values[feature_idx][idx]
+                        if is_pattern:
+                            # add all regexes as a feature
+                            for p_name, matched in value.items():
+                                word_features[self._pattern_key(key, p_name)] = matched
+                        else:
+                            word_features[key] = value
+            sentence_features.append(word_features)
+
+        return sentence_features
+
+    def sentences_to_features(
+        self, sentences: List[List[CRFToken]]
+    ) -> List[List[Dict[Text, Any]]]:
+        return [self.sentence_to_features(sentence) for sentence in sentences]
+
+
+# feature template of a worker process which generates training features
+_worker_feature_template = None
+
+
+def _init_feature_worker(
+    extractor_class: Type["CRFEntityExtractor"], configured_features: List[List[Text]]
+) -> None:
+    # the feature functions are lambdas and can't be pickled, hence every
+    # worker compiles its own template
+    global _worker_feature_template
+    _worker_feature_template = CRFFeatureTemplate(
+        configured_features, extractor_class.function_dict
+    )
+
+
+def _featurize_shard(
+    sentences: List[List[CRFToken]],
+) -> List[Tuple[List[Dict[Text, Any]], List[Text]]]:
+    return [
+        (
+            _worker_feature_template.sentence_to_features(sentence),
+            CRFEntityExtractor._sentence_to_labels(sentence),
+        )
+        for sentence in sentences
+    ]
+
+
+def _shards(items: Iterable[Any], shard_size: int) -> Iterator[List[Any]]:
+    items = iter(items)
+    shard = list(itertools.islice(items, shard_size))
+    while shard:
+        yield shard
+        shard = list(itertools.islice(items, shard_size))
+
+
 class CRFEntityExtractor(EntityExtractor):
 
     provides = [ENTITIES_ATTRIBUTE]
@@ -79,6 +209,11 @@ class CRFEntityExtractor(EntityExtractor):
         "L1_c": 0.1,
         # weight of the L2 regularization
         "L2_c": 0.1,
+        # number of processes which generate the training features,
+        # -1 uses all available cores
+        "num_processes": 1,
+        # number of sentences which are sent to a process at once
+        "shard_size": 500,
     }
 
     function_dict = {
@@ -113,6 +248,10 @@ class CRFEntityExtractor(EntityExtractor):
 
         self._check_pos_features_and_spacy()
 
+        self.feature_template = CRFFeatureTemplate(
+            self.component_config["features"], self.function_dict
+        )
+
     def _check_pos_features_and_spacy(self) -> None:
         import itertools
 
@@ -159,18 +298,17 @@ class CRFEntityExtractor(EntityExtractor):
             # convert the dataset into features
             # this will train on ALL examples, even the ones
             # without annotations
-            dataset = self._create_dataset(filtered_entity_examples)
+            dataset = self._iter_dataset(filtered_entity_examples)
 
             self._train_model(dataset)
 
-    def _create_dataset(self, examples: List[Message]) -> List[List[CRFToken]]:
-        dataset = []
-
+    def _iter_dataset(self, examples: List[Message]) -> Iterator[List[CRFToken]]:
         for example in examples:
             entity_offsets = self._convert_example(example)
-            dataset.append(self._from_json_to_crf(example, entity_offsets))
+            yield self._from_json_to_crf(example, entity_offsets)
 
-        return dataset
+    def _create_dataset(self, examples: List[Message]) -> List[List[CRFToken]]:
+        return list(self._iter_dataset(examples))
 
     def _check_spacy_doc(self, message) -> None:
         if self.pos_features and message.get(SPACY_DOCS[TEXT_ATTRIBUTE]) is None:
@@ -185,14 +323,21 @@ class CRFEntityExtractor(EntityExtractor):
 
     def process(self, message: Message, **kwargs: Any) -> None:
 
-        self._check_spacy_doc(message)
+        self.process_batch([message], **kwargs)
 
-        extracted = self.add_extractor_name(self.extract_entities(message))
-        message.set(
-            ENTITIES_ATTRIBUTE,
-            message.get(ENTITIES_ATTRIBUTE, []) + extracted,
-            add_to_output=True,
-        )
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Extract the entities of many messages with a single tagger call."""
+
+        for message in messages:
+            self._check_spacy_doc(message)
+
+        for message, entities in zip(messages, self.extract_entities_batch(messages)):
+            extracted = self.add_extractor_name(entities)
+            message.set(
+                ENTITIES_ATTRIBUTE,
+                message.get(ENTITIES_ATTRIBUTE, []) + extracted,
+                add_to_output=True,
+            )
 
     @staticmethod
     def _convert_example(example: Message) -> List[Tuple[int, int, Text]]:
@@ -204,13 +349,24 @@ class CRFEntityExtractor(EntityExtractor):
     def extract_entities(self, message: Message) -> List[Dict[Text, Any]]:
         """Take a sentence and return entities in json format"""
 
-        if self.ent_tagger is not None:
-            text_data = self._from_text_to_crf(message)
-            features = self._sentence_to_features(text_data)
-            ents = self.ent_tagger.predict_marginals_single(features)
-            return self._from_crf_to_json(message, ents)
-        else:
-            return []
+        return self.extract_entities_batch([message])[0]
+
+    def extract_entities_batch(
+        self, messages: List[Message]
+    ) -> List[List[Dict[Text, Any]]]:
+        """Take many sentences and return the entities of each in json format"""
+
+        if self.ent_tagger is None:
+            return [[] for _ in messages]
+
+        features = self.feature_template.sentences_to_features(
+            [self._from_text_to_crf(message) for message in messages]
+        )
+        ents = self.ent_tagger.predict_marginals(features)
+        return [
+            self._from_crf_to_json(message, message_ents)
+            for message, message_ents in zip(messages, ents)
+        ]
 
     def most_likely_entity(self, idx, entities) -> Tuple[Text, Any]:
         if len(entities) > idx:
@@ -436,43 +592,7 @@ class CRFEntityExtractor(EntityExtractor):
         """Convert a word into discrete features in self.crf_features,
         including word before and word after."""
 
-        configured_features = self.component_config["features"]
-        sentence_features = []
-
-        for word_idx in range(len(sentence)):
-            # word before(-1), current word(0), next word(+1)
-            feature_span = len(configured_features)
-            half_span = feature_span // 2
-            feature_range = range(-half_span, half_span + 1)
-            prefixes = [str(i) for i in feature_range]
-            word_features = {}
-            for f_i in feature_range:
-                if word_idx + f_i >= len(sentence):
-                    word_features["EOS"] = True
-                    # End Of Sentence
-                elif word_idx + f_i < 0:
-                    word_features["BOS"] = True
-                    # Beginning Of Sentence
-                else:
-                    word = sentence[word_idx + f_i]
-                    f_i_from_zero = f_i + half_span
-                    prefix = prefixes[f_i_from_zero]
-                    features = configured_features[f_i_from_zero]
-                    for feature in features:
-                        if feature == "pattern":
-                            # add all regexes as a feature
-                            regex_patterns = self.function_dict[feature](word)
-                            # pytype: disable=attribute-error
-                            for p_name, matched in regex_patterns.items():
-                                feature_name = prefix + ":" + feature + ":" + p_name
-                                word_features[feature_name] = matched
-                            # pytype: enable=attribute-error
-                        else:
-                            # append each feature to a feature vector
-                            value = self.function_dict[feature](word)
-                            word_features[prefix + ":" + feature] = value
-            sentence_features.append(word_features)
-        return sentence_features
+        return self.feature_template.sentence_to_features(sentence)
 
     @staticmethod
     def _sentence_to_labels(
@@ -564,11 +684,12 @@ class CRFEntityExtractor(EntityExtractor):
         return bilou
 
     @staticmethod
-    def __pattern_of_token(message, i):
-        if message.get(TOKENS_NAMES[TEXT_ATTRIBUTE]) is not None:
-            return message.get(TOKENS_NAMES[TEXT_ATTRIBUTE])[i].get("pattern", {})
+    def __patterns_of_tokens(message: Message, num_tokens: int) -> List[Dict]:
+        tokens = message.get(TOKENS_NAMES[TEXT_ATTRIBUTE])
+        if tokens is not None:
+            return [tokens[i].get("pattern", {}) for i in range(num_tokens)]
         else:
-            return {}
+            return [{}] * num_tokens
 
     @staticmethod
     def __tag_of_token(token):
@@ -618,9 +739,10 @@ class CRFEntityExtractor(EntityExtractor):
             tokens = message.get(TOKENS_NAMES[TEXT_ATTRIBUTE])
 
         text_dense_features = self.__get_dense_features(message)
+        patterns = self.__patterns_of_tokens(message, len(tokens))
 
         for i, token in enumerate(tokens):
-            pattern = self.__pattern_of_token(message, i)
+            pattern = patterns[i]
             entity = entities[i] if entities else "N/A"
             tag = self.__tag_of_token(token) if self.pos_features else None
             dense_features = (
@@ -633,12 +755,57 @@ class CRFEntityExtractor(EntityExtractor):
 
         return crf_format
 
-    def _train_model(self, df_train: List[List[CRFToken]]) -> None:
+    def _num_processes(self) -> int:
+        num_processes = self.component_config["num_processes"]
+        if num_processes < 1:
+            return os.cpu_count() or 1
+        return num_processes
+
+    def _iter_features_and_labels(
+        self, df_train: Iterable[List[CRFToken]]
+    ) -> Iterator[Tuple[List[Dict[Text, Any]], List[Text]]]:
+        """Generate the features and labels of every training sentence.
+
+        With multiple processes the sentences are featurized shard by shard in
+        a process pool. The results are yielded in order as soon as they are
+        ready, so the features of all sentences never have to be in memory at
+        the same time."""
+
+        num_processes = self._num_processes()
+
+        if num_processes == 1:
+            for sentence in df_train:
+                yield (
+                    self.feature_template.sentence_to_features(sentence),
+                    self._sentence_to_labels(sentence),
+                )
+            return
+
+        from multiprocessing import get_context
+
+        logger.debug(f"Generating CRF features using {num_processes} processes.")
+
+        # TensorFlow is not fork-safe, hence every worker starts a fresh interpreter
+        with get_context("spawn").Pool(
+            num_processes,
+            initializer=_init_feature_worker,
+            initargs=(type(self), self.component_config["features"]),
+        ) as pool:
+            shards = _shards(df_train, self.component_config["shard_size"])
+            for featurized_shard in pool.imap(_featurize_shard, shards):
+                yield from featurized_shard
+
+    def _train_model(self, df_train: Iterable[List[CRFToken]]) -> None:
         """Train the crf tagger based on the training data."""
         import sklearn_crfsuite
 
-        X_train = [self._sentence_to_features(sent) for sent in df_train]
-        y_train = [self._sentence_to_labels(sent) for sent in df_train]
+        # `CRF.fit` appends the training sequences one by one to the crfsuite
+        # trainer, hence features and labels are streamed into it
+        features_and_labels, labels = itertools.tee(
+            self._iter_features_and_labels(df_train)
+        )
+        X_train = (features for features, _ in features_and_labels)
+        y_train = (sentence_labels for _, sentence_labels in labels)
         self.ent_tagger = sklearn_crfsuite.CRF(
             algorithm="lbfgs",
             # coefficient for L1 penalty
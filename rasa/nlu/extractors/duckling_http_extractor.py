@@ -4,7 +4,9 @@ import logging
 import warnings
 import os
 import requests
-from typing import Any, List, Optional, Text, Dict
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Text, Dict, Tuple
 
 from rasa.nlu.constants import ENTITIES_ATTRIBUTE
 from rasa.nlu.config import RasaNLUModelConfig
@@ -69,6 +71,14 @@ class DucklingHTTPExtractor(EntityExtractor):
         # Timeout for receiving response from http url of the running duckling server
         # if not set the default timeout of duckling http url is set to 3 seconds.
         "timeout": 3,
+        # number of seconds a parse result is reused for the same text,
+        # reference times are grouped into buckets of the same length,
+        # set to 0 to disable caching
+        "cache_ttl": 60,
+        # maximum number of cached parse results
+        "cache_size": 1000,
+        # maximum number of parallel requests when processing many messages
+        "max_concurrent_requests": 8,
     }
 
     def __init__(
@@ -79,6 +89,22 @@ class DucklingHTTPExtractor(EntityExtractor):
 
         super().__init__(component_config)
         self.language = language
+        self._session = None
+        self._cache = OrderedDict()
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session which keeps the connections to duckling alive."""
+
+        if self._session is None:
+            pool_size = self.component_config["max_concurrent_requests"]
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=pool_size
+            )
+            self._session = requests.Session()
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+        return self._session
 
     @classmethod
     def create(
@@ -113,15 +139,19 @@ class DucklingHTTPExtractor(EntityExtractor):
             "reftime": reference_time,
         }
 
-    def _duckling_parse(self, text: Text, reference_time: int) -> List[Dict[Text, Any]]:
-        """Sends the request to the duckling server and parses the result."""
+    def _request_matches(
+        self, text: Text, reference_time: int
+    ) -> Optional[List[Dict[Text, Any]]]:
+        """Sends the request to the duckling server and parses the result.
+
+        Returns `None` if the request failed."""
 
         try:
             payload = self._payload(text, reference_time)
             headers = {
                 "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8"
             }
-            response = requests.post(
+            response = self.session.post(
                 self._url() + "/parse",
                 data=payload,
                 headers=headers,
@@ -135,7 +165,7 @@ class DucklingHTTPExtractor(EntityExtractor):
                     "duckling. Status Code: {}. Response: {}"
                     "".format(response.status_code, response.text)
                 )
-                return []
+                return None
         except (
             requests.exceptions.ConnectionError,
             requests.exceptions.ReadTimeout,
@@ -149,7 +179,84 @@ class DucklingHTTPExtractor(EntityExtractor):
                 "https://github.com/facebook/duckling#quickstart "
                 "Error: {}".format(e)
             )
-            return []
+            return None
+
+    def _cache_key(self, text: Text, reference_time: int) -> Tuple:
+        # reference times are in milliseconds
+        time_bucket = reference_time // (self.component_config["cache_ttl"] * 1000)
+        return (
+            text,
+            self._locale(),
+            self.component_config.get("timezone"),
+            json.dumps(self.component_config["dimensions"]),
+            time_bucket,
+        )
+
+    def _get_cached(self, key: Tuple) -> Optional[List[Dict[Text, Any]]]:
+        if key not in self._cache:
+            return None
+
+        expires_at, matches = self._cache[key]
+        if expires_at < time.time():
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return matches
+
+    def _add_to_cache(self, key: Tuple, matches: List[Dict[Text, Any]]) -> None:
+        expires_at = time.time() + self.component_config["cache_ttl"]
+        self._cache[key] = (expires_at, matches)
+        self._cache.move_to_end(key)
+
+        while len(self._cache) > self.component_config["cache_size"]:
+            self._cache.popitem(last=False)
+
+    def _duckling_parse_batch(
+        self, texts: List[Text], reference_times: List[int]
+    ) -> List[List[Dict[Text, Any]]]:
+        """Parses many texts, sending the requests for uncached texts in
+        parallel."""
+
+        use_cache = self.component_config["cache_ttl"] > 0
+        results = [None] * len(texts)
+        # identical requests of the batch are only sent once
+        missing = OrderedDict()
+
+        for idx, (text, reference_time) in enumerate(zip(texts, reference_times)):
+            if use_cache:
+                results[idx] = self._get_cached(self._cache_key(text, reference_time))
+            if results[idx] is None:
+                missing.setdefault((text, reference_time), []).append(idx)
+
+        requests_to_send = list(missing.keys())
+        if len(requests_to_send) > 1:
+            max_workers = min(
+                len(requests_to_send), self.component_config["max_concurrent_requests"]
+            )
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                responses = list(
+                    executor.map(lambda r: self._request_matches(*r), requests_to_send)
+                )
+        else:
+            responses = [self._request_matches(*r) for r in requests_to_send]
+
+        for (text, reference_time), matches in zip(requests_to_send, responses):
+            if matches is None:
+                # failed requests are not cached
+                matches = []
+            elif use_cache:
+                self._add_to_cache(self._cache_key(text, reference_time), matches)
+
+            for idx in missing[(text, reference_time)]:
+                results[idx] = matches
+
+        return results
+
+    def _duckling_parse(self, text: Text, reference_time: int) -> List[Dict[Text, Any]]:
+        """Sends the request to the duckling server and parses the result."""
+
+        return self._duckling_parse_batch([text], [reference_time])[0]
 
     @staticmethod
     def _reference_time_from_message(message: Message) -> int:
@@ -168,16 +275,27 @@ class DucklingHTTPExtractor(EntityExtractor):
 
     def process(self, message: Message, **kwargs: Any) -> None:
 
+        self.process_batch([message], **kwargs)
+
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Extracts the entities of many messages with parallel requests."""
+
         if self._url() is not None:
-            reference_time = self._reference_time_from_message(message)
-            matches = self._duckling_parse(message.text, reference_time)
-            all_extracted = convert_duckling_format_to_rasa(matches)
-            dimensions = self.component_config["dimensions"]
-            extracted = DucklingHTTPExtractor.filter_irrelevant_entities(
-                all_extracted, dimensions
+            reference_times = [
+                self._reference_time_from_message(message) for message in messages
+            ]
+            all_matches = self._duckling_parse_batch(
+                [message.text for message in messages], reference_times
             )
+            dimensions = self.component_config["dimensions"]
+            all_extracted = [
+                DucklingHTTPExtractor.filter_irrelevant_entities(
+                    convert_duckling_format_to_rasa(matches), dimensions
+                )
+                for matches in all_matches
+            ]
         else:
-            extracted = []
+            all_extracted = [[] for _ in messages]
             warnings.warn(
                 "Duckling HTTP component in pipeline, but no "
                 "`url` configuration in the config "
@@ -185,12 +303,13 @@ class DucklingHTTPExtractor(EntityExtractor):
                 "set as an environment variable."
             )
 
-        extracted = self.add_extractor_name(extracted)
-        message.set(
-            ENTITIES_ATTRIBUTE,
-            message.get(ENTITIES_ATTRIBUTE, []) + extracted,
-            add_to_output=True,
-        )
+        for message, extracted in zip(messages, all_extracted):
+            extracted = self.add_extractor_name(extracted)
+            message.set(
+                ENTITIES_ATTRIBUTE,
+                message.get(ENTITIES_ATTRIBUTE, []) + extracted,
+                add_to_output=True,
+            )
 
     @classmethod
     def load(
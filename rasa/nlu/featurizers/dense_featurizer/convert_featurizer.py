@@ -1,5 +1,8 @@
 import logging
+import threading
+import typing
 import warnings
+from collections import OrderedDict
 from rasa.nlu.featurizers.featurizer import Featurizer
 from typing import Any, Dict, List, Optional, Text, Tuple
 from rasa.nlu.config import RasaNLUModelConfig
@@ -14,6 +17,11 @@ import tensorflow as tf
 
 logger = logging.getLogger(__name__)
 
+if typing.TYPE_CHECKING:
+    from rasa.nlu.model import Metadata
+
+MODEL_URL = "http://models.poly-ai.com/convert/v1/model.tar.gz"
+
 
 class ConveRTFeaturizer(Featurizer):
 
@@ -25,32 +33,49 @@ class ConveRTFeaturizer(Featurizer):
         # if True return a sequence of features (return vector has size
         # token-size x feature-dimension)
         # if False token-size will be equal to 1
-        "return_sequence": False
+        "return_sequence": False,
+        # number of training examples which are featurized at once
+        "batch_size": 256,
+        # maximum number of texts whose embeddings are cached,
+        # set to 0 to disable caching
+        "cache_size": 10000,
     }
 
     def _load_model(self) -> None:
+        """Load the TF-Hub module and create its session.
+
+        The model is loaded on first use, so that no TensorFlow session exists
+        yet when a loaded interpreter is shared with forked processes."""
 
         # needed in order to load model
         import tensorflow_text
         import tensorflow_hub as tfhub
 
         self.graph = tf.Graph()
-        model_url = "http://models.poly-ai.com/convert/v1/model.tar.gz"
 
         with self.graph.as_default():
-            self.session = tf.Session()
-            self.module = tfhub.Module(model_url)
+            session = tf.Session()
+            self.module = tfhub.Module(MODEL_URL)
 
             self.text_placeholder = tf.placeholder(dtype=tf.string, shape=[None])
             self.encoding_tensor = self.module(self.text_placeholder)
-            self.session.run(tf.tables_initializer())
-            self.session.run(tf.global_variables_initializer())
+            session.run(tf.tables_initializer())
+            session.run(tf.global_variables_initializer())
+
+        # set last, the model is used as soon as the session is set
+        self.session = session
 
     def __init__(self, component_config: Optional[Dict[Text, Any]] = None) -> None:
 
         super(ConveRTFeaturizer, self).__init__(component_config)
 
-        self._load_model()
+        self.session = None
+        self._model_lock = threading.Lock()
+
+        # least recently used texts are evicted first
+        self._embedding_cache = OrderedDict()
+        # the featurizer is shared by the models of a process
+        self._embedding_cache_lock = threading.Lock()
 
         self.return_sequence = self.component_config["return_sequence"]
 
@@ -68,6 +93,19 @@ class ConveRTFeaturizer(Featurizer):
     def required_packages(cls) -> List[Text]:
         return ["tensorflow_text", "tensorflow_hub"]
 
+    @classmethod
+    def cache_key(
+        cls, component_meta: Dict[Text, Any], model_metadata: "Metadata"
+    ) -> Optional[Text]:
+
+        # the featurizer has no trained state, hence the loaded TF-Hub module,
+        # its session and the embedding cache can be reused by every model
+        # with the same configuration
+        batch_size = component_meta.get("batch_size", cls.defaults["batch_size"])
+        cache_size = component_meta.get("cache_size", cls.defaults["cache_size"])
+
+        return f"{cls.name}-{MODEL_URL}-{batch_size}-{cache_size}"
+
     def _compute_features(
         self, batch_examples: List[Message], attribute: Text = TEXT_ATTRIBUTE
     ) -> np.ndarray:
@@ -75,12 +113,49 @@ class ConveRTFeaturizer(Featurizer):
         # Get text for attribute of each example
         batch_attribute_text = [ex.get(attribute) for ex in batch_examples]
 
-        batch_features = self._run_model_on_text(batch_attribute_text)
+        batch_features = self._embed(batch_attribute_text)
 
         return batch_features
 
+    def _embed(self, texts: List[Text]) -> np.ndarray:
+        """Compute the embeddings of texts which are not in the cache yet."""
+
+        cache_size = self.component_config["cache_size"]
+        if not cache_size:
+            return self._run_model_on_text(texts)
+
+        embeddings = {}
+        with self._embedding_cache_lock:
+            for text in texts:
+                if text in self._embedding_cache:
+                    self._embedding_cache.move_to_end(text)
+                    embeddings[text] = self._embedding_cache[text]
+
+        # every text is only passed to the model once, even if it occurs
+        # multiple times in the batch
+        missing = [text for text in dict.fromkeys(texts) if text not in embeddings]
+
+        if missing:
+            # the model runs without the lock, other threads can use the cache
+            computed = self._run_model_on_text(missing)
+
+            with self._embedding_cache_lock:
+                for text, embedding in zip(missing, computed):
+                    embeddings[text] = embedding
+                    self._embedding_cache[text] = embedding
+
+                while len(self._embedding_cache) > cache_size:
+                    self._embedding_cache.popitem(last=False)
+
+        return np.array([embeddings[text] for text in texts])
+
     def _run_model_on_text(self, batch: List[Text]) -> np.ndarray:
 
+        if self.session is None:
+            with self._model_lock:
+                if self.session is None:
+                    self._load_model()
+
         return self.session.run(
             self.encoding_tensor, feed_dict={self.text_placeholder: batch}
         )
@@ -100,7 +175,7 @@ class ConveRTFeaturizer(Featurizer):
                 f"However, you are training in '{config.language}'."
             )
 
-        batch_size = 64
+        batch_size = self.component_config["batch_size"]
 
         for attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
 
@@ -136,12 +211,18 @@ class ConveRTFeaturizer(Featurizer):
 
     def process(self, message: Message, **kwargs: Any) -> None:
 
-        feats = self._compute_features([message])[0]
-        message.set(
-            DENSE_FEATURE_NAMES[TEXT_ATTRIBUTE],
-            self._combine_with_existing_dense_features(
-                message,
-                np.expand_dims(feats, axis=0),
+        self.process_batch([message])
+
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+
+        batch_features = self._compute_features(messages)
+
+        for index, message in enumerate(messages):
+            message.set(
                 DENSE_FEATURE_NAMES[TEXT_ATTRIBUTE],
-            ),
-        )
+                self._combine_with_existing_dense_features(
+                    message,
+                    np.expand_dims(batch_features[index], axis=0),
+                    DENSE_FEATURE_NAMES[TEXT_ATTRIBUTE],
+                ),
+            )
@@ -1,10 +1,13 @@
 import logging
 import os
 import re
+import threading
+import numpy as np
 import scipy.sparse
 from typing import Any, Dict, List, Optional, Text
 
 from sklearn.feature_extraction.text import CountVectorizer
+import rasa.utils.io
 from rasa.nlu import utils
 from rasa.nlu.config import RasaNLUModelConfig
 from rasa.nlu.featurizers.featurizer import Featurizer
@@ -215,6 +218,12 @@ class CountVectorsFeaturizer(Featurizer):
         # declare class instance for CountVectorizer
         self.vectorizers = vectorizers
 
+        # vocabulary file which is read on first use if the model was
+        # loaded lazily
+        self._deferred_vocabulary_file = None
+        # the component is shared by the interpreters of a process
+        self._vocabulary_lock = threading.Lock()
+
     @staticmethod
     def _get_message_tokens_by_attribute(
         message: "Message", attribute: Text
@@ -405,22 +414,24 @@ class CountVectorsFeaturizer(Featurizer):
     def _create_sequence(
         self, attribute: Text, all_tokens: List[List[Text]]
     ) -> List[scipy.sparse.coo_matrix]:
-        X = []
+        # set input to list of tokens if sequence should be returned
+        # otherwise join all tokens to a single string and pass that as a list
+        if self.return_sequence:
+            inputs = all_tokens
+        else:
+            inputs = [[" ".join(tokens)] for tokens in all_tokens]
 
-        for i, tokens in enumerate(all_tokens):
-            # vectorizer.transform returns a sparse matrix of size
-            # [n_samples, n_features]
-            # set input to list of tokens if sequence should be returned
-            # otherwise join all tokens to a single string and pass that as a list
-            input = tokens
-            if not self.return_sequence:
-                input = [" ".join(tokens)]
+        # transform the rows of all messages at once and split the result
+        # back into one matrix per message afterwards
+        offsets = np.cumsum([0] + [len(rows) for rows in inputs])
+        rows = [row for message_rows in inputs for row in message_rows]
 
-            x = self.vectorizers[attribute].transform(input)
-            x.sort_indices()
-            X.append(x.tocoo())
+        # vectorizer.transform returns a sparse matrix of size
+        # [n_samples, n_features]
+        X = self.vectorizers[attribute].transform(rows).tocsr()
+        X.sort_indices()
 
-        return X
+        return [X[start:end].tocoo() for start, end in zip(offsets[:-1], offsets[1:])]
 
     def _get_featurized_attribute(
         self, attribute: Text, all_tokens: List[List[Text]]
@@ -492,6 +503,13 @@ class CountVectorsFeaturizer(Featurizer):
     def process(self, message: Message, **kwargs: Any) -> None:
         """Process incoming message and compute and set features"""
 
+        self.process_batch([message])
+
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Process a batch of incoming messages with a single transform"""
+
+        self.load_deferred_vocabulary()
+
         if self.vectorizers is None:
             logger.error(
                 "There is no trained CountVectorizer: "
@@ -501,21 +519,23 @@ class CountVectorsFeaturizer(Featurizer):
             return
 
         attribute = TEXT_ATTRIBUTE
-        message_tokens = self._get_processed_message_tokens_by_attribute(
-            message, attribute
-        )
+        all_tokens = [
+            self._get_processed_message_tokens_by_attribute(message, attribute)
+            for message in messages
+        ]
 
-        # features shape (1, seq, dim)
-        features = self._create_sequence(attribute, [message_tokens])
+        # features shape (batch, seq, dim)
+        features = self._create_sequence(attribute, all_tokens)
 
-        message.set(
-            SPARSE_FEATURE_NAMES[attribute],
-            self._combine_with_existing_sparse_features(
-                message,
-                features[0],  # 0 -> batch dimension
-                feature_name=SPARSE_FEATURE_NAMES[attribute],
-            ),
-        )
+        for message, message_features in zip(messages, features):
+            message.set(
+                SPARSE_FEATURE_NAMES[attribute],
+                self._combine_with_existing_sparse_features(
+                    message,
+                    message_features,
+                    feature_name=SPARSE_FEATURE_NAMES[attribute],
+                ),
+            )
 
     def _collect_vectorizer_vocabularies(self) -> Dict[Text, Optional[Dict[Text, int]]]:
         """Get vocabulary for all attributes"""
@@ -539,7 +559,9 @@ class CountVectorsFeaturizer(Featurizer):
         Returns the metadata necessary to load the model again.
         """
 
-        file_name = file_name + ".pkl"
+        self.load_deferred_vocabulary()
+
+        file_name = file_name + ".vocab.json"
 
         if self.vectorizers:
             # vectorizer instance was not None, some models could have been trained
@@ -551,14 +573,75 @@ class CountVectorsFeaturizer(Featurizer):
                 if self.use_shared_vocab:
                     # Only persist vocabulary from one attribute. Can be loaded and
                     # distributed to all attributes.
-                    vocab = attribute_vocabularies[TEXT_ATTRIBUTE]
+                    vocab = self._compact_vocabulary(
+                        attribute_vocabularies[TEXT_ATTRIBUTE]
+                    )
                 else:
-                    vocab = attribute_vocabularies
+                    vocab = {
+                        attribute: self._compact_vocabulary(vocabulary)
+                        for attribute, vocabulary in attribute_vocabularies.items()
+                    }
 
-                utils.json_pickle(featurizer_file, vocab)
+                rasa.utils.io.dump_obj_as_json_to_file(featurizer_file, vocab)
 
         return {"file": file_name}
 
+    @staticmethod
+    def _compact_vocabulary(
+        vocabulary: Optional[Dict[Text, int]]
+    ) -> Optional[List[Text]]:
+        """Store a vocabulary as list of its tokens ordered by their index."""
+
+        if vocabulary is None:
+            return None
+        return sorted(vocabulary.keys(), key=vocabulary.__getitem__)
+
+    @staticmethod
+    def _expand_vocabulary(
+        vocabulary: Optional[List[Text]],
+    ) -> Optional[Dict[Text, int]]:
+        if vocabulary is None:
+            return None
+        return {token: idx for idx, token in enumerate(vocabulary)}
+
+    @classmethod
+    def _read_vocabulary(cls, featurizer_file: Text, use_shared_vocab: bool) -> Any:
+        if featurizer_file.endswith(".pkl"):
+            # models trained with previous versions store pickled vocabularies
+            return utils.json_unpickle(featurizer_file)
+
+        vocabulary = rasa.utils.io.read_json_file(featurizer_file)
+        if use_shared_vocab:
+            return cls._expand_vocabulary(vocabulary)
+        return {
+            attribute: cls._expand_vocabulary(attribute_vocabulary)
+            for attribute, attribute_vocabulary in vocabulary.items()
+        }
+
+    def _create_vectorizers_from_file(self, featurizer_file: Text) -> None:
+        vocabulary = self._read_vocabulary(featurizer_file, self.use_shared_vocab)
+
+        if self.use_shared_vocab:
+            self.vectorizers = self._create_shared_vocab_vectorizers(
+                self.component_config, vocabulary=vocabulary
+            )
+        else:
+            self.vectorizers = self._create_independent_vocab_vectorizers(
+                self.component_config, vocabulary=vocabulary
+            )
+
+    def load_deferred_vocabulary(self) -> None:
+        """Read the vocabulary if loading it was deferred."""
+
+        if self._deferred_vocabulary_file is None:
+            return
+
+        with self._vocabulary_lock:
+            if self._deferred_vocabulary_file is not None:
+                self._create_vectorizers_from_file(self._deferred_vocabulary_file)
+                # cleared last, other threads use the vectorizers afterwards
+                self._deferred_vocabulary_file = None
+
     @classmethod
     def _create_shared_vocab_vectorizers(
         cls, parameters: Dict[Text, Any], vocabulary: Optional[Any] = None
@@ -613,6 +696,20 @@ class CountVectorsFeaturizer(Featurizer):
 
         return attribute_vectorizers
 
+    @classmethod
+    def cache_key(
+        cls, component_meta: Dict[Text, Any], model_metadata: Metadata
+    ) -> Optional[Text]:
+
+        file_name = component_meta.get("file")
+        if not file_name:
+            return None
+
+        # identical vocabularies (e.g. of a reloaded model) share one instance
+        return cls._fingerprint_cache_key(
+            component_meta, model_metadata, file_prefix=file_name
+        )
+
     @classmethod
     def load(
         cls,
@@ -626,20 +723,22 @@ class CountVectorsFeaturizer(Featurizer):
         file_name = meta.get("file")
         featurizer_file = os.path.join(model_dir, file_name)
 
+        if cached_component:
+            with cached_component._vocabulary_lock:
+                if cached_component._deferred_vocabulary_file is not None:
+                    # the directory of the model it was loaded for might be gone
+                    cached_component._deferred_vocabulary_file = featurizer_file
+            return cached_component
+
         if not os.path.exists(featurizer_file):
             return cls(meta)
 
-        vocabulary = utils.json_unpickle(featurizer_file)
-
-        share_vocabulary = meta["use_shared_vocab"]
+        component = cls(meta)
 
-        if share_vocabulary:
-            vectorizers = cls._create_shared_vocab_vectorizers(
-                meta, vocabulary=vocabulary
-            )
+        if kwargs.get("lazy_load"):
+            # the vocabulary is read when the component is used first
+            component._deferred_vocabulary_file = featurizer_file
         else:
-            vectorizers = cls._create_independent_vocab_vectorizers(
-                meta, vocabulary=vocabulary
-            )
+            component._create_vectorizers_from_file(featurizer_file)
 
-        return cls(meta, vectorizers)
+        return component
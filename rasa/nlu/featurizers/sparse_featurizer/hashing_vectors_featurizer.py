@@ -0,0 +1,274 @@
+import logging
+import re
+import typing
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Text
+
+import numpy as np
+import scipy.sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from rasa.nlu.config import RasaNLUModelConfig
+from rasa.nlu.featurizers.featurizer import Featurizer
+from rasa.nlu.training_data import Message, TrainingData
+from rasa.nlu.constants import (
+    TEXT_ATTRIBUTE,
+    TOKENS_NAMES,
+    MESSAGE_ATTRIBUTES,
+    SPARSE_FEATURE_NAMES,
+    INTENT_ATTRIBUTE,
+    DENSE_FEATURIZABLE_ATTRIBUTES,
+)
+
+logger = logging.getLogger(__name__)
+
+if typing.TYPE_CHECKING:
+    from rasa.nlu.model import Metadata
+
+
+def _word_ngrams(tokens: List[Text], min_ngram: int, max_ngram: int) -> Iterator[Text]:
+    """Generate word n-grams from already tokenized text."""
+
+    for n in range(min_ngram, max_ngram + 1):
+        for start in range(len(tokens) - n + 1):
+            yield " ".join(tokens[start : start + n])
+
+
+def _char_wb_ngrams(
+    tokens: List[Text], min_ngram: int, max_ngram: int
+) -> Iterator[Text]:
+    """Generate character n-grams inside the boundaries of every token.
+
+    Tokens are padded with space, matching sklearn's `char_wb` analyzer.
+    Padded tokens which are shorter than an n-gram are generated once."""
+
+    for token in tokens:
+        padded_token = f" {token} "
+        for n in range(min_ngram, max_ngram + 1):
+            for start in range(max(len(padded_token) - n + 1, 1)):
+                yield padded_token[start : start + n]
+            if n >= len(padded_token):
+                break
+
+
+def _char_ngrams(tokens: List[Text], min_ngram: int, max_ngram: int) -> Iterator[Text]:
+    """Generate character n-grams across the whitespace joined tokens."""
+
+    text = " ".join(tokens)
+    for n in range(min_ngram, max_ngram + 1):
+        for start in range(len(text) - n + 1):
+            yield text[start : start + n]
+
+
+NGRAM_GENERATORS = {
+    "word": _word_ngrams,
+    "char_wb": _char_wb_ngrams,
+    "char": _char_ngrams,
+}
+
+
+class HashingVectorsFeaturizer(Featurizer):
+    """Creates a sequence of hashed n-gram count features.
+
+    In contrast to the `CountVectorsFeaturizer` no vocabulary is fitted.
+    N-grams are generated from the tokens of the tokenizer and mapped to a
+    fixed number of features with the hashing trick (based on sklearn's
+    `HashingVectorizer`). Hence, nothing has to be stored in the model and
+    training data can be featurized in chunks.
+
+    All tokens which consist only of digits (e.g. 123 and 99
+    but not ab12d) will be represented by a single feature.
+    """
+
+    provides = [SPARSE_FEATURE_NAMES[attribute] for attribute in MESSAGE_ATTRIBUTES]
+
+    requires = [TOKENS_NAMES[attribute] for attribute in DENSE_FEATURIZABLE_ATTRIBUTES]
+
+    defaults = {
+        # whether to use word or character n-grams
+        # 'char_wb' creates character n-grams inside word boundaries
+        # n-grams at the edges of words are padded with space.
+        "analyzer": "word",  # use 'char' or 'char_wb' for character
+        # set range of ngrams to be extracted
+        "min_ngram": 1,  # int
+        "max_ngram": 1,  # int
+        # number of features (hash buckets) of the feature vectors
+        "n_features": 16384,  # int
+        # if convert all characters to lowercase
+        "lowercase": True,  # bool
+        # number of messages which are featurized at once during training
+        "batch_size": 1024,  # int
+        # if True return a sequence of features (return vector has size
+        # token-size x feature-dimension)
+        # if False token-size will be equal to 1
+        "return_sequence": False,
+    }
+
+    @classmethod
+    def required_packages(cls) -> List[Text]:
+        return ["sklearn"]
+
+    def __init__(self, component_config: Optional[Dict[Text, Any]] = None) -> None:
+        """Construct a new hashing vectorizer using the sklearn framework."""
+
+        super().__init__(component_config)
+
+        self.analyzer = self.component_config["analyzer"]
+        if self.analyzer not in NGRAM_GENERATORS:
+            raise ValueError(
+                f"Analyzer '{self.analyzer}' is not supported by the "
+                f"HashingVectorsFeaturizer. Please use one of "
+                f"{list(NGRAM_GENERATORS.keys())}."
+            )
+
+        self.min_ngram = self.component_config["min_ngram"]
+        self.max_ngram = self.component_config["max_ngram"]
+        self.n_features = self.component_config["n_features"]
+        self.lowercase = self.component_config["lowercase"]
+        self.batch_size = self.component_config["batch_size"]
+
+        if self.analyzer != "word" and self.max_ngram == 1:
+            logger.warning(
+                "Analyzer is set to character, "
+                "but max n-gram is set to 1. "
+                "It means that the features will "
+                "represent single letters only."
+            )
+
+        # set which attributes to featurize
+        # intents should be featurized only by word level vectorizer
+        self._attributes = (
+            MESSAGE_ATTRIBUTES
+            if self.analyzer == "word"
+            else DENSE_FEATURIZABLE_ATTRIBUTES
+        )
+
+        self.vectorizer = HashingVectorizer(
+            analyzer=self._ngram_generator(),
+            n_features=self.n_features,
+            alternate_sign=False,
+            norm=None,
+        )
+
+    @classmethod
+    def cache_key(
+        cls, component_meta: Dict[Text, Any], model_metadata: "Metadata"
+    ) -> Optional[Text]:
+
+        # nothing is fitted, the featurizer only depends on its configuration
+        return cls._fingerprint_cache_key(component_meta, model_metadata)
+
+    def _ngram_generator(self) -> Callable[[List[Text]], List[Text]]:
+        ngrams = NGRAM_GENERATORS[self.analyzer]
+        return partial(_list_ngrams, ngrams, self.min_ngram, self.max_ngram)
+
+    def _get_processed_message_tokens_by_attribute(
+        self, message: Message, attribute: Text = TEXT_ATTRIBUTE
+    ) -> List[Text]:
+        """Get processed tokens of attribute of a message"""
+
+        if message.get(attribute) is None:
+            return []
+
+        if message.get(TOKENS_NAMES[attribute]):
+            tokens = [t.lemma for t in message.get(TOKENS_NAMES[attribute])]
+        else:
+            tokens = message.get(attribute).split()
+
+        if attribute == INTENT_ATTRIBUTE:
+            # Don't do any processing for intent attribute. Treat them as whole labels
+            return tokens
+
+        # replace all digits with NUMBER token
+        tokens = [re.sub(r"\b[0-9]+\b", "__NUMBER__", text) for text in tokens]
+
+        # convert to lowercase if necessary
+        if self.lowercase:
+            tokens = [text.lower() for text in tokens]
+
+        return tokens
+
+    def _create_sequences(
+        self, all_tokens: List[List[Text]]
+    ) -> List[scipy.sparse.coo_matrix]:
+        """Featurize the tokens of many messages with a single transform.
+
+        Every row of the transformed matrix is either a token (sequence) or
+        a complete message. The rows are split back into one matrix per
+        message afterwards."""
+
+        if self.return_sequence:
+            # an empty message is represented by a single all-zero row
+            documents = [
+                [[token] for token in tokens] if tokens else [[]]
+                for tokens in all_tokens
+            ]
+        else:
+            documents = [[tokens] for tokens in all_tokens]
+
+        offsets = np.cumsum([0] + [len(rows) for rows in documents])
+        rows = [row for message_rows in documents for row in message_rows]
+
+        X = self.vectorizer.transform(rows).tocsr()
+        X.sort_indices()
+
+        return [X[start:end].tocoo() for start, end in zip(offsets[:-1], offsets[1:])]
+
+    def _featurize_messages(self, messages: List[Message], attribute: Text) -> None:
+        all_tokens = [
+            self._get_processed_message_tokens_by_attribute(message, attribute)
+            for message in messages
+        ]
+
+        for message, features in zip(messages, self._create_sequences(all_tokens)):
+            message.set(
+                SPARSE_FEATURE_NAMES[attribute],
+                self._combine_with_existing_sparse_features(
+                    message, features, SPARSE_FEATURE_NAMES[attribute]
+                ),
+            )
+
+    def train(
+        self,
+        training_data: TrainingData,
+        cfg: Optional[RasaNLUModelConfig] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Featurize the training data.
+
+        There is nothing to fit, hence the examples are processed chunk by
+        chunk to keep memory usage bounded."""
+
+        examples = training_data.training_examples
+
+        for attribute in self._attributes:
+            if not any(example.get(attribute) for example in examples):
+                logger.debug(
+                    f"No text provided for {attribute} attribute in any messages of "
+                    f"training data. Skipping featurizing it."
+                )
+                continue
+
+            for start in range(0, len(examples), self.batch_size):
+                self._featurize_messages(
+                    examples[start : start + self.batch_size], attribute
+                )
+
+    def process(self, message: Message, **kwargs: Any) -> None:
+        """Process incoming message and compute and set features"""
+
+        self._featurize_messages([message], TEXT_ATTRIBUTE)
+
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Process a batch of incoming messages with a single transform"""
+
+        self._featurize_messages(messages, TEXT_ATTRIBUTE)
+
+
+def _list_ngrams(
+    ngrams: Callable[[List[Text], int, int], Iterator[Text]],
+    min_ngram: int,
+    max_ngram: int,
+    tokens: List[Text],
+) -> List[Text]:
+    return list(ngrams(tokens, min_ngram, max_ngram))
@@ -2,6 +2,7 @@ import copy
 import datetime
 import logging
 import os
+import weakref
 from typing import Any, Dict, List, Optional, Text
 
 import rasa.nlu
@@ -145,6 +146,8 @@ class Trainer:
 
         # build pipeline
         self.pipeline = self._build_pipeline(cfg, component_builder)
+        # cached components may be evicted once the trainer is gone
+        weakref.finalize(self, component_builder.release_components, self.pipeline)
 
     @staticmethod
     def _build_pipeline(
@@ -280,6 +283,7 @@ class Interpreter:
         model_dir: Text,
         component_builder: Optional[ComponentBuilder] = None,
         skip_validation: bool = False,
+        lazy_load: bool = False,
     ) -> "Interpreter":
         """Create an interpreter based on a persisted model.
 
@@ -290,6 +294,9 @@ class Interpreter:
             model_dir: The path of the model to load
             component_builder: The
                 :class:`rasa.nlu.components.ComponentBuilder` to use.
+            lazy_load: If set to `True`, components defer restoring large
+                artefacts until they are used for the first time and
+                memory-map numeric arrays where possible.
 
         Returns:
             An interpreter that uses the loaded model.
@@ -298,13 +305,16 @@ class Interpreter:
         model_metadata = Metadata.load(model_dir)
 
         Interpreter.ensure_model_compatibility(model_metadata)
-        return Interpreter.create(model_metadata, component_builder, skip_validation)
+        return Interpreter.create(
+            model_metadata, component_builder, skip_validation, lazy_load
+        )
 
     @staticmethod
     def create(
         model_metadata: Metadata,
         component_builder: Optional[ComponentBuilder] = None,
         skip_validation: bool = False,
+        lazy_load: bool = False,
     ) -> "Interpreter":
         """Load stored model and components defined by the provided metadata."""
 
@@ -325,7 +335,11 @@ class Interpreter:
         for i in range(model_metadata.number_of_components):
             component_meta = model_metadata.for_component(i)
             component = component_builder.load_component(
-                component_meta, model_metadata.model_dir, model_metadata, **context
+                component_meta,
+                model_metadata.model_dir,
+                model_metadata,
+                lazy_load=lazy_load,
+                **context,
             )
             try:
                 updates = component.provide_context()
@@ -338,7 +352,10 @@ class Interpreter:
                     "{}".format(component.name, e)
                 )
 
-        return Interpreter(pipeline, context, model_metadata)
+        interpreter = Interpreter(pipeline, context, model_metadata)
+        # cached components may be evicted once the interpreter is gone
+        weakref.finalize(interpreter, component_builder.release_components, pipeline)
+        return interpreter
 
     def __init__(
         self,
@@ -378,3 +395,40 @@ class Interpreter:
         output = self.default_output_attributes()
         output.update(message.as_dict(only_output_properties=only_output_properties))
         return output
+
+    def parse_batch(
+        self,
+        texts: List[Text],
+        time: Optional[datetime.datetime] = None,
+        only_output_properties: bool = True,
+    ) -> List[Dict[Text, Any]]:
+        """Parse several input texts at once.
+
+        Every component processes the whole batch before the next component
+        is run, which allows components to vectorize their computations.
+        The results are returned in the order of `texts`."""
+
+        messages = [
+            Message(text, self.default_output_attributes(), time=time)
+            for text in texts
+            if text
+        ]
+
+        if messages:
+            for component in self.pipeline:
+                component.process_batch(messages, **self.context)
+
+        parsed_messages = iter(messages)
+        outputs = []
+        for text in texts:
+            output = self.default_output_attributes()
+            if text:
+                message = next(parsed_messages)
+                output.update(
+                    message.as_dict(only_output_properties=only_output_properties)
+                )
+            else:
+                output["text"] = ""
+            outputs.append(output)
+
+        return outputs
@@ -22,6 +22,9 @@ from rasa.nlu.extractors.spacy_entity_extractor import SpacyEntityExtractor
 from rasa.nlu.featurizers.sparse_featurizer.count_vectors_featurizer import (
     CountVectorsFeaturizer,
 )
+from rasa.nlu.featurizers.sparse_featurizer.hashing_vectors_featurizer import (
+    HashingVectorsFeaturizer,
+)
 from rasa.nlu.featurizers.dense_featurizer.mitie_featurizer import MitieFeaturizer
 from rasa.nlu.featurizers.sparse_featurizer.regex_featurizer import RegexFeaturizer
 from rasa.nlu.featurizers.dense_featurizer.spacy_featurizer import SpacyFeaturizer
@@ -65,6 +68,7 @@ component_classes = [
     MitieFeaturizer,
     RegexFeaturizer,
     CountVectorsFeaturizer,
+    HashingVectorsFeaturizer,
     ConveRTFeaturizer,
     # classifiers
     SklearnIntentClassifier,
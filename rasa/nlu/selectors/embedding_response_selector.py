@@ -1,6 +1,6 @@
 import logging
 import typing
-from typing import Any, Dict, Text
+from typing import Any, Dict, List, Text
 
 from rasa.nlu.classifiers.embedding_intent_classifier import EmbeddingIntentClassifier
 from rasa.nlu.constants import (
@@ -157,10 +157,13 @@ class ResponseSelector(EmbeddingIntentClassifier):
 
         return session_data
 
-    def process(self, message: "Message", **kwargs: Any) -> None:
-        """Return the most likely response and its similarity to the input."""
-
-        label, label_ranking = self.predict_label(message)
+    def _add_prediction(
+        self,
+        message: "Message",
+        label: Dict[Text, Any],
+        label_ranking: List[Dict[Text, Any]],
+    ) -> None:
+        """Add the most likely response and its similarity to the input."""
 
         selector_key = (
             self.retrieval_intent
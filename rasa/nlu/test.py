@@ -1,3 +1,5 @@
+import contextlib
+import copy
 import itertools
 import os
 import logging
@@ -6,6 +8,7 @@ from collections import defaultdict, namedtuple
 from tqdm import tqdm
 from typing import (
     Iterable,
+    Callable,
     Collection,
     Iterator,
     Tuple,
@@ -32,6 +35,7 @@ from rasa.nlu.utils import write_to_file
 from rasa.nlu.components import ComponentBuilder
 from rasa.nlu.config import RasaNLUModelConfig
 from rasa.nlu.model import Interpreter, Trainer, TrainingData
+from rasa.nlu.training_data import Message
 from rasa.nlu.components import Component
 from rasa.nlu.tokenizers.tokenizer import Token
 from rasa.core.constants import RESPOND_PREFIX
@@ -44,8 +48,19 @@ ENTITY_PROCESSORS = {"EntitySynonymMapper"}
 
 CVEvaluationResult = namedtuple("Results", "train test")
 
+FoldEvaluationResult = namedtuple(
+    "FoldEvaluationResult",
+    "train_metrics "
+    "test_metrics "
+    "extractors "
+    "intent_classifier_present "
+    "response_selector_present",
+)
+
 NO_ENTITY = "no_entity"
 
+DEFAULT_EVALUATION_BATCH_SIZE = 64
+
 IntentEvaluationResult = namedtuple(
     "IntentEvaluationResult", "intent_target intent_prediction message confidence"
 )
@@ -904,8 +919,24 @@ def align_all_entity_predictions(
     return aligned_predictions
 
 
+def _parse_in_batches(
+    interpreter: Interpreter, examples: List[Message], batch_size: int
+) -> Iterator[Tuple[Message, Dict[Text, Any]]]:
+    """Parses the examples in chunks of `batch_size` and yields every example
+    together with its parse result."""
+
+    for start in range(0, len(examples), batch_size):
+        batch = examples[start : start + batch_size]
+        results = interpreter.parse_batch(
+            [example.text for example in batch], only_output_properties=False
+        )
+        yield from zip(batch, results)
+
+
 def get_eval_data(
-    interpreter: Interpreter, test_data: TrainingData
+    interpreter: Interpreter,
+    test_data: TrainingData,
+    batch_size: int = DEFAULT_EVALUATION_BATCH_SIZE,
 ) -> Tuple[
     List[IntentEvaluationResult],
     List[ResponseSelectionEvaluationResult],
@@ -913,6 +944,9 @@ def get_eval_data(
 ]:  # pragma: no cover
     """Runs the model for the test set and extracts targets and predictions.
 
+    The test examples are run through the pipeline in batches of
+    `batch_size` messages.
+
     Returns intent results (intent targets and predictions, the original
     messages and the confidences of the predictions), as well as entity
     results(entity_targets, entity_predictions, and tokens)."""
@@ -939,8 +973,10 @@ def get_eval_data(
 
     should_eval_entities = is_entity_extractor_present(interpreter)
 
-    for example in tqdm(test_data.training_examples):
-        result = interpreter.parse(example.text, only_output_properties=False)
+    examples = test_data.training_examples
+    for example, result in tqdm(
+        _parse_in_batches(interpreter, examples, batch_size), total=len(examples)
+    ):
 
         if should_eval_intents:
             intent_prediction = result.get("intent", {}) or {}
@@ -1054,6 +1090,7 @@ def run_evaluation(
     histogram: Optional[Text] = None,
     component_builder: Optional[ComponentBuilder] = None,
     disable_plotting: bool = False,
+    batch_size: int = DEFAULT_EVALUATION_BATCH_SIZE,
 ) -> Dict:  # pragma: no cover
     """
     Evaluate intent classification, response selection and entity extraction.
@@ -1067,6 +1104,7 @@ def run_evaluation(
     :param histogram: path fo file that will show a histogram
     :param component_builder: component builder
     :param disable_plotting: if true confusion matrix and histogram will not be rendered
+    :param batch_size: number of test examples which are parsed at once
 
     :return: dictionary containing evaluation results
     """
@@ -1087,7 +1125,7 @@ def run_evaluation(
         io_utils.create_directory(output_directory)
 
     intent_results, response_selection_results, entity_results, = get_eval_data(
-        interpreter, test_data
+        interpreter, test_data, batch_size
     )
 
     if intent_results:
@@ -1166,6 +1204,31 @@ def combine_result(
     are also collected.
     """
 
+    return _merge_metrics(
+        intent_metrics,
+        entity_metrics,
+        response_selection_metrics,
+        compute_metrics(interpreter, data),
+        intent_results,
+        entity_results,
+        response_selection_results,
+    )
+
+
+def _merge_metrics(
+    intent_metrics: IntentMetrics,
+    entity_metrics: EntityMetrics,
+    response_selection_metrics: ResponseSelectionMetrics,
+    current_metrics: Tuple,
+    intent_results: Optional[List[IntentEvaluationResult]] = None,
+    entity_results: Optional[List[EntityEvaluationResult]] = None,
+    response_selection_results: Optional[
+        List[ResponseSelectionEvaluationResult]
+    ] = None,
+) -> Tuple[IntentMetrics, EntityMetrics, ResponseSelectionMetrics]:
+    """Adds the output of `compute_metrics` for one fold to the accumulated
+    metrics and prediction results."""
+
     (
         intent_current_metrics,
         entity_current_metrics,
@@ -1173,7 +1236,7 @@ def combine_result(
         current_intent_results,
         current_entity_results,
         current_response_selection_results,
-    ) = compute_metrics(interpreter, data)
+    ) = current_metrics
 
     if intent_results is not None:
         intent_results += current_intent_results
@@ -1205,6 +1268,120 @@ def _contains_entity_labels(entity_results: List[EntityEvaluationResult]) -> boo
             return True
 
 
+def _evaluate_fold(
+    trainer: Trainer, train: TrainingData, test: TrainingData, **kwargs: Any
+) -> FoldEvaluationResult:
+    """Trains a model on the train split of a fold and evaluates it on both
+    splits."""
+
+    interpreter = trainer.train(train, **kwargs)
+
+    train_metrics = compute_metrics(interpreter, train)
+    test_metrics = compute_metrics(interpreter, test)
+
+    return FoldEvaluationResult(
+        _picklable_metrics(train_metrics),
+        _picklable_metrics(test_metrics),
+        get_entity_extractors(interpreter),
+        is_intent_classifier_present(interpreter),
+        is_response_selector_present(interpreter),
+    )
+
+
+def _picklable_metrics(metrics: Tuple) -> Tuple:
+    """Replaces the nested `defaultdict` of the entity metrics with plain
+    dictionaries so that fold results can be sent between processes."""
+
+    intent_metrics, entity_metrics, *rest = metrics
+    entity_metrics = {
+        extractor: dict(extractor_metrics)
+        for extractor, extractor_metrics in entity_metrics.items()
+    }
+    return (intent_metrics, entity_metrics, *rest)
+
+
+@contextlib.contextmanager
+def _limit_worker_threads(threads_per_job: int) -> Iterator[None]:
+    """Restricts the number of threads numeric libraries may use within the
+    worker processes which are started in this context.
+
+    The limits have to be set before numpy / TensorFlow are imported. Spawned
+    workers import them while unpickling their task, before any initializer
+    runs, hence the limits are passed on with the environment of the parent
+    process."""
+
+    variables = ["OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"]
+    previous_values = {variable: os.environ.get(variable) for variable in variables}
+    os.environ.update({variable: str(threads_per_job) for variable in variables})
+    try:
+        yield
+    finally:
+        for variable, value in previous_values.items():
+            if value is None:
+                os.environ.pop(variable, None)
+            else:
+                os.environ[variable] = value
+
+
+def _threads_per_job(n_jobs: int) -> int:
+    return max(1, (os.cpu_count() or 1) // n_jobs)
+
+
+def _with_thread_limit(
+    nlu_config: RasaNLUModelConfig, threads_per_job: int
+) -> RasaNLUModelConfig:
+    """Limits TensorFlow's thread pools for every component which does not
+    specify its own `tf_config`."""
+
+    nlu_config = copy.deepcopy(nlu_config)
+    for component_config in nlu_config.pipeline:
+        component_config.setdefault(
+            "tf_config",
+            {
+                "intra_op_parallelism_threads": threads_per_job,
+                "inter_op_parallelism_threads": threads_per_job,
+            },
+        )
+    return nlu_config
+
+
+def _train_and_evaluate_fold(
+    nlu_config: RasaNLUModelConfig,
+    train: TrainingData,
+    test: TrainingData,
+    threads_per_job: int,
+) -> FoldEvaluationResult:
+    """Entry point of a cross validation worker process."""
+
+    trainer = Trainer(_with_thread_limit(nlu_config, threads_per_job))
+    trainer.pipeline = remove_pretrained_extractors(trainer.pipeline)
+
+    return _evaluate_fold(trainer, train, test, num_threads=threads_per_job)
+
+
+def _run_in_worker_pool(
+    function: Callable[..., Any], arguments: Iterable[Tuple], jobs: int
+) -> Iterator[Any]:
+    """Runs `function` for every tuple of `arguments` in a pool of `jobs`
+    worker processes.
+
+    Results are yielded in the order of `arguments`."""
+
+    from multiprocessing import get_context
+
+    threads_per_job = _threads_per_job(jobs)
+    logger.info(f"Running {jobs} parallel jobs using {threads_per_job} thread(s) each.")
+
+    # TensorFlow is not fork-safe, hence every worker starts a fresh interpreter
+    with _limit_worker_threads(threads_per_job):
+        pool = get_context("spawn").Pool(jobs)
+
+    with pool:
+        pending = [pool.apply_async(function, args) for args in arguments]
+        for result in pending:
+            yield result.get()
+
+
 def cross_validate(
     data: TrainingData,
     n_folds: int,
@@ -1215,6 +1392,7 @@ def cross_validate(
     confmat: Optional[Text] = None,
     histogram: Optional[Text] = None,
     disable_plotting: bool = False,
+    jobs: int = 1,
 ) -> Tuple[CVEvaluationResult, CVEvaluationResult, CVEvaluationResult]:
 
     """Stratified cross validation on data.
@@ -1228,6 +1406,8 @@ def cross_validate(
         errors: if true incorrect predictions are written to a file
         confmat: path to file that will show the confusion matrix
         histogram: path fo file that will show a histogram
+        jobs: number of folds which are trained and evaluated in parallel
+              worker processes
 
     Returns:
         dictionary with key, list structure, where each entry in list
@@ -1241,9 +1421,6 @@ def cross_validate(
     if output:
         io_utils.create_directory(output)
 
-    trainer = Trainer(nlu_config)
-    trainer.pipeline = remove_pretrained_extractors(trainer.pipeline)
-
     intent_train_metrics: IntentMetrics = defaultdict(list)
     intent_test_metrics: IntentMetrics = defaultdict(list)
     entity_train_metrics: EntityMetrics = defaultdict(lambda: defaultdict(list))
@@ -1259,40 +1436,49 @@ def cross_validate(
     entity_evaluation_possible = False
     extractors: Set[Text] = set()
 
-    for train, test in generate_folds(n_folds, data):
-        interpreter = trainer.train(train)
+    folds = generate_folds(n_folds, data)
+    if jobs > 1:
+        threads_per_job = _threads_per_job(jobs)
+        fold_results = _run_in_worker_pool(
+            _train_and_evaluate_fold,
+            ((nlu_config, train, test, threads_per_job) for train, test in folds),
+            jobs,
+        )
+    else:
+        trainer = Trainer(nlu_config)
+        trainer.pipeline = remove_pretrained_extractors(trainer.pipeline)
+        fold_results = (_evaluate_fold(trainer, train, test) for train, test in folds)
 
+    for fold_result in fold_results:
         # calculate train accuracy
-        combine_result(
+        _merge_metrics(
             intent_train_metrics,
             entity_train_metrics,
             response_selection_train_metrics,
-            interpreter,
-            train,
+            fold_result.train_metrics,
         )
         # calculate test accuracy
-        combine_result(
+        _merge_metrics(
             intent_test_metrics,
             entity_test_metrics,
             response_selection_test_metrics,
-            interpreter,
-            test,
+            fold_result.test_metrics,
             intent_test_results,
             entity_test_results,
             response_selection_test_results,
         )
 
         if not extractors:
-            extractors = get_entity_extractors(interpreter)
+            extractors = fold_result.extractors
             entity_evaluation_possible = (
                 entity_evaluation_possible
                 or _contains_entity_labels(entity_test_results)
             )
 
-        if is_intent_classifier_present(interpreter):
+        if fold_result.intent_classifier_present:
             intent_classifier_present = True
 
-        if is_response_selector_present(interpreter):
+        if fold_result.response_selector_present:
             response_selector_present = True
 
     if intent_classifier_present and intent_test_results:
@@ -1397,6 +1583,7 @@ def compare_nlu(
     model_names: List[Text],
     output: Text,
     runs: int,
+    jobs: int = 1,
 ) -> List[int]:
     """
     Trains and compares multiple NLU models.
@@ -1413,13 +1600,14 @@ def compare_nlu(
         model_names: names of the models to train
         output: the output directory
         runs: number of comparison runs
+        jobs: number of models which are trained and evaluated in parallel
+              worker processes
 
     Returns: training examples per run
     """
 
-    from rasa.train import train_nlu
-
     training_examples_per_run = []
+    evaluations = []
 
     for run in range(runs):
 
@@ -1448,35 +1636,80 @@ def compare_nlu(
             write_to_file(train_split_path, train.nlu_as_markdown())
 
             for nlu_config, model_name in zip(configs, model_names):
-                logger.info(
-                    "Evaluating configuration '{}' with {} training data.".format(
-                        model_name, percent_string
+                evaluations.append(
+                    (
+                        run,
+                        (
+                            nlu_config,
+                            model_name,
+                            percent_string,
+                            train_split_path,
+                            model_output_path,
+                            test_path,
+                        ),
                     )
                 )
 
-                try:
-                    model_path = train_nlu(
-                        nlu_config,
-                        train_split_path,
-                        model_output_path,
-                        fixed_model_name=model_name,
-                    )
-                except Exception as e:
-                    logger.warning(f"Training model '{model_name}' failed. Error: {e}")
-                    f_score_results[model_name][run].append(0.0)
-                    continue
+    if jobs > 1:
+        threads_per_job = _threads_per_job(jobs)
+        arguments = ((*args, threads_per_job) for _, args in evaluations)
+        f1_scores = _run_in_worker_pool(_train_and_evaluate_config, arguments, jobs)
+    else:
+        arguments = (args for _, args in evaluations)
+        f1_scores = (_train_and_evaluate_config(*args) for args in arguments)
 
-                model_path = os.path.join(get_model(model_path), "nlu")
+    for (run, (_, model_name, *_)), f1 in zip(evaluations, f1_scores):
+        f_score_results[model_name][run].append(f1)
 
-                output_path = os.path.join(model_output_path, f"{model_name}_report")
-                result = run_evaluation(
-                    test_path, model_path, output_directory=output_path, errors=True
-                )
+    return training_examples_per_run
 
-                f1 = result["intent_evaluation"]["f1_score"]
-                f_score_results[model_name][run].append(f1)
 
-    return training_examples_per_run
+def _train_and_evaluate_config(
+    nlu_config: Text,
+    model_name: Text,
+    percent_string: Text,
+    train_split_path: Text,
+    model_output_path: Text,
+    test_path: Text,
+    threads_per_job: Optional[int] = None,
+) -> float:
+    """Trains a model for one comparison configuration and returns the intent
+    f1-score on the test data.
+
+    If `threads_per_job` is set, TensorFlow's thread pools are limited to it."""
+
+    from rasa.train import train_nlu
+
+    logger.info(
+        "Evaluating configuration '{}' with {} training data.".format(
+            model_name, percent_string
+        )
+    )
+
+    if threads_per_job is not None:
+        limited_config = _with_thread_limit(config.load(nlu_config), threads_per_job)
+        nlu_config = os.path.join(model_output_path, f"{model_name}_config.yml")
+        io_utils.write_yaml_file(
+            {"language": limited_config.language, "pipeline": limited_config.pipeline},
+            nlu_config,
+        )
+
+    try:
+        model_path = train_nlu(
+            nlu_config, train_split_path, model_output_path, fixed_model_name=model_name
+        )
+    except Exception as e:
+        logger.warning(f"Training model '{model_name}' failed. Error: {e}")
+        return 0.0
+
+    model_path = os.path.join(get_model(model_path), "nlu")
+
+    output_path = os.path.join(model_output_path, f"{model_name}_report")
+    result = run_evaluation(
+        test_path, model_path, output_directory=output_path, errors=True
+    )
+
+    return result["intent_evaluation"]["f1_score"]
 
 
 def _compute_metrics(
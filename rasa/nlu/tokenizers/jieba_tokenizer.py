@@ -117,6 +117,14 @@ class JiebaTokenizer(Tokenizer):
 
         return tokens
 
+    @classmethod
+    def cache_key(
+        cls, component_meta: Dict[Text, Any], model_metadata: "Metadata"
+    ) -> Optional[Text]:
+
+        # jieba keeps its dictionary in global state, never share instances
+        return None
+
     @classmethod
     def load(
         cls,
@@ -1,6 +1,7 @@
 import logging
 import warnings
 
+import typing
 from typing import Text, List, Optional, Dict, Any
 
 from rasa.nlu.components import Component
@@ -8,6 +9,9 @@ from rasa.nlu.constants import RESPONSE_ATTRIBUTE, TEXT_ATTRIBUTE, CLS_TOKEN
 
 logger = logging.getLogger(__name__)
 
+if typing.TYPE_CHECKING:
+    from rasa.nlu.model import Metadata
+
 
 class Token(object):
     def __init__(
@@ -63,6 +67,15 @@ class Tokenizer(Component):
             )
             self.use_cls_token = False
 
+    @classmethod
+    def cache_key(
+        cls, component_meta: Dict[Text, Any], model_metadata: "Metadata"
+    ) -> Optional[Text]:
+
+        # tokenizers are not trained, hence they can be shared by all models
+        # which use the same configuration
+        return cls._fingerprint_cache_key(component_meta, model_metadata)
+
     def add_cls_token(
         self, tokens: List[Token], attribute: Text = TEXT_ATTRIBUTE
     ) -> List[Token]:
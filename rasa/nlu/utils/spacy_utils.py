@@ -1,3 +1,4 @@
+import inspect
 import logging
 import typing
 from typing import Any, Dict, List, Optional, Text, Tuple
@@ -33,6 +34,15 @@ class SpacyNLP(Component):
         # applications and models it makes sense to differentiate
         # between these two words, therefore setting this to `True`.
         "case_sensitive": False,
+        # number of texts which are processed by spaCy at once
+        "batch_size": 50,
+        # number of processes which are used to process batches of texts,
+        # requires spaCy 2.2.2 or newer
+        "num_processes": 1,
+        # spaCy pipeline components which are not needed by the
+        # components of the Rasa pipeline, e.g. the named entity recognizer
+        # (`SpacyEntityExtractor` runs the full spaCy pipeline itself)
+        "disable_pipes": ["ner"],
     }
 
     def __init__(
@@ -42,6 +52,21 @@ class SpacyNLP(Component):
         self.nlp = nlp
         super().__init__(component_config)
 
+        self._check_num_processes()
+
+    def _check_num_processes(self) -> None:
+        num_processes = self.component_config["num_processes"]
+        if (
+            self.nlp is not None
+            and num_processes != 1
+            and "n_process" not in inspect.signature(self.nlp.pipe).parameters
+        ):
+            logger.warning(
+                f"The installed spaCy version doesn't support processing texts "
+                f"in multiple processes. Ignoring 'num_processes={num_processes}'."
+            )
+            self.component_config["num_processes"] = 1
+
     @staticmethod
     def load_model(spacy_model_name: Text) -> "Language":
         """Try loading the model, catching the OSError if missing."""
@@ -99,7 +124,24 @@ class SpacyNLP(Component):
 
     def doc_for_text(self, text: Text) -> "Doc":
 
-        return self.nlp(self.preprocess_text(text))
+        return self.nlp(
+            self.preprocess_text(text), disable=self.component_config["disable_pipes"]
+        )
+
+    def _pipe_kwargs(self) -> Dict[Text, Any]:
+        kwargs = {
+            "batch_size": self.component_config["batch_size"],
+            "disable": self.component_config["disable_pipes"],
+        }
+
+        if self.component_config["num_processes"] != 1:
+            kwargs["n_process"] = self.component_config["num_processes"]
+        return kwargs
+
+    def docs_for_texts(self, texts: List[Text]) -> List["Doc"]:
+        """Process many already preprocessed texts with spaCy's `pipe`."""
+
+        return list(self.nlp.pipe(texts, **self._pipe_kwargs()))
 
     def preprocess_text(self, text: Optional[Text]) -> Text:
 
@@ -157,12 +199,7 @@ class SpacyNLP(Component):
             (to_pipe_sample[0], doc)
             for to_pipe_sample, doc in zip(
                 samples_to_pipe,
-                [
-                    doc
-                    for doc in self.nlp.pipe(
-                        [txt for _, txt in samples_to_pipe], batch_size=50
-                    )
-                ],
+                self.docs_for_texts([txt for _, txt in samples_to_pipe]),
             )
         ]
         return docs
@@ -187,7 +224,9 @@ class SpacyNLP(Component):
     ) -> Dict[Text, List[Any]]:
         attribute_docs = {}
         for attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
-            texts = [self.get_text(e, attribute) for e in training_data.intent_examples]
+            texts = [
+                self.get_text(e, attribute) for e in training_data.training_examples
+            ]
             # Index and freeze indices of the training samples for preserving the order
             # after processing the data.
             indexed_training_samples = [(idx, text) for idx, text in enumerate(texts)]
@@ -231,6 +270,14 @@ class SpacyNLP(Component):
 
         message.set(SPACY_DOCS[TEXT_ATTRIBUTE], self.doc_for_text(message.text))
 
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Process the texts of many messages with spaCy's `pipe`."""
+
+        texts = [self.preprocess_text(message.text) for message in messages]
+
+        for message, doc in zip(messages, self.docs_for_texts(texts)):
+            message.set(SPACY_DOCS[TEXT_ATTRIBUTE], doc)
+
     @classmethod
     def load(
         cls,
@@ -423,11 +423,11 @@ def create_app(
     async def status(request: Request):
         """Respond with the model name and the fingerprint of that model."""
 
+        agent = app.agent
         return response.json(
             {
-                "model_file": app.agent.path_to_model_archive
-                or app.agent.model_directory,
-                "fingerprint": model.fingerprint_from_path(app.agent.model_directory),
+                "model_file": agent.path_to_model_archive or agent.model_directory,
+                "fingerprint": model.fingerprint_from_path(agent.model_directory),
                 "num_active_training_jobs": app.active_training_processes.value,
             }
         )
@@ -467,20 +467,20 @@ def create_app(
         )
 
         verbosity = event_verbosity_parameter(request, EventVerbosity.AFTER_RESTART)
+        # the model might be replaced while this request is processed
+        agent = app.agent
 
         try:
-            async with app.agent.lock_store.lock(conversation_id):
-                tracker = await get_tracker(
-                    app.agent.create_processor(), conversation_id
-                )
+            async with agent.lock_store.lock(conversation_id):
+                tracker = await get_tracker(agent.create_processor(), conversation_id)
 
                 # Get events after tracker initialization to ensure that generated
                 # timestamps are after potential session events.
                 events = _get_events_from_request_body(request)
 
                 for event in events:
-                    tracker.update(event, app.agent.domain)
-                app.agent.tracker_store.save(tracker)
+                    tracker.update(event, agent.domain)
+                agent.tracker_store.save(tracker)
 
             return response.json(tracker.current_state(verbosity))
         except Exception as e:
@@ -524,15 +524,17 @@ def create_app(
         )
 
         verbosity = event_verbosity_parameter(request, EventVerbosity.AFTER_RESTART)
+        # the model might be replaced while this request is processed
+        agent = app.agent
 
         try:
-            async with app.agent.lock_store.lock(conversation_id):
+            async with agent.lock_store.lock(conversation_id):
                 tracker = DialogueStateTracker.from_dict(
-                    conversation_id, request.json, app.agent.domain.slots
+                    conversation_id, request.json, agent.domain.slots
                 )
 
                 # will override an existing tracker with the same id!
-                app.agent.tracker_store.save(tracker)
+                agent.tracker_store.save(tracker)
 
             return response.json(tracker.current_state(verbosity))
         except Exception as e:
@@ -584,14 +586,14 @@ def create_app(
         policy = request_params.get("policy", None)
         confidence = request_params.get("confidence", None)
         verbosity = event_verbosity_parameter(request, EventVerbosity.AFTER_RESTART)
+        # the model might be replaced while this request is processed
+        agent = app.agent
 
         try:
-            async with app.agent.lock_store.lock(conversation_id):
-                tracker = await get_tracker(
-                    app.agent.create_processor(), conversation_id
-                )
+            async with agent.lock_store.lock(conversation_id):
+                tracker = await get_tracker(agent.create_processor(), conversation_id)
                 output_channel = _get_output_channel(request, tracker)
-                await app.agent.execute_action(
+                await agent.execute_action(
                     conversation_id,
                     action_to_execute,
                     output_channel,
@@ -605,7 +607,7 @@ def create_app(
                 500, "ConversationError", f"An unexpected error occurred. Error: {e}"
             )
 
-        tracker = await get_tracker(app.agent.create_processor(), conversation_id)
+        tracker = await get_tracker(agent.create_processor(), conversation_id)
         state = tracker.current_state(verbosity)
 
         response_body = {"tracker": state}
@@ -661,10 +663,12 @@ def create_app(
             )
 
         user_message = UserMessage(message, None, conversation_id, parse_data)
+        # the model might be replaced while this request is processed
+        agent = app.agent
 
         try:
-            async with app.agent.lock_store.lock(conversation_id):
-                tracker = await app.agent.log_message(user_message)
+            async with agent.lock_store.lock(conversation_id):
+                tracker = await agent.log_message(user_message)
             return response.json(tracker.current_state(verbosity))
         except Exception as e:
             logger.debug(traceback.format_exc())
@@ -945,6 +949,8 @@ def create_app(
                     {"parameter": "model_server", "in": "body"},
                 )
 
+        # the new model is loaded in the background, requests are handled by
+        # the previous model until the new one is ready to be swapped in
         app.agent = await _load_agent(
             model_path, model_server, remote_storage, endpoints, app.agent.lock_store
         )
@@ -16,22 +16,26 @@ from rasa.exceptions import ModelNotFound
 logger = logging.getLogger(__name__)
 
 
-def test_core_models_in_directory(model_directory: Text, stories: Text, output: Text):
+def test_core_models_in_directory(
+    model_directory: Text, stories: Text, output: Text, jobs: int = 1
+):
     from rasa.core.test import compare_models_in_dir, plot_core_results
 
     loop = asyncio.get_event_loop()
-    loop.run_until_complete(compare_models_in_dir(model_directory, stories, output))
+    loop.run_until_complete(
+        compare_models_in_dir(model_directory, stories, output, jobs)
+    )
 
     story_n_path = os.path.join(model_directory, NUMBER_OF_TRAINING_STORIES_FILE)
     number_of_stories = io_utils.read_json_file(story_n_path)
     plot_core_results(output, number_of_stories)
 
 
-def test_core_models(models: List[Text], stories: Text, output: Text):
+def test_core_models(models: List[Text], stories: Text, output: Text, jobs: int = 1):
     from rasa.core.test import compare_models
 
     loop = asyncio.get_event_loop()
-    loop.run_until_complete(compare_models(models, stories, output))
+    loop.run_until_complete(compare_models(models, stories, output, jobs))
 
 
 def test(
@@ -147,6 +151,7 @@ def compare_nlu_models(
     output: Text,
     runs: int,
     exclusion_percentages: List[int],
+    jobs: int = 1,
 ):
     """Trains multiple models, compares them and saves the results."""
 
@@ -177,6 +182,7 @@ def compare_nlu_models(
         model_names,
         output,
         runs,
+        jobs,
     )
 
     f1_path = os.path.join(output, RESULTS_FILE)
@@ -154,7 +154,7 @@ def test_test_help(run: Callable[..., RunResult]):
                  [--evaluate-model-directory] [-u NLU] [--out OUT]
                  [--successes] [--no-errors] [--histogram HISTOGRAM]
                  [--confmat CONFMAT] [-c CONFIG [CONFIG ...]]
-                 [--cross-validation] [-f FOLDS] [-r RUNS]
+                 [--cross-validation] [-f FOLDS] [-j JOBS] [-r RUNS]
                  [-p PERCENTAGES [PERCENTAGES ...]] [--no-plot]
                  {core,nlu} ..."""
 
@@ -170,7 +170,7 @@ def test_test_nlu_help(run: Callable[..., RunResult]):
     help_text = """usage: rasa test nlu [-h] [-v] [-vv] [--quiet] [-m MODEL] [-u NLU] [--out OUT]
                      [--successes] [--no-errors] [--histogram HISTOGRAM]
                      [--confmat CONFMAT] [-c CONFIG [CONFIG ...]]
-                     [--cross-validation] [-f FOLDS] [-r RUNS]
+                     [--cross-validation] [-f FOLDS] [-j JOBS] [-r RUNS]
                      [-p PERCENTAGES [PERCENTAGES ...]] [--no-plot]"""
 
     lines = help_text.split("\n")
@@ -186,7 +186,7 @@ def test_test_core_help(run: Callable[..., RunResult]):
                       [-s STORIES] [--max-stories MAX_STORIES] [--out OUT]
                       [--e2e] [--endpoints ENDPOINTS]
                       [--fail-on-prediction-errors] [--url URL]
-                      [--evaluate-model-directory] [--no-plot]"""
+                      [--evaluate-model-directory] [-j JOBS] [--no-plot]"""
 
     lines = help_text.split("\n")
 
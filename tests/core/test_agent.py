@@ -5,6 +5,7 @@ import pytest
 from sanic import Sanic, response
 
 import rasa.core
+import rasa.model
 import rasa.utils.io
 from rasa.core import jobs, utils
 from rasa.core.agent import Agent, load_agent
@@ -200,6 +201,20 @@ async def test_load_agent(trained_model):
     assert agent.model_directory is not None
 
 
+async def test_load_agent_uses_model_cache_only_if_requested(
+    trained_model: Text, tmpdir, monkeypatch
+):
+    monkeypatch.setenv("RASA_MODEL_CACHE_DIRECTORY", tmpdir.strpath)
+
+    agent = await load_agent(model_path=trained_model)
+    assert not rasa.model.is_cached_model(agent.model_directory)
+    assert not tmpdir.listdir()
+
+    cached_agent = await load_agent(model_path=trained_model, use_model_cache=True)
+    assert rasa.model.is_cached_model(cached_agent.model_directory)
+    assert cached_agent.path_to_model_archive == trained_model
+
+
 @pytest.mark.parametrize(
     "domain, policy_config",
     [({"forms": ["restaurant_form"]}, {"policies": [{"name": "MemoizationPolicy"}]})],
@@ -263,6 +278,54 @@ async def test_agent_update_model_none_domain(trained_model: Text):
     assert tracker.events[3].intent["name"] == "greet"
 
 
+async def test_agent_swaps_in_updated_model(trained_model: Text):
+    agent = await load_agent(model_path=trained_model)
+    processor = agent.create_processor()
+
+    await rasa.core.agent._load_and_set_updated_model(
+        agent, agent.model_directory, "new-fingerprint"
+    )
+
+    assert agent.fingerprint == "new-fingerprint"
+    assert agent.policy_ensemble is not processor.policy_ensemble
+    # processors which were created before keep using the previous model
+    assert processor.policy_ensemble is not None
+
+
+async def test_agent_keeps_model_if_updated_model_fails_to_load(
+    trained_model: Text, monkeypatch
+):
+    agent = await load_agent(model_path=trained_model)
+    fingerprint = agent.fingerprint
+    policy_ensemble = agent.policy_ensemble
+
+    def failing_load(*args, **kwargs):
+        raise ValueError("broken model")
+
+    monkeypatch.setattr(PolicyEnsemble, "load", failing_load)
+
+    await rasa.core.agent._load_and_set_updated_model(
+        agent, agent.model_directory, "new-fingerprint"
+    )
+
+    assert agent.fingerprint == fingerprint
+    assert agent.policy_ensemble is policy_ensemble
+
+
+async def test_agent_warm_up_loads_lazily_initialized_interpreter(trained_model: Text):
+    from rasa.core.interpreter import RasaNLUInterpreter
+
+    agent = await load_agent(model_path=trained_model)
+    _, nlu_path = rasa.model.get_model_subdirectories(agent.model_directory)
+    interpreter = RasaNLUInterpreter(nlu_path, lazy_init=True)
+
+    await asyncio.get_event_loop().run_in_executor(
+        None, rasa.core.agent._warm_up_model, None, None, interpreter
+    )
+
+    assert interpreter.interpreter is not None
+
+
 async def test_load_agent_on_not_existing_path():
     agent = await load_agent(model_path="some-random-path")
 
@@ -1,5 +1,5 @@
 import json
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from _pytest.monkeypatch import MonkeyPatch
 
@@ -47,6 +47,21 @@ def test_pika_message_property_app_id(monkeypatch: MonkeyPatch):
     assert pika_producer._message_properties.app_id == rasa_environment
 
 
+# noinspection PyProtectedMember
+def test_pika_broker_keeps_bounded_outbox_without_channel():
+    with patch.object(PikaEventBroker, "_run_pika", lambda _: None):
+        pika_broker = PikaEventBroker("", "", "", max_outbox_size=2)
+
+    for event in TEST_EVENTS:
+        pika_broker.publish(event.as_dict())
+
+    assert list(pika_broker._unpublished_messages) == [
+        json.dumps(event.as_dict()) for event in TEST_EVENTS[1:]
+    ]
+    assert pika_broker.metrics["outbox_size"] == 2
+    assert pika_broker.metrics["dropped"] == 1
+
+
 def test_no_broker_in_config():
     cfg = read_endpoint_config(DEFAULT_ENDPOINTS_FILE, "event_broker")
 
@@ -75,6 +90,7 @@ def test_sql_broker_logs_to_sql_db():
 
     for e in TEST_EVENTS:
         actual.publish(e.as_dict())
+    actual.flush()
 
     with actual.session_scope() as session:
         events_types = [
@@ -85,6 +101,22 @@ def test_sql_broker_logs_to_sql_db():
     assert events_types == ["user", "slot", "restart"]
 
 
+def test_sql_broker_inserts_events_in_batches():
+    broker = SQLEventBroker(db=":memory:", flush_batch_size=len(TEST_EVENTS))
+
+    with patch.object(
+        broker, "write_events", wraps=broker.write_events
+    ) as write_events:
+        for e in TEST_EVENTS:
+            broker.publish(e.as_dict())
+        broker.close()
+
+    write_events.assert_called_once_with([e.as_dict() for e in TEST_EVENTS])
+
+    with broker.session_scope() as session:
+        assert session.query(broker.SQLBrokerEvent).count() == len(TEST_EVENTS)
+
+
 def test_file_broker_from_config():
     cfg = read_endpoint_config(
         "data/test_endpoints/event_brokers/file_endpoint.yml", "event_broker"
@@ -102,6 +134,7 @@ def test_file_broker_logs_to_file(tmpdir):
 
     for e in TEST_EVENTS:
         actual.publish(e.as_dict())
+    actual.flush()
 
     # reading the events from the file one event per line
     recovered = []
@@ -120,6 +153,7 @@ def test_file_broker_properly_logs_newlines(tmpdir):
     event_with_newline = UserUttered("hello \n there")
 
     actual.publish(event_with_newline.as_dict())
+    actual.flush()
 
     # reading the events from the file one event per line
     recovered = []
@@ -130,6 +164,25 @@ def test_file_broker_properly_logs_newlines(tmpdir):
     assert recovered == [event_with_newline]
 
 
+def test_file_broker_closes_file(tmpdir):
+    fname = tmpdir.join("events.log").strpath
+
+    actual = EventBroker.create(EndpointConfig(**{"type": "file", "path": fname}))
+
+    actual.publish(TEST_EVENTS[0].as_dict())
+    actual.close()
+
+    assert actual.event_file.closed
+
+    # events which are published afterwards are still written
+    actual.publish(TEST_EVENTS[1].as_dict())
+
+    with open(fname, "r") as f:
+        recovered = [Event.from_parameters(json.loads(l)) for l in f]
+
+    assert recovered == TEST_EVENTS[:2]
+
+
 def test_load_custom_broker_name():
     config = EndpointConfig(**{"type": "rasa.core.brokers.file.FileEventBroker"})
     assert EventBroker.create(config)
@@ -158,3 +211,25 @@ def test_kafka_broker_from_config():
     assert actual.sasl_username == expected.sasl_username
     assert actual.sasl_password == expected.sasl_password
     assert actual.topic == expected.topic
+
+
+def test_kafka_broker_reuses_producer(monkeypatch: MonkeyPatch):
+    import kafka
+
+    producer = Mock()
+    create_producer = Mock(return_value=producer)
+    monkeypatch.setattr(kafka, "KafkaProducer", create_producer)
+
+    broker = KafkaEventBroker("localhost", topic="topic", linger_ms=10)
+    for event in TEST_EVENTS:
+        broker.publish(event.as_dict())
+
+    create_producer.assert_called_once()
+    assert create_producer.call_args[1]["linger_ms"] == 10
+    assert create_producer.call_args[1]["bootstrap_servers"] == ["localhost"]
+    assert producer.send.call_count == len(TEST_EVENTS)
+
+    broker.close()
+
+    producer.flush.assert_called_once()
+    producer.close.assert_called_once()
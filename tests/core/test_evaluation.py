@@ -3,7 +3,13 @@ from typing import Text
 
 from pathlib import Path
 
-from rasa.core.test import _generate_trackers, collect_story_predictions, test
+from rasa.core.interpreter import RegexInterpreter
+from rasa.core.test import (
+    _CachingInterpreter,
+    _generate_trackers,
+    collect_story_predictions,
+    test,
+)
 
 # we need this import to ignore the warning...
 # noinspection PyUnresolvedReferences
@@ -93,6 +99,49 @@ async def test_end_to_end_evaluation_script(restaurantbot: Text):
     assert num_stories == 4
 
 
+async def test_end_to_end_evaluation_script_in_parallel(restaurantbot: Text):
+    restaurantbot = Agent.load(restaurantbot)
+    completed_trackers = await _generate_trackers(
+        END_TO_END_STORY_FILE, restaurantbot, use_e2e=True
+    )
+
+    serial_evaluation, _ = collect_story_predictions(
+        completed_trackers, restaurantbot, use_e2e=True
+    )
+    parallel_evaluation, num_stories = collect_story_predictions(
+        completed_trackers, restaurantbot, use_e2e=True, jobs=2
+    )
+
+    assert (
+        parallel_evaluation.evaluation_store.serialise()
+        == serial_evaluation.evaluation_store.serialise()
+    )
+    assert parallel_evaluation.action_list == serial_evaluation.action_list
+    assert len(parallel_evaluation.failed_stories) == 0
+    assert num_stories == 4
+
+
+async def test_caching_interpreter_parses_text_once():
+    class CountingInterpreter(RegexInterpreter):
+        def __init__(self):
+            self.parsed_texts = []
+
+        async def parse(self, text, message_id=None, tracker=None):
+            self.parsed_texts.append(text)
+            return await super().parse(text, message_id, tracker)
+
+    interpreter = CountingInterpreter()
+    caching_interpreter = _CachingInterpreter(interpreter)
+
+    first = await caching_interpreter.parse("/greet")
+    first["true_intent"] = "greet"
+    second = await caching_interpreter.parse("/greet")
+
+    assert interpreter.parsed_texts == ["/greet"]
+    assert second["intent"]["name"] == "greet"
+    assert "true_intent" not in second
+
+
 async def test_end_to_end_evaluation_script_unknown_entity(default_agent: Agent):
     completed_trackers = await _generate_trackers(
         E2E_STORY_FILE_UNKNOWN_ENTITY, default_agent, use_e2e=True
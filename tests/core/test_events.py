@@ -1,4 +1,5 @@
 import copy
+import pickle
 
 import pytest
 import pytz
@@ -316,3 +317,55 @@ def test_event_default_metadata(event_class: Type[Event]):
         assert event.as_dict()["metadata"] == {}
     else:
         assert "metadata" not in event.as_dict()
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        UserUttered("/greet", {"name": "greet", "confidence": 1.0}, []),
+        ActionExecuted("action_listen", metadata={"foo": "bar"}),
+        SlotSet("name", "rasa"),
+        BotUttered("hello", {"buttons": []}),
+    ],
+)
+def test_events_are_slotted_and_picklable(event: Event):
+    assert not hasattr(event, "__dict__")
+    assert pickle.loads(pickle.dumps(event)) == event
+    assert pickle.loads(pickle.dumps(event)).as_dict() == event.as_dict()
+
+
+def test_unpickle_event_without_slots():
+    state = {"action_name": "action_listen", "timestamp": 1, "removed": True}
+
+    event = ActionExecuted.__new__(ActionExecuted)
+    event.__setstate__(state)
+
+    assert event.action_name == "action_listen"
+    assert event.metadata == {}
+
+
+def test_resolve_event_defined_after_lookup():
+    assert Event.resolve_by_type("user") is UserUttered
+
+    class CustomEvent(Event):
+        type_name = "custom_test_event"
+
+    assert Event.resolve_by_type("custom_test_event") is CustomEvent
+
+
+def test_user_uttered_from_parameters():
+    event = UserUttered(
+        "/greet",
+        {"name": "greet", "confidence": 1.0},
+        [{"entity": "name", "value": "rasa"}],
+        timestamp=1,
+        input_channel="rest",
+        message_id="some-id",
+        metadata={"foo": "bar"},
+    )
+
+    restored = Event.from_parameters(event.as_dict())
+
+    assert isinstance(restored, UserUttered)
+    assert restored == event
+    assert restored.as_dict() == event.as_dict()
@@ -11,6 +11,7 @@ from _pytest.tmpdir import TempdirFactory
 
 import rasa
 import rasa.core
+import rasa.utils.io
 import rasa.nlu
 from rasa.importers.rasa import RasaFileImporter
 from rasa.constants import (
@@ -102,6 +103,52 @@ def test_get_model_from_directory_nlu_only(trained_model):
     assert unpacked_nlu
 
 
+def test_get_model_from_cache(trained_model, tmpdir: Path, monkeypatch):
+    monkeypatch.setenv("RASA_MODEL_CACHE_DIRECTORY", str(tmpdir))
+
+    with get_model(trained_model, use_cache=True) as unpacked:
+        assert os.path.exists(os.path.join(unpacked, "nlu"))
+
+    # cached models are not removed and reused when loading the model again
+    assert os.path.exists(unpacked)
+    assert model.is_cached_model(unpacked)
+    assert get_model(trained_model, use_cache=True) == unpacked
+
+
+@pytest.mark.skipif(model.fcntl is None, reason="Models are evicted using fcntl.")
+def test_models_in_use_are_not_evicted(tmpdir: Path, monkeypatch):
+    monkeypatch.setenv("RASA_MODEL_CACHE_DIRECTORY", str(tmpdir))
+    monkeypatch.setattr(model, "DEFAULT_MAX_CACHED_MODELS", 1)
+
+    def extract(directory: Text) -> None:
+        rasa.utils.io.write_text_file("model", os.path.join(directory, "model"))
+
+    in_use = model._add_to_model_cache("in-use", extract)
+    unused = str(model._add_to_model_cache("unused", extract))
+    # make sure that the models in use are the least recently used ones
+    os.utime(in_use, (0, 0))
+    os.utime(unused, (1, 1))
+
+    latest = model._add_to_model_cache("latest", extract)
+
+    assert os.path.isdir(in_use)
+    assert not os.path.exists(unused)
+    assert os.path.isdir(latest)
+
+
+def test_uncompressed_model_packaging(trained_model, tmpdir: Path):
+    unpacked_model_path = get_model(trained_model)
+    output_path = os.path.join(str(tmpdir), "test.tar")
+
+    create_package_rasa(unpacked_model_path, output_path, {"version": "1.0"})
+
+    assert get_latest_model(str(tmpdir)) == output_path
+
+    unpacked = get_model(output_path)
+    assert os.path.exists(os.path.join(unpacked, DEFAULT_CORE_SUBDIRECTORY_NAME))
+    assert os.path.exists(os.path.join(unpacked, "nlu"))
+
+
 def _fingerprint(
     config: Optional[Any] = None,
     config_nlu: Optional[Any] = None,
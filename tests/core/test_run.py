@@ -40,3 +40,77 @@ def test_create_single_input_channels_by_class_wo_credentials():
 
     assert len(channels) == 1
     assert channels[0].name() == "rest"
+
+
+def test_preload_interpreter(trained_rasa_model):
+    import os
+    import shutil
+
+    from rasa.core.interpreter import RasaNLUInterpreter
+    from rasa.core.utils import AvailableEndpoints
+
+    model_directory, interpreter = run._preload_interpreter(
+        trained_rasa_model, AvailableEndpoints()
+    )
+
+    assert isinstance(interpreter, RasaNLUInterpreter)
+    assert interpreter.lazy_load
+    assert os.path.isdir(model_directory)
+
+    shutil.rmtree(model_directory)
+
+
+def test_preload_interpreter_loads_everything_but_tensorflow(tmpdir):
+    import shutil
+
+    from rasa.core.utils import AvailableEndpoints
+    from rasa.nlu.classifiers.embedding_intent_classifier import (
+        EmbeddingIntentClassifier,
+    )
+    from rasa.nlu.featurizers.sparse_featurizer.count_vectors_featurizer import (
+        CountVectorsFeaturizer,
+    )
+    from rasa.train import train_nlu
+    from rasa.utils.io import write_yaml_file
+
+    config_file = tmpdir.join("config.yml").strpath
+    write_yaml_file(
+        {
+            "language": "en",
+            "pipeline": [
+                {"name": "WhitespaceTokenizer"},
+                {"name": "CountVectorsFeaturizer"},
+                {"name": "EmbeddingIntentClassifier", "epochs": 1},
+            ],
+        },
+        config_file,
+    )
+    model_path = train_nlu(
+        config_file, "data/examples/rasa/demo-rasa.json", tmpdir.strpath
+    )
+
+    model_directory, interpreter = run._preload_interpreter(
+        model_path, AvailableEndpoints()
+    )
+    featurizer, classifier = interpreter.interpreter.pipeline[1:]
+
+    # the vocabulary is read before the workers are forked
+    assert isinstance(featurizer, CountVectorsFeaturizer)
+    assert featurizer.vectorizers
+    assert featurizer._deferred_vocabulary_file is None
+
+    # the tf session is created in the workers
+    assert isinstance(classifier, EmbeddingIntentClassifier)
+    assert classifier.session is None
+    assert classifier._deferred_checkpoint is not None
+
+    shutil.rmtree(model_directory)
+
+
+def test_preload_interpreter_skipped_with_nlu_endpoint(trained_rasa_model):
+    from rasa.core.utils import AvailableEndpoints
+    from rasa.utils.endpoints import EndpointConfig
+
+    endpoints = AvailableEndpoints(nlu=EndpointConfig("http://localhost:5000"))
+
+    assert run._preload_interpreter(trained_rasa_model, endpoints) == (None, None)
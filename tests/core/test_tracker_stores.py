@@ -1,3 +1,4 @@
+import json
 import logging
 import tempfile
 
@@ -6,9 +7,12 @@ import uuid
 from _pytest.logging import LogCaptureFixture
 from _pytest.monkeypatch import MonkeyPatch
 from moto import mock_dynamodb2
+from freezegun import freeze_time
+from pathlib import Path
 from typing import Tuple, Text, Type, Dict, List
 from unittest.mock import Mock
 
+import rasa.core.jobs
 import rasa.core.tracker_store
 from rasa.core.actions.action import (
     ACTION_LISTEN_NAME,
@@ -34,6 +38,7 @@ from rasa.core.tracker_store import (
     DynamoTrackerStore,
     FailSafeTrackerStore,
 )
+from rasa.core.tracker_serialisation import is_binary_dialogue
 from rasa.core.trackers import DialogueStateTracker
 from rasa.utils.endpoints import EndpointConfig, read_endpoint_config
 from tests.core.conftest import DEFAULT_ENDPOINTS_FILE, MockedMongoTrackerStore
@@ -66,6 +71,65 @@ def test_dynamo_get_or_create():
     get_or_create_tracker_store(DynamoTrackerStore(domain))
 
 
+# noinspection PyPep8Naming
+@mock_dynamodb2
+def test_dynamo_stores_new_events_per_item():
+    store = DynamoTrackerStore(domain, max_events_per_item=2)
+    sender_id = "some-id"
+    tracker = DialogueStateTracker.from_events(
+        sender_id,
+        [
+            UserUttered("hi"),
+            ActionExecuted(ACTION_SESSION_START_NAME),
+            SessionStarted(),
+            UserUttered("hi again"),
+        ],
+    )
+    store.save(tracker)
+
+    tracker = store.retrieve(sender_id)
+    assert [type(e) for e in tracker.events] == [SessionStarted, UserUttered]
+
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    store.save(tracker)
+
+    items = store.db.scan()["Items"]
+    # two items for the first save and only the new event for the second one
+    assert sorted(len(item["events"]) for item in items) == [1, 2, 2]
+    assert list(store.keys()) == [sender_id]
+
+    tracker = store.retrieve(sender_id)
+    assert [type(e) for e in tracker.events] == [
+        SessionStarted,
+        UserUttered,
+        ActionExecuted,
+    ]
+    assert store.number_of_existing_events(sender_id) == 3
+
+
+# noinspection PyPep8Naming
+@mock_dynamodb2
+def test_dynamo_archives_items_of_completed_sessions():
+    store = DynamoTrackerStore(domain)
+    sender_id = "some-id"
+    tracker = DialogueStateTracker.from_events(
+        sender_id, [UserUttered("hi"), ActionExecuted(ACTION_LISTEN_NAME)]
+    )
+    store.save(tracker)
+    tracker.update(SessionStarted())
+    tracker.update(UserUttered("hi again"))
+    store.save(tracker)
+
+    assert store.archive_completed_sessions() == 2
+
+    archive = store.get_or_create_table(f"{store.table_name}_archive")
+    assert [len(item["events"]) for item in archive.scan()["Items"]] == [2]
+    assert [len(item["events"]) for item in store.db.scan()["Items"]] == [2]
+
+    tracker = store.retrieve(sender_id)
+    assert [type(e) for e in tracker.events] == [SessionStarted, UserUttered]
+
+
 def test_restart_after_retrieval_from_tracker_store(default_domain: Domain):
     store = InMemoryTrackerStore(default_domain)
     tr = store.get_or_create_tracker("myuser")
@@ -93,6 +157,35 @@ def test_tracker_store_remembers_max_history(default_domain: Domain):
     assert tr._max_event_history == tr2._max_event_history == 42
 
 
+def test_tracker_store_streams_only_new_events(default_domain: Domain):
+    event_broker = Mock()
+    tracker_store = InMemoryTrackerStore(default_domain, event_broker)
+
+    tracker = tracker_store.get_or_create_tracker("some-id")
+    assert event_broker.publish.call_count == 1
+
+    tracker = tracker_store.get_or_create_tracker("some-id")
+    tracker.update(SlotSet("name", "Peter"))
+
+    # the number of stored events is known, the tracker isn't retrieved again
+    tracker_store.retrieve = Mock()
+    tracker_store.save(tracker)
+
+    tracker_store.retrieve.assert_not_called()
+    assert event_broker.publish.call_count == 2
+    assert event_broker.publish.call_args[0][0]["event"] == SlotSet.type_name
+
+
+def test_tracker_store_counts_stored_events(default_domain: Domain):
+    tracker_store = InMemoryTrackerStore(default_domain)
+    tracker = tracker_store.get_or_create_tracker("some-id")
+    tracker.update(SlotSet("name", "Peter"))
+    tracker_store.save(tracker)
+
+    assert tracker_store.number_of_existing_events("some-id") == 2
+    assert tracker_store.number_of_existing_events("unknown-id") == 0
+
+
 def test_tracker_store_endpoint_config_loading():
     cfg = read_endpoint_config(DEFAULT_ENDPOINTS_FILE, "tracker_store")
 
@@ -254,6 +347,84 @@ def test_deprecated_pickle_deserialisation(caplog: LogCaptureFixture):
     assert "Deserialisation of pickled trackers will be deprecated" in caplog.text
 
 
+@pytest.mark.parametrize("serialisation_format", ["json", "binary"])
+def test_tracker_store_serialisation_formats(serialisation_format: Text):
+    store = InMemoryTrackerStore(domain, serialisation_format=serialisation_format)
+    events = [
+        UserUttered("Hola", {"name": "greet"}),
+        ActionExecuted("utter_greet"),
+        SlotSet("location", "Easter Island"),
+    ]
+    tracker = DialogueStateTracker.from_events("some-id", events)
+    store.save(tracker)
+
+    assert store.retrieve("some-id") == tracker
+    assert store.number_of_existing_events("some-id") == len(events)
+
+
+def test_binary_tracker_can_be_read_by_json_store():
+    _, tracker = _tracker_store_and_tracker_with_slot_set()
+    binary_store = InMemoryTrackerStore(domain, serialisation_format="binary")
+    json_store = InMemoryTrackerStore(domain, serialisation_format="json")
+
+    serialised = binary_store.encode_tracker(tracker)
+
+    assert is_binary_dialogue(serialised)
+    assert len(serialised) < len(json_store.encode_tracker(tracker))
+    assert tracker == json_store.deserialise_tracker(
+        UserMessage.DEFAULT_SENDER_ID, serialised
+    )
+
+
+def test_unknown_tracker_serialisation_format():
+    with pytest.raises(ValueError):
+        InMemoryTrackerStore(domain, serialisation_format="xml")
+
+
+def test_in_memory_tracker_store_evicts_least_recently_used():
+    store = InMemoryTrackerStore(domain, max_conversations=2)
+    for sender_id in ["first", "second"]:
+        store.save(DialogueStateTracker.from_events(sender_id, [Restarted()]))
+
+    # using the first conversation makes the second one the least recently used
+    assert store.retrieve("first")
+    store.save(DialogueStateTracker.from_events("third", [Restarted()]))
+
+    assert set(store.keys()) == {"first", "third"}
+    assert store.retrieve("second") is None
+
+
+def test_in_memory_tracker_store_evicts_expired_conversations():
+    store = InMemoryTrackerStore(domain, conversation_ttl=60)
+
+    with freeze_time("2020-01-01 12:00:00"):
+        store.save(DialogueStateTracker.from_events("old", [Restarted()]))
+    with freeze_time("2020-01-01 12:00:30"):
+        store.save(DialogueStateTracker.from_events("new", [Restarted()]))
+
+    with freeze_time("2020-01-01 12:01:10"):
+        assert store.retrieve("old") is None
+        assert store.retrieve("new")
+        assert list(store.keys()) == ["new"]
+
+
+def test_in_memory_tracker_store_spills_evicted_conversations(tmpdir: Path):
+    store = InMemoryTrackerStore(
+        domain, max_conversations=1, spill_directory=str(tmpdir)
+    )
+    first = DialogueStateTracker.from_events("first", [SlotSet("location", "Rome")])
+    store.save(first)
+    store.save(DialogueStateTracker.from_events("second", [Restarted()]))
+
+    assert "first" not in store.store
+    assert set(store.keys()) == {"first", "second"}
+
+    assert store.retrieve("first") == first
+    # the second conversation was spilled in turn
+    assert list(store.store.keys()) == ["first"]
+    assert len(tmpdir.listdir()) == 1
+
+
 @pytest.mark.parametrize(
     "full_url",
     [
@@ -482,6 +653,44 @@ def test_mongo_additional_events_with_session_start(default_domain: Domain):
     assert isinstance(additional_events[0], UserUttered)
 
 
+def test_mongo_stores_event_counts_of_latest_session(default_domain: Domain):
+    sender = "test_mongo_stores_event_counts_of_latest_session"
+    tracker_store = MockedMongoTrackerStore(default_domain)
+    tracker = _saved_tracker_with_multiple_session_starts(tracker_store, sender)
+    tracker.update(UserUttered("hi2"))
+    tracker_store.save(tracker)
+
+    stored = tracker_store.conversations.find_one({"sender_id": sender})
+    assert stored["number_of_events"] == len(stored["events"]) == 6
+    assert stored["session_start_index"] == 4
+
+    retrieved = tracker_store.retrieve(sender)
+    assert [type(e) for e in retrieved.events] == [SessionStarted, UserUttered]
+    assert tracker_store.number_of_existing_events(sender) == 2
+
+
+def test_mongo_retrieves_conversation_without_event_counts(default_domain: Domain):
+    sender = "test_mongo_retrieves_conversation_without_event_counts"
+    tracker_store = MockedMongoTrackerStore(default_domain)
+    _saved_tracker_with_multiple_session_starts(tracker_store, sender)
+
+    # conversations which were stored by previous versions don't have counts
+    tracker_store.conversations.update_one(
+        {"sender_id": sender},
+        {"$unset": {"number_of_events": "", "session_start_index": ""}},
+    )
+
+    tracker = tracker_store.retrieve(sender)
+    assert [type(e) for e in tracker.events] == [SessionStarted]
+
+    tracker.update(UserUttered("hi2"))
+    tracker_store.save(tracker)
+
+    stored = tracker_store.conversations.find_one({"sender_id": sender})
+    assert len(stored["events"]) == 6
+    assert stored["session_start_index"] == 4
+
+
 # we cannot parametrise over this and the previous test due to the different ways of
 # calling _additional_events()
 def test_sql_additional_events(default_domain: Domain):
@@ -578,6 +787,154 @@ def test_tracker_store_retrieve_without_session_started_events(
     assert all(event == tracker.events[i] for i, event in enumerate(events))
 
 
+def _saved_tracker_with_completed_session(
+    tracker_store: TrackerStore, sender_id: Text
+) -> None:
+    events = [
+        UserUttered("Hola", {"name": "greet"}),
+        BotUttered("Hi"),
+        SessionStarted(),
+        UserUttered("Ciao", {"name": "greet"}),
+    ]
+    tracker_store.save(DialogueStateTracker.from_events(sender_id, events))
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (InMemoryTrackerStore, {}),
+    ],
+)
+def test_tracker_store_archives_completed_sessions(
+    tracker_store_type: Type[TrackerStore],
+    tracker_store_kwargs: Dict,
+    default_domain: Domain,
+    tmpdir: Path,
+):
+    tracker_store = tracker_store_type(default_domain, **tracker_store_kwargs)
+    tracker_store.session_archive_directory = str(tmpdir)
+    sender_id = "test_tracker_store_archives_completed_sessions"
+    _saved_tracker_with_completed_session(tracker_store, sender_id)
+    tracker_store.save(DialogueStateTracker.from_events("other-sender", [BotUttered()]))
+
+    assert tracker_store.archive_completed_sessions() == 2
+    # completed sessions are only archived once
+    assert tracker_store.archive_completed_sessions() == 0
+
+    tracker = tracker_store.retrieve(sender_id)
+    assert [type(e) for e in tracker.events] == [SessionStarted, UserUttered]
+    assert tracker_store.number_of_existing_events(sender_id) == 2
+
+    tracker.update(BotUttered("Ciao"))
+    tracker_store.save(tracker)
+
+    tracker = tracker_store.retrieve(sender_id)
+    assert [type(e) for e in tracker.events] == [
+        SessionStarted,
+        UserUttered,
+        BotUttered,
+    ]
+    assert len(tracker_store.retrieve("other-sender").events) == 1
+
+
+def test_sql_tracker_store_moves_completed_sessions_to_archive_table(
+    default_domain: Domain,
+):
+    tracker_store = SQLTrackerStore(default_domain, host="sqlite:///")
+    sender_id = "test_sql_tracker_store_moves_completed_sessions_to_archive_table"
+    _saved_tracker_with_completed_session(tracker_store, sender_id)
+
+    tracker_store.archive_completed_sessions()
+
+    with tracker_store.session_scope() as session:
+        archived = session.query(tracker_store.SQLArchivedEvent).all()
+        assert [event.type_name for event in archived] == ["user", "bot"]
+        assert all(event.sender_id == sender_id for event in archived)
+        assert session.query(tracker_store.SQLEvent).count() == 2
+
+
+def test_in_memory_tracker_store_appends_completed_sessions_to_file(tmpdir: Path):
+    tracker_store = InMemoryTrackerStore(domain)
+    tracker_store.session_archive_directory = str(tmpdir)
+    sender_id = "test_in_memory_tracker_store_appends_completed_sessions_to_file"
+    _saved_tracker_with_completed_session(tracker_store, sender_id)
+
+    tracker_store.archive_completed_sessions()
+
+    archive = tmpdir / rasa.core.tracker_store.SESSION_ARCHIVE_FILE_NAME
+    archived = [json.loads(line) for line in archive.read_text("utf-8").splitlines()]
+    assert len(archived) == 1
+    assert archived[0]["sender_id"] == sender_id
+    assert [e["event"] for e in archived[0]["events"]] == ["user", "bot"]
+
+
+def test_in_memory_tracker_store_does_not_save_archived_sessions_again(tmpdir: Path):
+    tracker_store = InMemoryTrackerStore(domain)
+    tracker_store.session_archive_directory = str(tmpdir)
+    sender_id = "test_in_memory_tracker_store_does_not_save_archived_sessions_again"
+    _saved_tracker_with_completed_session(tracker_store, sender_id)
+
+    # the tracker is retrieved before its completed session is archived
+    tracker = tracker_store.retrieve(sender_id)
+    assert tracker_store.archive_completed_sessions() == 2
+
+    tracker.update(BotUttered("Ciao"))
+    tracker_store.save(tracker)
+
+    assert tracker_store.archive_completed_sessions() == 0
+    assert [type(e) for e in tracker_store.retrieve(sender_id).events] == [
+        SessionStarted,
+        UserUttered,
+        BotUttered,
+    ]
+    archive = tmpdir / rasa.core.tracker_store.SESSION_ARCHIVE_FILE_NAME
+    assert len(archive.read_text("utf-8").splitlines()) == 1
+
+
+def test_session_archival_options_from_endpoint_config(tmpdir: Path):
+    store = EndpointConfig(
+        type="in_memory",
+        session_archival_interval=60,
+        session_archive_directory=str(tmpdir),
+    )
+    tracker_store = TrackerStore.create(store)
+
+    assert isinstance(tracker_store, InMemoryTrackerStore)
+    assert tracker_store.session_archival_interval == 60
+    assert tracker_store.session_archive_directory == str(tmpdir)
+    # the endpoint configuration isn't changed
+    assert store.kwargs["session_archival_interval"] == 60
+
+
+class TrackerStoreWithoutArchival(TrackerStore):
+    pass
+
+
+@pytest.mark.parametrize(
+    "tracker_store",
+    [
+        TrackerStoreWithoutArchival(None),
+        FailSafeTrackerStore(TrackerStoreWithoutArchival(None)),
+    ],
+)
+async def test_session_archival_is_not_scheduled_without_support(
+    tracker_store: TrackerStore, monkeypatch: MonkeyPatch
+):
+    scheduler = Mock()
+
+    async def mocked_scheduler() -> Mock:
+        return scheduler
+
+    monkeypatch.setattr(rasa.core.jobs, "scheduler", mocked_scheduler)
+    tracker_store.session_archival_interval = 60
+
+    await rasa.core.tracker_store.schedule_session_archival(tracker_store)
+
+    scheduler.add_job.assert_not_called()
+
+
 def test_current_state_without_events(default_domain: Domain):
     tracker_store = MockedMongoTrackerStore(default_domain)
 
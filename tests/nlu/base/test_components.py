@@ -1,7 +1,7 @@
 import pytest
 
 from rasa.nlu import registry
-from rasa.nlu.components import find_unavailable_packages
+from rasa.nlu.components import Component, find_unavailable_packages
 from rasa.nlu.config import RasaNLUModelConfig
 from rasa.nlu.model import Metadata
 from tests.nlu import utilities
@@ -84,6 +84,66 @@ def test_create_component_exception_messages(
         component_builder.create_component(component_config, default_config)
 
 
+def test_builder_evicts_released_components(default_config):
+    from rasa.nlu.components import ComponentBuilder
+
+    builder = ComponentBuilder(max_cache_size=1)
+    first = builder.create_component(
+        {"name": "WhitespaceTokenizer", "intent_split_symbol": "_"}, default_config
+    )
+    second = builder.create_component(
+        {"name": "WhitespaceTokenizer", "intent_split_symbol": "+"}, default_config
+    )
+
+    # components which are still used are never evicted
+    assert len(builder.component_cache) == 2
+
+    # cached components are reused
+    assert (
+        builder.create_component(
+            {"name": "WhitespaceTokenizer", "intent_split_symbol": "+"}, default_config,
+        )
+        is second
+    )
+
+    builder.release_components([first])
+
+    assert list(builder.component_cache.values()) == [second]
+
+
+def test_builder_shares_components_created_by_multiple_threads(default_config):
+    from concurrent.futures import ThreadPoolExecutor
+    from rasa.nlu.components import ComponentBuilder
+
+    builder = ComponentBuilder()
+
+    def create(_) -> Component:
+        return builder.create_component({"name": "WhitespaceTokenizer"}, default_config)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        components = list(executor.map(create, range(32)))
+
+    # components which were created concurrently are replaced by the cached one
+    assert all(component is components[0] for component in components)
+    assert list(builder.component_cache.values()) == [components[0]]
+
+
+def test_builder_defers_release_while_cache_is_locked(default_config):
+    from rasa.nlu.components import ComponentBuilder
+
+    builder = ComponentBuilder(max_cache_size=0)
+    component = builder.create_component(
+        {"name": "WhitespaceTokenizer"}, default_config
+    )
+
+    with builder._locked_cache():
+        # e.g. a finalizer which runs while the cache is used
+        builder.release_components([component])
+        assert list(builder.component_cache.values()) == [component]
+
+    assert not builder.component_cache
+
+
 def test_builder_load_unknown(component_builder):
     with pytest.raises(Exception) as excinfo:
         component_meta = {"name": "my_made_up_componment"}
@@ -290,6 +290,37 @@ def test_run_cv_evaluation():
     assert len(entity_results.test["CRFEntityExtractor"]["F1-score"]) == n_folds
 
 
+def test_run_cv_evaluation_in_parallel():
+    td = training_data.load_data("data/examples/rasa/demo-rasa.json")
+    nlu_config = config.load("sample_configs/config_supervised_embeddings.yml")
+
+    n_folds = 2
+    intent_results, entity_results, response_selection_results = cross_validate(
+        td, n_folds, nlu_config, jobs=2
+    )
+
+    assert len(intent_results.train["Accuracy"]) == n_folds
+    assert len(intent_results.test["Accuracy"]) == n_folds
+    assert len(intent_results.test["F1-score"]) == n_folds
+    assert len(entity_results.train["CRFEntityExtractor"]["Accuracy"]) == n_folds
+    assert len(entity_results.test["CRFEntityExtractor"]["F1-score"]) == n_folds
+
+
+def test_worker_thread_limit_is_passed_on_with_the_environment(monkeypatch):
+    from rasa.nlu.test import _limit_worker_threads
+
+    monkeypatch.setenv("OMP_NUM_THREADS", "8")
+    monkeypatch.delenv("MKL_NUM_THREADS", raising=False)
+
+    # spawned workers inherit the environment of the process which starts them
+    with _limit_worker_threads(2):
+        assert os.environ["OMP_NUM_THREADS"] == "2"
+        assert os.environ["MKL_NUM_THREADS"] == "2"
+
+    assert os.environ["OMP_NUM_THREADS"] == "8"
+    assert "MKL_NUM_THREADS" not in os.environ
+
+
 def test_run_cv_evaluation_with_response_selector():
     training_data_obj = training_data.load_data("data/examples/rasa/demo-rasa.md")
     training_data_responses_obj = training_data.load_data(
@@ -41,6 +41,32 @@ async def test_interpreter(pipeline_template, component_builder, tmpdir):
             assert entity["entity"] in td.entities
 
 
+@pytest.mark.parametrize(
+    "pipeline_template", list(registry.registered_pipeline_templates.keys())
+)
+async def test_interpreter_parse_batch(pipeline_template, component_builder, tmpdir):
+    test_data = "data/examples/rasa/demo-rasa.json"
+    _conf = utilities.base_test_conf(pipeline_template)
+    _conf["data"] = test_data
+    interpreter = await utilities.interpreter_for(
+        component_builder, "data/examples/rasa/demo-rasa.json", tmpdir.strpath, _conf
+    )
+
+    texts = ["good bye", "", "i am looking for an indian spot", "hello"]
+
+    results = interpreter.parse_batch(texts)
+
+    assert len(results) == len(texts)
+    for text, result in zip(texts, results):
+        expected = interpreter.parse(text)
+        assert result["text"] == text
+        assert result["intent"]["name"] == expected["intent"]["name"]
+        assert result["intent"]["confidence"] == pytest.approx(
+            expected["intent"]["confidence"]
+        )
+        assert result["entities"] == expected["entities"]
+
+
 @pytest.mark.parametrize(
     "metadata",
     [
@@ -104,3 +104,43 @@ def test_check_labels_features_exist(messages, expected):
         EmbeddingIntentClassifier._check_labels_features_exist(messages, attribute)
         == expected
     )
+
+
+async def test_lazy_loaded_classifier_predicts_like_eagerly_loaded(tmpdir):
+    from rasa.nlu.config import RasaNLUModelConfig
+    from rasa.nlu.model import Interpreter
+    from rasa.nlu.train import train
+    from tests.nlu.conftest import DEFAULT_DATA_PATH
+
+    _config = RasaNLUModelConfig(
+        {
+            "pipeline": [
+                {"name": "WhitespaceTokenizer"},
+                {"name": "CountVectorsFeaturizer"},
+                {"name": "EmbeddingIntentClassifier", "epochs": 2},
+            ]
+        }
+    )
+    (_, _, persisted_path) = await train(
+        _config, path=tmpdir.strpath, data=DEFAULT_DATA_PATH
+    )
+
+    eager = Interpreter.load(persisted_path)
+    lazy = Interpreter.load(persisted_path, lazy_load=True)
+
+    lazy_classifier = lazy.pipeline[-1]
+    assert lazy_classifier.session is None
+    assert lazy_classifier._deferred_checkpoint is not None
+
+    for text in ["hello", "I am looking for a mexican restaurant"]:
+        lazy_result = lazy.parse(text)
+        eager_result = eager.parse(text)
+
+        assert lazy_result["intent"]["name"] == eager_result["intent"]["name"]
+        assert lazy_result["intent"]["confidence"] == pytest.approx(
+            eager_result["intent"]["confidence"]
+        )
+
+    # the checkpoint is restored on first use only
+    assert lazy_classifier.session is not None
+    assert lazy_classifier._deferred_checkpoint is None
@@ -0,0 +1,53 @@
+import os
+
+import numpy as np
+import pytest
+
+from rasa.nlu.classifiers.sklearn_intent_classifier import SklearnIntentClassifier
+from rasa.nlu.model import Interpreter
+from rasa.nlu.train import train
+from tests.nlu import utilities
+from tests.nlu.conftest import DEFAULT_DATA_PATH
+
+
+def _classifier(interpreter: Interpreter) -> SklearnIntentClassifier:
+    return next(
+        c for c in interpreter.pipeline if isinstance(c, SklearnIntentClassifier)
+    )
+
+
+async def test_persisted_arrays_are_memory_mapped_with_lazy_load(
+    component_builder, tmpdir
+):
+    _config = utilities.base_test_conf("pretrained_embeddings_spacy")
+    (_, _, persisted_path) = await train(
+        _config,
+        path=tmpdir.strpath,
+        data=DEFAULT_DATA_PATH,
+        component_builder=component_builder,
+    )
+
+    eager = Interpreter.load(persisted_path)
+    lazy = Interpreter.load(persisted_path, lazy_load=True)
+
+    array_files = _classifier(eager).component_config["classifier_arrays"]
+    assert array_files
+    for name, file_name in array_files.items():
+        assert os.path.exists(os.path.join(persisted_path, file_name))
+
+        eager_array = getattr(_classifier(eager).clf, name)
+        lazy_array = getattr(_classifier(lazy).clf, name)
+        assert not isinstance(eager_array, np.memmap)
+        # copy-on-write mapping of the persisted file
+        assert isinstance(lazy_array, np.memmap)
+        assert lazy_array.mode == "c"
+        np.testing.assert_array_equal(lazy_array, eager_array)
+
+    for text in ["hello", "I am looking for a mexican restaurant"]:
+        lazy_result = lazy.parse(text)
+        eager_result = eager.parse(text)
+
+        assert lazy_result["intent"]["name"] == eager_result["intent"]["name"]
+        assert lazy_result["intent"]["confidence"] == pytest.approx(
+            eager_result["intent"]["confidence"]
+        )
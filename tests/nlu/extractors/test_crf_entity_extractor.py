@@ -253,3 +253,187 @@ def test_crf_use_dense_features(ner_crf_pos_feature_config, spacy_nlp):
             features[0]["0:text_dense_features"]["text_dense_features"][str(i)]
             == message.data.get("text_dense_features")[0][i]
         )
+
+
+def test_crf_feature_template():
+    from rasa.nlu.extractors.crf_entity_extractor import (
+        CRFEntityExtractor,
+        CRFFeatureTemplate,
+        CRFToken,
+    )
+
+    template = CRFFeatureTemplate(
+        [["low"], ["low", "title", "pattern"], ["low"]],
+        CRFEntityExtractor.function_dict,
+    )
+    sentence = [
+        CRFToken("Hi", "", "O", {"greet": True}, None),
+        CRFToken("there", "", "O", {}, None),
+    ]
+
+    assert template.sentence_to_features(sentence) == [
+        {
+            "BOS": True,
+            "0:low": "hi",
+            "0:title": True,
+            "0:pattern:greet": True,
+            "1:low": "there",
+        },
+        {"-1:low": "hi", "0:low": "there", "0:title": False, "EOS": True},
+    ]
+    # every distinct feature is computed once per token
+    assert template.feature_names == ["low", "title", "pattern"]
+
+
+def test_crf_process_batch_matches_process():
+    from rasa.nlu.extractors.crf_entity_extractor import CRFEntityExtractor
+    from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
+
+    tokenizer = WhitespaceTokenizer()
+    crf_extractor = CRFEntityExtractor()
+
+    examples = [
+        Message(
+            "i want to fly to berlin",
+            {
+                "intent": "book_flight",
+                "entities": [
+                    {"start": 17, "end": 23, "value": "berlin", "entity": "city"}
+                ],
+            },
+        ),
+        Message(
+            "show me flights to new york",
+            {
+                "intent": "book_flight",
+                "entities": [
+                    {"start": 19, "end": 27, "value": "new york", "entity": "city"}
+                ],
+            },
+        ),
+    ]
+    training_data = TrainingData(training_examples=examples)
+    tokenizer.train(training_data)
+    crf_extractor.train(training_data, RasaNLUModelConfig())
+
+    texts = ["fly to berlin", "flights to new york please", "hello"]
+    single = [Message(text) for text in texts]
+    batch = [Message(text) for text in texts]
+    for message in single + batch:
+        tokenizer.process(message)
+
+    for message in single:
+        crf_extractor.process(message)
+    crf_extractor.process_batch(batch)
+
+    assert [m.get("entities") for m in batch] == [m.get("entities") for m in single]
+
+
+def test_crf_parallel_feature_generation_matches_serial():
+    from rasa.nlu.extractors.crf_entity_extractor import CRFEntityExtractor
+    from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
+
+    tokenizer = WhitespaceTokenizer()
+    examples = [
+        Message(
+            f"i want to fly to berlin {i}",
+            {
+                "intent": "book_flight",
+                "entities": [
+                    {"start": 17, "end": 23, "value": "berlin", "entity": "city"}
+                ],
+            },
+        )
+        for i in range(10)
+    ]
+    tokenizer.train(TrainingData(training_examples=examples))
+
+    serial = CRFEntityExtractor()
+    parallel = CRFEntityExtractor({"num_processes": 2, "shard_size": 3})
+
+    dataset = serial._create_dataset(examples)
+
+    assert list(parallel._iter_features_and_labels(dataset)) == list(
+        serial._iter_features_and_labels(dataset)
+    )
+
+
+def test_crf_shards():
+    from rasa.nlu.extractors.crf_entity_extractor import _shards
+
+    assert list(_shards(iter(range(7)), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(_shards([], 3)) == []
+
+
+def test_crf_featurize_shard_matches_extractor():
+    from rasa.nlu.extractors import crf_entity_extractor
+    from rasa.nlu.extractors.crf_entity_extractor import CRFEntityExtractor
+    from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
+
+    tokenizer = WhitespaceTokenizer()
+    examples = [
+        Message(
+            "i want to fly to berlin",
+            {
+                "intent": "book_flight",
+                "entities": [
+                    {"start": 17, "end": 23, "value": "berlin", "entity": "city"}
+                ],
+            },
+        ),
+        Message("hello", {"intent": "greet", "entities": []}),
+    ]
+    tokenizer.train(TrainingData(training_examples=examples))
+
+    crf_extractor = CRFEntityExtractor()
+    dataset = crf_extractor._create_dataset(examples)
+
+    # what a worker process of the pool does
+    crf_entity_extractor._init_feature_worker(
+        CRFEntityExtractor, crf_extractor.component_config["features"]
+    )
+    featurized = crf_entity_extractor._featurize_shard(dataset)
+
+    assert featurized == [
+        (
+            crf_extractor._sentence_to_features(sentence),
+            crf_extractor._sentence_to_labels(sentence),
+        )
+        for sentence in dataset
+    ]
+
+
+def test_crf_train_with_multiple_processes_matches_serial():
+    from rasa.nlu.extractors.crf_entity_extractor import CRFEntityExtractor
+    from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
+
+    tokenizer = WhitespaceTokenizer()
+    examples = [
+        Message(
+            f"i want to fly to {city}",
+            {
+                "intent": "book_flight",
+                "entities": [
+                    {
+                        "start": 17,
+                        "end": 17 + len(city),
+                        "value": city,
+                        "entity": "city",
+                    }
+                ],
+            },
+        )
+        for city in ["berlin", "paris", "rome", "london", "madrid"]
+    ]
+    training_data = TrainingData(training_examples=examples)
+    tokenizer.train(training_data)
+
+    serial = CRFEntityExtractor()
+    serial.train(training_data, RasaNLUModelConfig())
+    parallel = CRFEntityExtractor({"num_processes": 2, "shard_size": 2})
+    parallel.train(training_data, RasaNLUModelConfig())
+
+    message = Message("i want to fly to lisbon")
+    tokenizer.process(message)
+
+    assert parallel.extract_entities(message) == serial.extract_entities(message)
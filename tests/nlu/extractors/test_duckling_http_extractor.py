@@ -225,3 +225,41 @@ def test_duckling_entity_extractor_and_synonyms(component_builder):
     # can handle entities that have int values
     synonyms.process(message)
     assert message is not None
+
+
+def test_duckling_entity_extractor_caches_and_batches_requests(component_builder):
+    _config = RasaNLUModelConfig({"pipeline": [{"name": "DucklingHTTPExtractor"}]})
+    _config.set_component_attr(
+        0, dimensions=["number"], url="http://localhost:8000", cache_ttl=60
+    )
+    duckling = component_builder.create_component(_config.for_component(0), _config)
+
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            responses.POST,
+            "http://localhost:8000/parse",
+            json=[
+                {
+                    "body": "5",
+                    "start": 21,
+                    "value": {"value": 5, "type": "value"},
+                    "end": 22,
+                    "dim": "number",
+                    "latent": False,
+                }
+            ],
+        )
+
+        messages = [
+            Message("Yesterday there were 5 people in a room", time="1381536182"),
+            Message("Yesterday there were 5 people in a room", time="1381536182"),
+            Message("Today there are 5 people in the room", time="1381536182"),
+        ]
+        duckling.process_batch(messages)
+        # identical texts with the same reference time are cached
+        message = Message("Today there are 5 people in the room", time="1381536182")
+        duckling.process(message)
+
+        assert len(rsps.calls) == 2
+        for message in messages + [message]:
+            assert [e["value"] for e in message.get("entities")] == [5]
@@ -26,3 +26,69 @@ def test_convert_featurizer(mitie_feature_extractor, default_config):
     expected = np.array([1.0251294, -0.04053932, -0.7018805, -0.82054937, -0.75054353])
 
     assert np.allclose(vecs[:5], expected, atol=1e-5)
+
+
+def test_convert_featurizer_caches_embeddings():
+    from rasa.nlu.featurizers.dense_featurizer.convert_featurizer import (
+        ConveRTFeaturizer,
+    )
+
+    featurizer = ConveRTFeaturizer.create(
+        {"name": "ConveRTFeaturizer", "cache_size": 2}, RasaNLUModelConfig()
+    )
+
+    texts = ["hello", "hello", "how are you", "bye"]
+    embeddings = featurizer._embed(texts)
+
+    assert np.allclose(embeddings[0], embeddings[1])
+    assert np.allclose(embeddings, featurizer._run_model_on_text(texts), atol=1e-5)
+    # the least recently used text was evicted
+    assert list(featurizer._embedding_cache.keys()) == ["how are you", "bye"]
+
+    cached = featurizer._embed(["bye"])
+    assert np.allclose(cached[0], embeddings[3])
+    assert list(featurizer._embedding_cache.keys()) == ["how are you", "bye"]
+
+
+def test_convert_featurizer_embedding_cache_is_thread_safe(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    from rasa.nlu.featurizers.dense_featurizer.convert_featurizer import (
+        ConveRTFeaturizer,
+    )
+
+    featurizer = ConveRTFeaturizer.create(
+        {"name": "ConveRTFeaturizer", "cache_size": 3}, RasaNLUModelConfig()
+    )
+    monkeypatch.setattr(
+        featurizer,
+        "_run_model_on_text",
+        lambda batch: np.array([[float(len(text))] for text in batch]),
+    )
+
+    def embed(index: int) -> np.ndarray:
+        texts = ["a" * (index % 5 + 1), "b" * (index % 7 + 1)]
+        return featurizer._embed(texts)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(embed, range(200)))
+
+    # cached texts are evicted concurrently without raising a `KeyError`
+    for index, embeddings in enumerate(results):
+        assert embeddings.tolist() == [[index % 5 + 1], [index % 7 + 1]]
+    assert len(featurizer._embedding_cache) <= 3
+
+
+def test_convert_featurizer_creates_session_on_first_use():
+    from rasa.nlu.featurizers.dense_featurizer.convert_featurizer import (
+        ConveRTFeaturizer,
+    )
+
+    featurizer = ConveRTFeaturizer.create(
+        {"name": "ConveRTFeaturizer"}, RasaNLUModelConfig()
+    )
+    # nothing TensorFlow related exists before the featurizer is used
+    assert featurizer.session is None
+
+    featurizer._run_model_on_text(["hello"])
+
+    assert featurizer.session is not None
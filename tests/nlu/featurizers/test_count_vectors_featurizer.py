@@ -369,3 +369,95 @@ def test_count_vector_featurizer_persist_load(tmpdir):
             train_message2.get("text_features") == test_message2.get("text_features"),
         ]
     )
+
+
+def test_count_vector_featurizer_lazy_load(tmpdir):
+    from rasa.nlu.featurizers.sparse_featurizer.count_vectors_featurizer import (
+        CountVectorsFeaturizer,
+    )
+
+    train_ftr = CountVectorsFeaturizer({"return_sequence": True})
+    train_message = Message("hello hello world")
+    train_message.set("intent", "greet")
+    train_ftr.train(TrainingData([train_message]))
+
+    file_dict = train_ftr.persist("ftr", tmpdir.strpath)
+    meta = train_ftr.component_config.copy()
+    meta.update(file_dict)
+
+    test_ftr = CountVectorsFeaturizer.load(meta, tmpdir.strpath, lazy_load=True)
+    # the vocabulary is only read on first use
+    assert test_ftr.vectorizers is None
+
+    test_message = Message("hello world")
+    test_ftr.process(test_message)
+
+    assert test_ftr.vectorizers is not None
+    assert (
+        test_ftr.vectorizers["text"].vocabulary
+        == train_ftr.vectorizers["text"].vocabulary_
+    )
+    assert test_message.get("text_sparse_features").shape == (2, 2)
+
+
+def test_count_vector_featurizer_lazy_load_from_multiple_threads(tmpdir):
+    from concurrent.futures import ThreadPoolExecutor
+    from rasa.nlu.featurizers.sparse_featurizer.count_vectors_featurizer import (
+        CountVectorsFeaturizer,
+    )
+
+    train_ftr = CountVectorsFeaturizer({"return_sequence": True})
+    train_message = Message("hello hello world")
+    train_message.set("intent", "greet")
+    train_ftr.train(TrainingData([train_message]))
+
+    file_dict = train_ftr.persist("ftr", tmpdir.strpath)
+    meta = train_ftr.component_config.copy()
+    meta.update(file_dict)
+
+    test_ftr = CountVectorsFeaturizer.load(meta, tmpdir.strpath, lazy_load=True)
+
+    def featurize(_) -> scipy.sparse.spmatrix:
+        message = Message("hello world")
+        test_ftr.process(message)
+        return message.get("text_sparse_features")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        features = list(executor.map(featurize, range(32)))
+
+    # no thread runs without the vocabulary while another one reads it
+    assert all(f is not None and f.shape == (2, 2) for f in features)
+
+
+@pytest.mark.parametrize("return_sequence", [True, False])
+def test_count_vector_featurizer_process_batch(return_sequence):
+    from rasa.nlu.featurizers.sparse_featurizer.count_vectors_featurizer import (
+        CountVectorsFeaturizer,
+    )
+
+    sentences = ["hello hello bye", "a b c d e f", "hello there", "1 2 three"]
+
+    ftr = CountVectorsFeaturizer(
+        {"token_pattern": r"(?u)\b\w+\b", "return_sequence": return_sequence}
+    )
+    train_messages = [Message(sentence) for sentence in sentences]
+    for message in train_messages:
+        # this is needed for a valid training example
+        message.set("intent", "bla")
+    ftr.train(TrainingData(train_messages))
+
+    batch_messages = [Message(sentence) for sentence in sentences]
+    ftr.process_batch(batch_messages)
+
+    for sentence, batch_message, train_message in zip(
+        sentences, batch_messages, train_messages
+    ):
+        single_message = Message(sentence)
+        ftr.process(single_message)
+
+        batch_features = batch_message.get("text_sparse_features").toarray()
+        single_features = single_message.get("text_sparse_features").toarray()
+        train_features = train_message.get("text_sparse_features").toarray()
+
+        assert np.all(batch_features == single_features)
+        assert np.all(batch_features == train_features)
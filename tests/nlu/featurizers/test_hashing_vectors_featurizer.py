@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+import scipy.sparse
+
+from rasa.nlu.featurizers.sparse_featurizer.hashing_vectors_featurizer import (
+    HashingVectorsFeaturizer,
+    _char_wb_ngrams,
+    _word_ngrams,
+)
+from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
+from rasa.nlu.training_data import Message
+from rasa.nlu.training_data import TrainingData
+
+
+@pytest.mark.parametrize(
+    "tokens, min_ngram, max_ngram, expected",
+    [
+        (["hello", "there"], 1, 1, ["hello", "there"]),
+        (["a", "b", "c"], 1, 2, ["a", "b", "c", "a b", "b c"]),
+        (["a", "b"], 3, 3, []),
+    ],
+)
+def test_word_ngrams(tokens, min_ngram, max_ngram, expected):
+    assert list(_word_ngrams(tokens, min_ngram, max_ngram)) == expected
+
+
+@pytest.mark.parametrize(
+    "text, min_ngram, max_ngram",
+    [("hello you", 2, 4), ("a hi", 4, 6), ("a hello", 3, 5), ("hi", 1, 1)],
+)
+def test_char_wb_ngrams_match_sklearn(text, min_ngram, max_ngram):
+    from sklearn.feature_extraction.text import CountVectorizer
+
+    analyzer = CountVectorizer(
+        analyzer="char_wb", ngram_range=(min_ngram, max_ngram)
+    ).build_analyzer()
+
+    assert sorted(_char_wb_ngrams(text.split(), min_ngram, max_ngram)) == sorted(
+        analyzer(text)
+    )
+
+
+@pytest.mark.parametrize(
+    "sentence, expected_counts",
+    [
+        ("hello hello hello hello hello", [5]),
+        ("hello goodbye hello", [1, 2]),
+        ("a 1 2", [1, 2]),
+    ],
+)
+def test_hashing_vectors_featurizer_no_sequence(sentence, expected_counts):
+    ftr = HashingVectorsFeaturizer({"n_features": 1024})
+
+    train_message = Message(sentence)
+    # this is needed for a valid training example
+    train_message.set("intent", "bla")
+    data = TrainingData([train_message])
+    WhitespaceTokenizer().train(data)
+    ftr.train(data)
+
+    test_message = Message(sentence)
+    WhitespaceTokenizer().process(test_message)
+    ftr.process(test_message)
+
+    features = test_message.get("text_sparse_features")
+    assert isinstance(features, scipy.sparse.coo_matrix)
+    assert features.shape == (1, 1024)
+    assert sorted(features.data) == expected_counts
+
+    # training and prediction features are identical without any fitting
+    assert np.all(
+        train_message.get("text_sparse_features").toarray() == features.toarray()
+    )
+    assert train_message.get("intent_sparse_features").shape == (1, 1024)
+
+
+def test_hashing_vectors_featurizer_sequence():
+    ftr = HashingVectorsFeaturizer(
+        {
+            "n_features": 512,
+            "analyzer": "char_wb",
+            "max_ngram": 3,
+            "return_sequence": True,
+        }
+    )
+
+    messages = [Message("hello there"), Message("hi")]
+    for message in messages:
+        WhitespaceTokenizer().process(message)
+
+    ftr.process_batch(messages)
+
+    assert messages[0].get("text_sparse_features").shape == (2, 512)
+    assert messages[1].get("text_sparse_features").shape == (1, 512)
+
+    single_message = Message("hi")
+    WhitespaceTokenizer().process(single_message)
+    ftr.process(single_message)
+
+    assert np.all(
+        single_message.get("text_sparse_features").toarray()
+        == messages[1].get("text_sparse_features").toarray()
+    )
+
+
+def test_hashing_vectors_featurizer_unknown_analyzer():
+    with pytest.raises(ValueError):
+        HashingVectorsFeaturizer({"analyzer": "unknown"})
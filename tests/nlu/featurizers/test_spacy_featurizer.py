@@ -44,6 +44,22 @@ def test_spacy_training_sample_alignment(spacy_nlp_component):
     ]
 
 
+def test_spacy_process_batch(spacy_nlp_component):
+    texts = ["I have a feeling", "", "I am the last message"]
+    single = [Message(text) for text in texts]
+    batch = [Message(text) for text in texts]
+
+    for message in single:
+        spacy_nlp_component.process(message)
+    spacy_nlp_component.process_batch(batch)
+
+    for expected, actual in zip(single, batch):
+        assert [t.text for t in actual.get("spacy_doc")] == [
+            t.text for t in expected.get("spacy_doc")
+        ]
+        assert not actual.get("spacy_doc").ents
+
+
 def test_spacy_intent_featurizer(spacy_nlp_component):
     from rasa.nlu.featurizers.dense_featurizer.spacy_featurizer import SpacyFeaturizer
 